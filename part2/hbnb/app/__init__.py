@@ -5,8 +5,15 @@ from flask import Flask
 from flask_restx import Api
 
 
-def create_app():
+def create_app(config_class="config.DevelopmentConfig"):
     app = Flask(__name__)
+    app.config.from_object(config_class)
+
+    from app.models.ids import configure_id_generator
+    configure_id_generator(app)
+
+    from app.services.events import events
+    events.init_app(app)
 
     api = Api(
         app,
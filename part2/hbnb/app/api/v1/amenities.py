@@ -4,6 +4,7 @@
 from flask_restx import Namespace, Resource, fields
 from flask import request
 from app.services import facade
+from app.api.v1.multiget import parse_ids, multi_get_body
 
 api = Namespace("amenities", description="Amenity operations")
 
@@ -27,10 +28,18 @@ amenity_create_model = api.model("AmenityCreate", {
 class AmenityList(Resource):
     """Amenity collection resource"""
 
-    @api.doc("list_amenities")
+    @api.doc("list_amenities", params={"ids": "Comma-separated IDs to fetch (max 100)"})
     @api.response(200, "List of amenities retrieved successfully")
+    @api.response(400, "Invalid ids")
     def get(self):
         """Retrieve a list of all amenities"""
+        try:
+            ids = parse_ids()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        if ids is not None:
+            return multi_get_body(ids, facade.get_many_amenities(ids),
+                                  lambda a: a.to_dict()), 200
         amenities = facade.get_all_amenities()
         return [amenity.to_dict() for amenity in amenities], 200
 
@@ -1,8 +1,10 @@
 #!/usr/bin/python3
 """Place API endpoints - Task 4 + Task 5 updates"""
 
+from flask import request
 from flask_restx import Namespace, Resource, fields
 from app.services import facade
+from app.api.v1.multiget import parse_ids, multi_get_body
 
 api = Namespace("places", description="Place operations")
 
@@ -45,6 +47,17 @@ place_model = api.model("Place", {
     ),
 })
 
+def place_summary(p):
+    """List representation of a place."""
+    return {
+        "id": p.id,
+        "title": p.title,
+        "price": p.price,
+        "latitude": p.latitude,
+        "longitude": p.longitude,
+    }
+
+
 # ============= Endpoints =============
 
 @api.route("/")
@@ -86,20 +99,109 @@ class PlaceList(Resource):
 
         return place.to_dict(), 201
 
-    @api.doc("list_places")
+    @api.doc("list_places", params={
+        "amenities": "Comma-separated amenity IDs; only places having all of them",
+        "sort": "price, rating, created_at or reviews; prefix with - for descending",
+        "page": "Page number (1-based, default 1)",
+        "per_page": "Results per page (default 20, max 100)",
+        "ids": "Comma-separated IDs to fetch (max 100)",
+    })
     @api.response(200, "List of places retrieved successfully")
+    @api.response(400, "Invalid sort key or pagination")
     def get(self):
         """Retrieve a list of all places"""
-        places = facade.get_all_places()
-        return [
-            {
-                "id": p.id,
-                "title": p.title,
-                "latitude": p.latitude,
-                "longitude": p.longitude,
-            }
-            for p in places
-        ], 200
+        try:
+            ids = parse_ids()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        if ids is not None:
+            return multi_get_body(ids, facade.get_many_places(ids), place_summary), 200
+
+        amenity_ids = [a.strip() for a in request.args.get("amenities", "").split(",")
+                       if a.strip()]
+        headers = {}
+        if any(arg in request.args for arg in ("sort", "page", "per_page")):
+            try:
+                sort, page, per_page = parse_list_args()
+            except ValueError as e:
+                return {"error": str(e)}, 400
+            total, places = facade.list_places(sort, page, per_page, amenity_ids)
+            headers["X-Total-Count"] = str(total)
+        elif amenity_ids:
+            places = facade.get_places_with_amenities(amenity_ids)
+        else:
+            places = facade.get_all_places()
+        return [place_summary(p) for p in places], 200, headers
+
+
+@api.route("/search")
+class PlaceSearch(Resource):
+    """Full-text search over place titles and descriptions"""
+
+    @api.doc("search_places", params={
+        "q": "Search terms; space = AND, 'OR' separates alternatives",
+        "limit": "Maximum results (default 20, max 100)",
+        "offset": "Results to skip",
+    })
+    @api.response(200, "Ranked search results")
+    @api.response(400, "Invalid query")
+    def get(self):
+        """Search places, best match first"""
+        try:
+            query, limit, offset = parse_search_args()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        total, hits = facade.search_places(query, limit, offset)
+        return {
+            "total": total,
+            "results": [
+                {
+                    "id": p.id,
+                    "title": p.title,
+                    "price": p.price,
+                    "score": round(score, 4),
+                }
+                for p, score in hits
+            ],
+        }, 200
+
+
+SORT_KEYS = ("price", "rating", "created_at", "reviews")
+
+
+def parse_list_args():
+    """Read sort/page/per_page from the query string."""
+    sort = request.args.get("sort", "").strip() or None
+    if sort is not None:
+        descending = sort.startswith("-")
+        key = sort.lstrip("-")
+        if key not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {key} (allowed: {', '.join(SORT_KEYS)})")
+        sort = (key, descending)
+    try:
+        page = int(request.args.get("page", 1))
+        per_page = int(request.args.get("per_page", 20))
+    except ValueError:
+        raise ValueError("page and per_page must be integers")
+    if page < 1 or per_page < 1:
+        raise ValueError("page and per_page must be positive")
+    return sort, page, min(per_page, 100)
+
+
+def parse_search_args():
+    """Read q/limit/offset from the query string."""
+    query = request.args.get("q", "").strip()
+    if not query:
+        raise ValueError("q is required")
+    try:
+        limit = int(request.args.get("limit", 20))
+        offset = int(request.args.get("offset", 0))
+    except ValueError:
+        raise ValueError("limit and offset must be integers")
+    if limit < 1 or offset < 0:
+        raise ValueError("limit must be positive and offset non-negative")
+    return query, min(limit, 100), offset
 
 
 @api.route("/<place_id>")
@@ -4,6 +4,8 @@
 
 from flask_restx import Namespace, Resource, fields
 from app.services import facade
+from app.api.v1.places import parse_search_args
+from app.api.v1.multiget import parse_ids, multi_get_body
 
 api = Namespace("reviews", description="Review operations")
 
@@ -21,6 +23,15 @@ review_update_model = api.model("ReviewUpdate", {
     "rating": fields.Integer(required=True, description="Rating of the place (1-5)"),
 })
 
+def review_summary(r):
+    """List representation of a review."""
+    return {
+        "id": r.id,
+        "text": r.text,
+        "rating": r.rating,
+    }
+
+
 # ============= Endpoints =============
 
 @api.route("/")
@@ -76,15 +87,48 @@ class ReviewList(Resource):
     @api.response(200, "List of reviews retrieved successfully")
     def get(self):
         """Retrieve a list of all reviews"""
+        try:
+            ids = parse_ids()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        if ids is not None:
+            return multi_get_body(ids, facade.get_many_reviews(ids), review_summary), 200
         reviews = facade.get_all_reviews()
-        return [
-            {
-                "id": r.id,
-                "text": r.text,
-                "rating": r.rating,
-            }
-            for r in reviews
-        ], 200
+        return [review_summary(r) for r in reviews], 200
+
+
+@api.route("/search")
+class ReviewSearch(Resource):
+    """Full-text search over review text"""
+
+    @api.doc("search_reviews", params={
+        "q": "Search terms; space = AND, 'OR' separates alternatives",
+        "limit": "Maximum results (default 20, max 100)",
+        "offset": "Results to skip",
+    })
+    @api.response(200, "Ranked search results")
+    @api.response(400, "Invalid query")
+    def get(self):
+        """Search reviews, best match first"""
+        try:
+            query, limit, offset = parse_search_args()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        total, hits = facade.search_reviews(query, limit, offset)
+        return {
+            "total": total,
+            "results": [
+                {
+                    "id": r.id,
+                    "text": r.text,
+                    "rating": r.rating,
+                    "place_id": r.place.id,
+                    "score": round(score, 4),
+                }
+                for r, score in hits
+            ],
+        }, 200
 
 
 @api.route("/<review_id>")
@@ -1,5 +1,6 @@
 from flask_restx import Namespace, Resource, fields
 from app.services import facade
+from app.api.v1.multiget import parse_ids, multi_get_body
 
 api = Namespace("users", description="User operations")
 
@@ -43,9 +44,17 @@ class UserList(Resource):
 
         return user_to_dict(new_user), 201
 
+    @api.doc(params={"ids": "Comma-separated IDs to fetch (max 100)"})
     @api.response(200, "List of users retrieved successfully")
+    @api.response(400, "Invalid ids")
     def get(self):
         """Retrieve a list of users"""
+        try:
+            ids = parse_ids()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        if ids is not None:
+            return multi_get_body(ids, facade.get_many_users(ids), user_to_dict), 200
         users = facade.get_users()
         return [user_to_dict(u) for u in users], 200
 
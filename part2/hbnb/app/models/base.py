@@ -3,17 +3,18 @@
  
 from __future__ import annotations
 
-import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+from .ids import new_id
+
 
 class BaseModel:
     """
     Base class for all HBnB entities.
     
     Provides:
-    - id: UUID4 string (unique identifier)
+    - id: UUID string from the configured generator (see ids.py)
     - created_at: UTC datetime of creation
     - updated_at: UTC datetime of last update
     - save(): Update timestamp
@@ -26,7 +27,7 @@ class BaseModel:
         """Initialize BaseModel with UUID and timestamps."""
         now = datetime.now(timezone.utc)
 
-        self._id: str = kwargs.get("id", str(uuid.uuid4()))
+        self._id: str = kwargs.get("id") or new_id()
         self._created_at: datetime = kwargs.get("created_at", now)
         self._updated_at: datetime = kwargs.get("updated_at", now)
 
@@ -35,6 +35,8 @@ class Place(BaseModel):
         self.owner = owner
         self._reviews: List[Review] = []
         self._amenities: List[Amenity] = []
+        # callbacks(place, amenity, added) run by add_amenity/remove_amenity
+        self._amenity_listeners: List = []
 
         if owner:
             owner.add_place(self)
@@ -134,11 +136,17 @@ class Place(BaseModel):
             self._reviews.append(review)
             self.save()
 
+    def remove_review(self, review: Review):
+        if review in self._reviews:
+            self._reviews.remove(review)
+            self.save()
+
     def add_amenity(self, amenity: Amenity):
         if amenity not in self._amenities:
             self._amenities.append(amenity)
             self.save()
             amenity.add_place(self)
+            self._notify_amenity_change(amenity, True)
 
     def remove_amenity(self, amenity: Amenity):
         """Remove amenity from place (اختياري لكن موجود في كودك)"""
@@ -146,6 +154,15 @@ class Place(BaseModel):
             self._amenities.remove(amenity)
             self.save()
             amenity.remove_place(self)
+            self._notify_amenity_change(amenity, False)
+
+    def add_amenity_listener(self, callback):
+        """Register callback(place, amenity, added) for this place's amenity changes."""
+        self._amenity_listeners.append(callback)
+
+    def _notify_amenity_change(self, amenity: Amenity, added: bool):
+        for callback in self._amenity_listeners:
+            callback(self, amenity, added)
 
     # ============= Business Methods =============
 
@@ -10,6 +10,10 @@ class Repository(ABC):
     def get(self, obj_id):
         pass
 
+    @abstractmethod
+    def get_many(self, ids):
+        pass
+
     @abstractmethod
     def get_all(self):
         pass
@@ -37,6 +41,11 @@ class InMemoryRepository(Repository):
     def get(self, obj_id):
         return self._storage.get(obj_id)
 
+    def get_many(self, ids):
+        """Objects for ``ids`` in request order, None where an id is unknown."""
+        found = {obj_id: self._storage.get(obj_id) for obj_id in ids}
+        return [found[obj_id] for obj_id in ids]
+
     def get_all(self):
         return list(self._storage.values())
 
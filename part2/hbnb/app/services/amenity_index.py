@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""
+Per-amenity place bitmaps for amenity filter queries.
+
+Every place gets a dense ordinal; each amenity keeps a Python int whose
+bit ``n`` is set when the place with ordinal ``n`` has that amenity, so
+"WiFi AND Pool AND Parking" is two big-int ANDs plus decoding the
+surviving bits. The facade keeps it current through
+Place.add_amenity/remove_amenity listeners.
+"""
+
+_BYTE_BITS = [tuple(i for i in range(8) if byte >> i & 1) for byte in range(256)]
+
+
+def bit_positions(bitmap):
+    """Positions of the set bits of ``bitmap``, ascending."""
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    return [(index << 3) + bit
+            for index, byte in enumerate(data) if byte
+            for bit in _BYTE_BITS[byte]]
+
+
+class AmenityBitmaps:
+    """Place ordinals and one bitmap per amenity."""
+
+    def __init__(self):
+        self._ordinals = {}     # place_id -> ordinal
+        self._place_ids = []    # ordinal -> place_id
+        self._bitmaps = {}      # amenity_id -> int
+
+    def _ordinal(self, place_id):
+        ordinal = self._ordinals.get(place_id)
+        if ordinal is None:
+            ordinal = self._ordinals[place_id] = len(self._place_ids)
+            self._place_ids.append(place_id)
+        return ordinal
+
+    def add(self, place_id, amenity_id):
+        bit = 1 << self._ordinal(place_id)
+        self._bitmaps[amenity_id] = self._bitmaps.get(amenity_id, 0) | bit
+
+    def discard(self, place_id, amenity_id):
+        ordinal = self._ordinals.get(place_id)
+        if ordinal is not None and amenity_id in self._bitmaps:
+            self._bitmaps[amenity_id] &= ~(1 << ordinal)
+
+    def on_amenity_change(self, place, amenity, added):
+        """Place listener: mirror add_amenity/remove_amenity."""
+        if added:
+            self.add(place.id, amenity.id)
+        else:
+            self.discard(place.id, amenity.id)
+
+    def match_all(self, amenity_ids):
+        """Ids of the places that have every amenity in ``amenity_ids``."""
+        if not amenity_ids:
+            return []
+        bitmaps = sorted((self._bitmaps.get(a, 0) for a in amenity_ids), key=int.bit_count)
+        result = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            if not result:
+                break
+            result &= bitmap
+        place_ids = self._place_ids
+        return [place_ids[n] for n in bit_positions(result)]
@@ -0,0 +1,213 @@
+#!/usr/bin/python3
+"""
+In-process change events emitted by the facade.
+
+Every facade create, update and delete publishes an ``EntityEvent``
+after the repository write. Inside a request the events are buffered on
+``g`` and delivered together when the request tears down; outside a
+request each publish is delivered at once.
+
+Subscribers receive a list of events, filtered to the entity types they
+asked for. Plain functions run in the publishing thread; ``async def``
+subscribers run on the bus's own event loop thread. A failing subscriber
+is logged and does not affect the others. ``delivery_stats()`` reports
+publish-to-delivered latency per subscriber.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+
+from flask import g, has_request_context
+
+logger = logging.getLogger(__name__)
+
+ENTITIES = ("user", "place", "review", "amenity")
+ACTIONS = ("created", "updated", "deleted")
+
+
+class EntityEvent:
+    """One stored change: ``entity`` ``action`` on ``entity_id``."""
+
+    __slots__ = ("entity", "action", "entity_id", "fields", "published_at")
+
+    def __init__(self, entity, action, entity_id, fields=()):
+        if entity not in ENTITIES:
+            raise ValueError(f"Unknown entity: {entity}")
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+        self.entity = entity
+        self.action = action
+        self.entity_id = entity_id
+        self.fields = tuple(fields)  # changed fields, for updates
+        self.published_at = time.perf_counter()
+
+    @property
+    def type(self):
+        return f"{self.entity}.{self.action}"
+
+    def __repr__(self):
+        return f"<EntityEvent {self.type} {self.entity_id}>"
+
+
+class _Subscription:
+    __slots__ = ("handler", "name", "entities", "is_async")
+
+    def __init__(self, handler, name, entities):
+        self.handler = handler
+        self.name = name
+        self.entities = frozenset(entities) if entities else None
+        self.is_async = inspect.iscoroutinefunction(handler)
+
+    def select(self, events):
+        if self.entities is None:
+            return events
+        return [e for e in events if e.entity in self.entities]
+
+
+class EventBus:
+    """Publish/subscribe for EntityEvents; see the module docstring."""
+
+    def __init__(self):
+        self._subscriptions = []
+        self._lock = threading.Lock()
+        self._stats = {}        # subscriber -> [delivered, errors, total_s, max_s]
+        self._loop = None
+        self._pending = set()   # futures of async deliveries in flight
+
+    def init_app(self, app):
+        app.teardown_request(self._flush_request)
+
+    # ------------------ SUBSCRIBING ------------------
+    def subscribe(self, handler, entities=None, name=None):
+        """
+        Call handler(events) with each batch of events for ``entities``
+        (all entities when None); ``async def`` handlers run on the bus
+        loop. Returns the handler.
+        """
+        for entity in entities or ():
+            if entity not in ENTITIES:
+                raise ValueError(f"Unknown entity: {entity}")
+        name = name or getattr(handler, "__qualname__", repr(handler))
+        with self._lock:
+            self._subscriptions.append(_Subscription(handler, name, entities))
+        return handler
+
+    def unsubscribe(self, handler):
+        with self._lock:
+            self._subscriptions = [s for s in self._subscriptions if s.handler != handler]
+
+    # ------------------ PUBLISHING ------------------
+    def publish(self, entity, action, entity_id, fields=()):
+        """Record a stored change; delivered now or at request teardown."""
+        event = EntityEvent(entity, action, entity_id, fields)
+        if has_request_context():
+            g.setdefault("_entity_events", []).append(event)
+        else:
+            self.deliver([event])
+        return event
+
+    def _flush_request(self, exc=None):
+        events = g.pop("_entity_events", None)
+        if events:
+            self.deliver(events)
+
+    def deliver(self, events):
+        """Hand one batch to every interested subscriber."""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for sub in subscriptions:
+            batch = sub.select(events)
+            if not batch:
+                continue
+            if sub.is_async:
+                self._schedule(sub, batch)
+                continue
+            try:
+                sub.handler(batch)
+            except Exception:
+                self._record(sub, batch, failed=True)
+            else:
+                self._record(sub, batch)
+
+    # ------------------ ASYNC SUBSCRIBERS ------------------
+    def _event_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="event-bus",
+                                 daemon=True).start()
+            return self._loop
+
+    def _schedule(self, sub, batch):
+        future = asyncio.run_coroutine_threadsafe(self._run_async(sub, batch),
+                                                  self._event_loop())
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+
+    async def _run_async(self, sub, batch):
+        try:
+            await sub.handler(batch)
+        except Exception:
+            self._record(sub, batch, failed=True)
+        else:
+            self._record(sub, batch)
+
+    def _forget(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def join(self, timeout=5.0):
+        """Wait for async deliveries in flight; True when none are left."""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                pending[0].result(remaining)
+            except Exception:
+                pass  # logged by _run_async; timeouts re-checked above
+
+    # ------------------ INSTRUMENTATION ------------------
+    def _record(self, sub, batch, failed=False):
+        if failed:
+            logger.exception("Event subscriber %s failed", sub.name)
+        now = time.perf_counter()
+        with self._lock:
+            stats = self._stats.setdefault(sub.name, [0, 0, 0.0, 0.0])
+            if failed:
+                stats[1] += 1
+                return
+            for event in batch:
+                elapsed = now - event.published_at
+                stats[0] += 1
+                stats[2] += elapsed
+                stats[3] = max(stats[3], elapsed)
+
+    def delivery_stats(self):
+        """Per subscriber: events delivered, failed batches, mean/max latency (ms)."""
+        with self._lock:
+            return {
+                name: {
+                    "delivered": delivered,
+                    "errors": errors,
+                    "mean_ms": total / delivered * 1000 if delivered else 0.0,
+                    "max_ms": worst * 1000,
+                }
+                for name, (delivered, errors, total, worst) in self._stats.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+events = EventBus()
@@ -5,6 +5,10 @@ from app.models.user import User
 from app.models.amenity import Amenity
 from app.models.place import Place
 from app.models.review import Review
+from app.services.text_index import InvertedIndex
+from app.services.amenity_index import AmenityBitmaps
+from app.services.sorted_index import SortedIndex
+from app.services.events import events
 
 
 class HBnBFacade:
@@ -13,6 +17,15 @@ class HBnBFacade:
         self.amenity_repo = InMemoryRepository()
         self.place_repo = InMemoryRepository()
         self.review_repo = InMemoryRepository()
+        self.place_index = InvertedIndex({"title": 3, "description": 1})
+        self.review_index = InvertedIndex({"text": 1})
+        self.amenity_index = AmenityBitmaps()
+        self.place_sort_indexes = {
+            "price": SortedIndex(lambda p: p.price),
+            "created_at": SortedIndex(lambda p: p.created_at),
+            "rating": SortedIndex(lambda p: p.get_average_rating()),
+            "reviews": SortedIndex(lambda p: len(p.reviews)),
+        }
 
     # ------------------ HELPERS ------------------
     @staticmethod
@@ -43,6 +56,11 @@ class HBnBFacade:
                 cleaned.append(x)
         return cleaned
 
+    def _index_place(self, place):
+        """Refresh place's entries in the sorted listing indexes."""
+        for index in self.place_sort_indexes.values():
+            index.update(place)
+
     def _resolve_amenities(self, amenities_ids: list) -> list:
         amenities = []
         for amenity_id in amenities_ids:
@@ -64,11 +82,15 @@ class HBnBFacade:
 
         user = User(**user_data)
         self.user_repo.add(user)
+        events.publish("user", "created", user.id)
         return user
 
     def get_user(self, user_id):
         return self.user_repo.get(user_id)
 
+    def get_many_users(self, ids):
+        return self.user_repo.get_many(ids)
+
     def get_user_by_email(self, email):
         return self.user_repo.get_by_attribute("email", email)
 
@@ -92,6 +114,7 @@ class HBnBFacade:
 
         user.save()
         self.user_repo.update(user_id, user)
+        events.publish("user", "updated", user_id, user_data)
         return user
 
     # ------------------ AMENITIES ------------------
@@ -104,11 +127,15 @@ class HBnBFacade:
             description=amenity_data.get("description", "")
         )
         self.amenity_repo.add(amenity)
+        events.publish("amenity", "created", amenity.id)
         return amenity
 
     def get_amenity(self, amenity_id):
         return self.amenity_repo.get(amenity_id)
 
+    def get_many_amenities(self, ids):
+        return self.amenity_repo.get_many(ids)
+
     def get_all_amenities(self):
         return self.amenity_repo.get_all()
 
@@ -127,6 +154,7 @@ class HBnBFacade:
 
         amenity.save()
         self.amenity_repo.update(amenity_id, amenity)
+        events.publish("amenity", "updated", amenity_id, amenity_data)
         return amenity
 
     # ------------------ PLACES ------------------
@@ -162,6 +190,7 @@ class HBnBFacade:
             longitude=place_data.get("longitude", 0.0),
             price=place_data.get("price", 0.0),
         )
+        place.add_amenity_listener(self.amenity_index.on_amenity_change)
 
         for amenity in amenities:
             if hasattr(place, "add_amenity"):
@@ -170,14 +199,46 @@ class HBnBFacade:
                 place.amenities.append(amenity)
 
         self.place_repo.add(place)
+        self.place_index.add(place)
+        self._index_place(place)
+        events.publish("place", "created", place.id)
         return place
 
     def get_place(self, place_id):
         return self.place_repo.get(place_id)
 
+    def get_many_places(self, ids):
+        return self.place_repo.get_many(ids)
+
     def get_all_places(self):
         return self.place_repo.get_all()
 
+    def list_places(self, sort=None, page=1, per_page=20, amenity_ids=None):
+        """
+        One page of places -> (total, places).
+
+        sort is (key, descending) with key in place_sort_indexes, served
+        from the maintained index; without it, repository order is kept.
+        """
+        include = set(self.amenity_index.match_all(amenity_ids)) if amenity_ids else None
+        offset = (page - 1) * per_page
+        if sort is not None:
+            key, descending = sort
+            index = self.place_sort_indexes[key]
+            total = len(index) if include is None else len(include)
+            ids = index.ids(descending, offset, per_page, include)
+            return total, [self.place_repo.get(i) for i in ids]
+
+        places = self.place_repo.get_all()
+        if include is not None:
+            places = [p for p in places if p.id in include]
+        return len(places), places[offset:offset + per_page]
+
+    def get_places_with_amenities(self, amenity_ids):
+        """Places having every amenity in amenity_ids (bitmap intersection)."""
+        places = (self.place_repo.get(pid) for pid in self.amenity_index.match_all(amenity_ids))
+        return [p for p in places if p is not None]
+
     def update_place(self, place_id, place_data):
         place = self.place_repo.get(place_id)
         if not place:
@@ -197,8 +258,8 @@ class HBnBFacade:
                     amenity_ids.append(item)
 
         if amenity_ids is not None:
-            if hasattr(place, "amenities"):
-                place.amenities = []
+            for amenity in place.amenities:
+                place.remove_amenity(amenity)
             for amenity_id in amenity_ids:
                 amenity = self.get_amenity(amenity_id)
                 if not amenity:
@@ -210,6 +271,9 @@ class HBnBFacade:
 
         place.save()
         self.place_repo.update(place_id, place)
+        self.place_index.update(place)
+        self._index_place(place)
+        events.publish("place", "updated", place_id, place_data)
         return place
 
     # ------------------ REVIEWS ------------------
@@ -243,11 +307,17 @@ class HBnBFacade:
             place=place
         )
         self.review_repo.add(review)
+        self.review_index.add(review)
+        self._index_place(place)
+        events.publish("review", "created", review.id)
         return review
 
     def get_review(self, review_id):
         return self.review_repo.get(review_id)
 
+    def get_many_reviews(self, ids):
+        return self.review_repo.get_many(ids)
+
     def get_all_reviews(self):
         return self.review_repo.get_all()
 
@@ -278,6 +348,9 @@ class HBnBFacade:
 
         review.save()
         self.review_repo.update(review_id, review)
+        self.review_index.update(review)
+        self._index_place(review.place)
+        events.publish("review", "updated", review_id, review_data)
         return review
 
     def delete_review(self, review_id):
@@ -285,6 +358,10 @@ class HBnBFacade:
         if not review:
             return False
         self.review_repo.delete(review_id)
+        self.review_index.remove(review_id)
+        review.place.remove_review(review)
+        self._index_place(review.place)
+        events.publish("review", "deleted", review_id)
         return True
 
     def get_review_by_user_and_place(self, user_id, place_id):
@@ -296,3 +373,25 @@ class HBnBFacade:
                 print(f"✅ Found duplicate review: {review.id}")  # print واحد فقط
                 return review
         return None
+
+    # ------------------ SEARCH ------------------
+    def search_places(self, query, limit=20, offset=0):
+        """Ranked text search over place title/description -> (total, [(place, score)])."""
+        total, hits = self.place_index.search(query, limit, offset)
+        return total, [(self.place_repo.get(doc_id), score) for doc_id, score in hits]
+
+    def search_reviews(self, query, limit=20, offset=0):
+        """Ranked text search over review text -> (total, [(review, score)])."""
+        total, hits = self.review_index.search(query, limit, offset)
+        return total, [(self.review_repo.get(doc_id), score) for doc_id, score in hits]
+
+    def search_index_stats(self):
+        """Size and memory usage of the text indexes."""
+        return {
+            "places": self.place_index.memory_usage(),
+            "reviews": self.review_index.memory_usage(),
+        }
+
+    def event_stats(self):
+        """Delivery latency of change events, per subscriber."""
+        return events.delivery_stats()
@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+"""
+Maintained sorted indexes for ordered, paginated listings.
+
+Each SortedIndex keeps (key, id) pairs in a list ordered with bisect, so
+a page of the listing is a slice instead of a sort of every object.
+Updates are O(log n) to locate plus a list insert/delete.
+"""
+
+from bisect import bisect_left, insort
+
+
+class SortedIndex:
+    """(key, id) pairs kept in ascending order; ties broken by id."""
+
+    def __init__(self, key_fn):
+        self.key_fn = key_fn
+        self._entries = []
+        self._keys = {}     # id -> key currently stored
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, obj_id):
+        """Key currently stored for ``obj_id`` (None if not indexed)."""
+        return self._keys.get(obj_id)
+
+    def add(self, obj):
+        """Insert ``obj``, or move it if its key changed."""
+        key = self.key_fn(obj)
+        old = self._keys.get(obj.id)
+        if old is not None:
+            if old == key:
+                return
+            self.remove(obj.id)
+        self._keys[obj.id] = key
+        insort(self._entries, (key, obj.id))
+
+    update = add
+
+    def remove(self, obj_id):
+        key = self._keys.pop(obj_id, None)
+        if key is None:
+            return
+        i = bisect_left(self._entries, (key, obj_id))
+        del self._entries[i]
+
+    def ids(self, descending=False, offset=0, limit=None, include=None):
+        """
+        Ids in key order.
+
+        Args:
+            include: optional set of ids; others are skipped (e.g. an
+                amenity filter), and offset/limit apply after filtering.
+        """
+        if include is None:
+            n = len(self._entries)
+            stop = n if limit is None else min(offset + limit, n)
+            if descending:
+                page = self._entries[max(n - stop, 0):max(n - offset, 0)][::-1]
+            else:
+                page = self._entries[offset:stop]
+            return [obj_id for _, obj_id in page]
+
+        result, skipped = [], 0
+        for _, obj_id in (reversed(self._entries) if descending else self._entries):
+            if obj_id not in include:
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            result.append(obj_id)
+            if limit is not None and len(result) >= limit:
+                break
+        return result
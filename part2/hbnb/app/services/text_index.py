@@ -0,0 +1,190 @@
+#!/usr/bin/python3
+"""
+In-memory inverted text index with BM25 ranking.
+
+Used by the facade to search places (title, description) and reviews
+(text) without scanning every object in the InMemoryRepository. The
+index is updated incrementally: add/update/remove re-tokenize a single
+document and only touch that document's postings.
+"""
+
+import math
+import re
+import sys
+from collections import Counter
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text):
+    """Lower-cased word tokens of ``text``."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def parse_query(query):
+    """
+    Parse a query into OR-groups of AND-ed terms.
+
+    Terms separated by spaces (or ``AND``) must all match; ``OR`` splits
+    alternatives, with lower precedence than AND:
+
+        "pool garden OR beach"  ->  [["pool", "garden"], ["beach"]]
+    """
+    groups, current = [], []
+    for word in (query or "").split():
+        if word == "OR":
+            if current:
+                groups.append(current)
+            current = []
+        elif word != "AND":
+            current.extend(tokenize(word))
+    if current:
+        groups.append(current)
+    return groups
+
+
+class InvertedIndex:
+    """
+    Term -> {doc_id: weighted term frequency} postings with BM25 scoring.
+
+    Args:
+        fields: mapping of attribute name to weight; a term in a field of
+            weight 3 counts as three occurrences (a simple BM25F).
+        k1, b: BM25 parameters.
+    """
+
+    def __init__(self, fields, k1=1.2, b=0.75):
+        self.fields = dict(fields)
+        self.k1 = k1
+        self.b = b
+        self._postings = {}
+        self._doc_terms = {}
+        self._doc_lengths = {}
+        self._total_length = 0
+
+    def __len__(self):
+        return len(self._doc_lengths)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._doc_lengths
+
+    # ==================== Updates ====================
+
+    def add(self, obj):
+        """Index ``obj`` (re-indexing it if already present)."""
+        self.remove(obj.id)
+        freqs = Counter()
+        for field, weight in self.fields.items():
+            for token in tokenize(getattr(obj, field, "")):
+                freqs[token] += weight
+        length = sum(freqs.values())
+
+        for term, tf in freqs.items():
+            self._postings.setdefault(term, {})[obj.id] = tf
+        self._doc_terms[obj.id] = tuple(freqs)
+        self._doc_lengths[obj.id] = length
+        self._total_length += length
+
+    update = add
+
+    def remove(self, doc_id):
+        """Drop ``doc_id`` from the index; unknown ids are ignored."""
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+
+    def clear(self):
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_lengths.clear()
+        self._total_length = 0
+
+    # ==================== Queries ====================
+
+    def search(self, query, limit=20, offset=0):
+        """
+        Ranked search.
+
+        Returns:
+            (total, hits): the number of matching documents and the
+            requested page of (doc_id, score) pairs, best first.
+        """
+        scores = {}
+        for group in parse_query(query):
+            matched = self._match_all(group)
+            for doc_id in matched:
+                score = self._score(doc_id, group)
+                if score > scores.get(doc_id, -1.0):
+                    scores[doc_id] = score
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return len(ranked), ranked[offset:offset + limit]
+
+    def _match_all(self, terms):
+        """Doc ids containing every term, intersecting the shortest lists first."""
+        postings = []
+        for term in set(terms):
+            docs = self._postings.get(term)
+            if not docs:
+                return set()
+            postings.append(docs)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for docs in postings[1:]:
+            result.intersection_update(docs)
+            if not result:
+                break
+        return result
+
+    def _score(self, doc_id, terms):
+        n_docs = len(self._doc_lengths)
+        avg_length = self._total_length / n_docs if n_docs else 0.0
+        norm = 1 - self.b + self.b * (self._doc_lengths[doc_id] / avg_length) if avg_length else 1.0
+        score = 0.0
+        for term in set(terms):
+            docs = self._postings[term]
+            idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            tf = docs[doc_id]
+            score += idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+        return score
+
+    # ==================== Introspection ====================
+
+    def memory_usage(self):
+        """
+        Approximate size of the index structures.
+
+        Counts the containers, keys and values owned by the index
+        (sys.getsizeof, shallow per object); doc id strings are shared
+        with the repositories but counted once here.
+        """
+        seen = set()
+
+        def size(obj):
+            if id(obj) in seen:
+                return 0
+            seen.add(id(obj))
+            return sys.getsizeof(obj)
+
+        total = size(self._postings) + size(self._doc_terms) + size(self._doc_lengths)
+        for term, docs in self._postings.items():
+            total += size(term) + size(docs)
+            for doc_id, tf in docs.items():
+                total += size(doc_id) + size(tf)
+        for terms in self._doc_terms.values():
+            total += size(terms)
+        for length in self._doc_lengths.values():
+            total += size(length)
+
+        return {
+            "documents": len(self._doc_lengths),
+            "terms": len(self._postings),
+            "postings": sum(len(docs) for docs in self._postings.values()),
+            "bytes": total,
+        }
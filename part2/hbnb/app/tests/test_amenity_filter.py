@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+"""Unit Tests for the amenity bitmap filter on GET /api/v1/places/"""
+
+import unittest
+import uuid
+
+from app import create_app
+from app.services.amenity_index import AmenityBitmaps, bit_positions
+from app.services.facade import HBnBFacade
+
+
+class TestAmenityBitmaps(unittest.TestCase):
+    """Test suite for AmenityBitmaps"""
+
+    def test_bit_positions(self):
+        self.assertEqual(bit_positions(0), [])
+        self.assertEqual(bit_positions(0b1010_0000_0001 | 1 << 70), [0, 9, 11, 70])
+
+    def test_match_all(self):
+        index = AmenityBitmaps()
+        for place_id, amenity_id in [("p1", "wifi"), ("p1", "pool"), ("p2", "wifi")]:
+            index.add(place_id, amenity_id)
+        self.assertEqual(index.match_all(["wifi"]), ["p1", "p2"])
+        self.assertEqual(index.match_all(["wifi", "pool"]), ["p1"])
+        index.discard("p1", "pool")
+        self.assertEqual(index.match_all(["pool"]), [])
+
+    def test_facades_keep_separate_indexes(self):
+        first, second = HBnBFacade(), HBnBFacade()
+        owner = first.create_user({"first_name": "Two", "last_name": "Facades",
+                                   "email": "two.facades@example.com", "password": "password123"})
+        wifi = first.create_amenity({"name": "WiFi"})
+        first.create_place({"title": "Only here", "price": 50.0, "latitude": 1.0,
+                            "longitude": 1.0, "owner_id": owner.id, "amenities": [wifi.id]})
+        self.assertEqual(len(first.amenity_index.match_all([wifi.id])), 1)
+        self.assertEqual(second.amenity_index.match_all([wifi.id]), [])
+
+
+class TestAmenityFilterEndpoint(unittest.TestCase):
+    """Test suite for GET /api/v1/places/?amenities="""
+
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+        owner = self.client.post('/api/v1/users/', json={
+            "first_name": "Filter", "last_name": "Owner",
+            "email": f"filter.{uuid.uuid4().hex[:8]}@example.com", "password": "password123"
+        }).get_json()
+        self.wifi = self.client.post('/api/v1/amenities/', json={"name": "WiFi"}).get_json()["id"]
+        self.pool = self.client.post('/api/v1/amenities/', json={"name": "Pool"}).get_json()["id"]
+
+        def place(title, amenities):
+            return self.client.post('/api/v1/places/', json={
+                "title": title, "price": 80.0, "latitude": 1.0, "longitude": 1.0,
+                "owner_id": owner["id"], "amenities": amenities
+            }).get_json()["id"]
+
+        self.both = place("Both", [self.wifi, self.pool])
+        self.wifi_only = place("WiFi only", [self.wifi])
+
+    def ids(self, *amenity_ids):
+        response = self.client.get(f'/api/v1/places/?amenities={",".join(amenity_ids)}')
+        self.assertEqual(response.status_code, 200)
+        return {p["id"] for p in response.get_json()}
+
+    def test_filter_intersects(self):
+        self.assertEqual(self.ids(self.wifi), {self.both, self.wifi_only})
+        self.assertEqual(self.ids(self.wifi, self.pool), {self.both})
+
+    def test_filter_follows_place_updates(self):
+        self.client.put(f'/api/v1/places/{self.both}', json={"amenities": [self.pool]})
+        self.assertEqual(self.ids(self.wifi), {self.wifi_only})
+        self.assertEqual(self.ids(self.pool), {self.both})
+
+
+if __name__ == "__main__":
+    unittest.main()
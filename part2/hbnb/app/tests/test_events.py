@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+"""Unit Tests for the change-event bus fed by the facade"""
+
+import threading
+import unittest
+import uuid
+
+from app import create_app
+from app.services import facade
+from app.services.events import events
+
+
+class TestEntityEvents(unittest.TestCase):
+    """Events published by facade writes, batched per request"""
+
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+        self.batches = []
+        events.reset()
+
+    def tearDown(self):
+        events.unsubscribe(self.batches.append)
+
+    def _user(self):
+        return facade.create_user({
+            "first_name": "Event", "last_name": "User",
+            "email": f"event.{uuid.uuid4().hex[:8]}@example.com", "password": "password123"
+        })
+
+    def test_facade_writes_publish_events(self):
+        events.subscribe(self.batches.append, entities=("place", "review"))
+        owner = self._user()
+        place = facade.create_place({"title": "Evented", "price": 10.0, "latitude": 1.0,
+                                     "longitude": 1.0, "owner_id": owner.id})
+        facade.update_place(place.id, {"price": 12.0})
+        review = facade.create_review({"text": "Nice", "rating": 5,
+                                       "user_id": owner.id, "place_id": place.id})
+        facade.delete_review(review.id)
+        self.assertEqual([[e.type for e in b] for b in self.batches],
+                         [["place.created"], ["place.updated"],
+                          ["review.created"], ["review.deleted"]])
+        self.assertEqual(self.batches[1][0].fields, ("price",))
+        self.assertEqual(facade.event_stats()["list.append"]["delivered"], 4)
+
+    def test_request_events_are_delivered_after_the_request(self):
+        owner = self._user()
+        events.subscribe(self.batches.append)
+        response = self.client.post('/api/v1/places/', json={
+            "title": "Batched", "price": 10.0, "latitude": 1.0, "longitude": 1.0,
+            "owner_id": owner.id
+        })
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([[(e.type, e.entity_id) for e in b] for b in self.batches],
+                         [[("place.created", response.get_json()["id"])]])
+
+    def test_async_subscriber(self):
+        received = threading.Event()
+
+        async def on_amenity(batch):
+            received.set()
+
+        events.subscribe(on_amenity, entities=("amenity",))
+        try:
+            self.client.post('/api/v1/amenities/', json={"name": "Async Sauna"})
+            self.assertTrue(events.join())
+            self.assertTrue(received.is_set())
+        finally:
+            events.unsubscribe(on_amenity)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+"""Unit Tests for the configurable entity id generator"""
+
+import unittest
+import uuid
+
+from app import create_app
+from app.models import ids
+from app.models.amenity import Amenity
+from config import DevelopmentConfig
+
+
+class Uuid7Config(DevelopmentConfig):
+    ID_GENERATOR = "uuid7"
+
+
+class TestIdGenerator(unittest.TestCase):
+    """ID_GENERATOR selects how BaseModel assigns ids"""
+
+    def tearDown(self):
+        create_app()
+
+    def test_default_is_uuid4(self):
+        create_app()
+        self.assertEqual(uuid.UUID(Amenity(name="Pool").id).version, 4)
+
+    def test_uuid7_ids_are_time_ordered(self):
+        create_app(Uuid7Config)
+        created = [Amenity(name=f"Spa {i}").id for i in range(1000)]
+        self.assertEqual(created, sorted(created))
+        self.assertEqual(uuid.UUID(created[0]).version, 7)
+
+    def test_explicit_id_is_kept(self):
+        create_app(Uuid7Config)
+        given = str(uuid.uuid4())
+        self.assertEqual(Amenity(id=given, name="Gym").id, given)
+
+    def test_unknown_generator_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ids.use_generator("ulid")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""Unit Tests for multi-get (?ids=a,b,c) on the collection endpoints"""
+
+import unittest
+import uuid
+
+from app import create_app
+
+
+class TestMultiGet(unittest.TestCase):
+    """Test suite for ?ids= on /users/, /places/, /amenities/ and /reviews/"""
+
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+    def _user(self):
+        return self.client.post('/api/v1/users/', json={
+            "first_name": "Multi", "last_name": "Get",
+            "email": f"multi.{uuid.uuid4().hex[:8]}@example.com", "password": "password123"
+        }).get_json()["id"]
+
+    def _place(self, owner, title):
+        return self.client.post('/api/v1/places/', json={
+            "title": title, "price": 10.0, "latitude": 1.0, "longitude": 1.0,
+            "owner_id": owner
+        }).get_json()["id"]
+
+    def test_places_in_request_order_with_misses(self):
+        owner = self._user()
+        first, second = self._place(owner, "First"), self._place(owner, "Second")
+        response = self.client.get(f'/api/v1/places/?ids={second},nope,{first}')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual([p and p["title"] for p in data["results"]], ["Second", None, "First"])
+        self.assertEqual(data["missing"], ["nope"])
+
+    def test_other_resources(self):
+        user = self._user()
+        amenity = self.client.post('/api/v1/amenities/', json={"name": "Sauna"}).get_json()["id"]
+        place = self._place(user, "Reviewed")
+        reviewer = self._user()
+        review = self.client.post('/api/v1/reviews/', json={
+            "text": "Nice", "rating": 4, "user_id": reviewer, "place_id": place
+        }).get_json()["id"]
+
+        users = self.client.get(f'/api/v1/users/?ids={user},{reviewer}').get_json()
+        self.assertEqual([u["id"] for u in users["results"]], [user, reviewer])
+        amenities = self.client.get(f'/api/v1/amenities/?ids={amenity}').get_json()
+        self.assertEqual(amenities["results"][0]["name"], "Sauna")
+        reviews = self.client.get(f'/api/v1/reviews/?ids=gone,{review}').get_json()
+        self.assertEqual(reviews["results"][1]["rating"], 4)
+        self.assertEqual(reviews["missing"], ["gone"])
+
+    def test_invalid_ids_returns_400(self):
+        self.assertEqual(self.client.get('/api/v1/places/?ids=').status_code, 400)
+        too_many = ",".join(str(i) for i in range(101))
+        self.assertEqual(self.client.get(f'/api/v1/users/?ids={too_many}').status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+"""Unit Tests for sorted, paginated GET /api/v1/places/"""
+
+import unittest
+import uuid
+
+from app import create_app
+from app.services import facade
+from app.services.sorted_index import SortedIndex
+
+
+class Item:
+    def __init__(self, key):
+        self.id = str(uuid.uuid4())
+        self.key = key
+
+
+class TestSortedIndex(unittest.TestCase):
+    """Test suite for SortedIndex"""
+
+    def setUp(self):
+        self.index = SortedIndex(lambda item: item.key)
+        self.items = [Item(k) for k in (30, 10, 20, 40)]
+        for item in self.items:
+            self.index.add(item)
+
+    def keys(self, ids):
+        by_id = {item.id: item.key for item in self.items}
+        return [by_id[i] for i in ids]
+
+    def test_pages(self):
+        self.assertEqual(self.keys(self.index.ids()), [10, 20, 30, 40])
+        self.assertEqual(self.keys(self.index.ids(offset=1, limit=2)), [20, 30])
+        self.assertEqual(self.keys(self.index.ids(descending=True, offset=1, limit=2)), [30, 20])
+        self.assertEqual(self.index.ids(offset=10, limit=2), [])
+
+    def test_update_moves_entry(self):
+        self.items[1].key = 50
+        self.index.update(self.items[1])
+        self.assertEqual(self.keys(self.index.ids()), [20, 30, 40, 50])
+        self.index.remove(self.items[1].id)
+        self.assertEqual(len(self.index), 3)
+
+    def test_include_filter(self):
+        include = {self.items[0].id, self.items[3].id}
+        self.assertEqual(self.keys(self.index.ids(descending=True, include=include)), [40, 30])
+        self.assertEqual(self.keys(self.index.ids(offset=1, limit=1, include=include)), [40])
+
+
+class TestSortedPlaceList(unittest.TestCase):
+    """Test suite for GET /api/v1/places/?sort="""
+
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+    def _user(self):
+        return self.client.post('/api/v1/users/', json={
+            "first_name": "Sort", "last_name": "User",
+            "email": f"sort.{uuid.uuid4().hex[:8]}@example.com", "password": "password123"
+        }).get_json()["id"]
+
+    def test_sort_by_price(self):
+        owner = self._user()
+        for price in (999990.0, 999991.0):
+            self.client.post('/api/v1/places/', json={
+                "title": "Costly", "price": price, "latitude": 1.0, "longitude": 1.0,
+                "owner_id": owner
+            })
+        response = self.client.get('/api/v1/places/?sort=-price&per_page=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([p["price"] for p in response.get_json()], [999991.0, 999990.0])
+        self.assertEqual(response.headers["X-Total-Count"], str(len(facade.get_all_places())))
+
+    def test_rating_follows_review_writes(self):
+        owner, reviewer = self._user(), self._user()
+        place = self.client.post('/api/v1/places/', json={
+            "title": "Rated", "price": 10.0, "latitude": 1.0, "longitude": 1.0,
+            "owner_id": owner
+        }).get_json()["id"]
+        index = facade.place_sort_indexes["rating"]
+        review = self.client.post('/api/v1/reviews/', json={
+            "text": "Great", "rating": 5, "user_id": reviewer, "place_id": place
+        }).get_json()["id"]
+        self.assertEqual(index.key(place), 5.0)
+
+        self.client.put(f'/api/v1/reviews/{review}', json={"text": "Meh", "rating": 2})
+        self.assertEqual(index.key(place), 2.0)
+
+        self.client.delete(f'/api/v1/reviews/{review}')
+        self.assertEqual(index.key(place), 0.0)
+        self.assertEqual(facade.place_sort_indexes["reviews"].key(place), 0)
+
+    def test_invalid_sort_returns_400(self):
+        self.assertEqual(self.client.get('/api/v1/places/?sort=title').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/places/?page=0').status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+"""Unit Tests for the in-memory inverted text index and search endpoints"""
+
+import unittest
+import uuid
+from types import SimpleNamespace
+
+from app import create_app
+from app.services.text_index import InvertedIndex, parse_query
+
+
+def doc(title, description=""):
+    return SimpleNamespace(id=str(uuid.uuid4()), title=title, description=description)
+
+
+class TestInvertedIndex(unittest.TestCase):
+    """Test suite for InvertedIndex"""
+
+    def setUp(self):
+        self.index = InvertedIndex({"title": 3, "description": 1})
+        self.villa = doc("Garden Villa", "Quiet villa with a private pool")
+        self.flat = doc("City Flat", "Next to the metro")
+        self.house = doc("Pool House", "Pool pool pool")
+        for d in (self.villa, self.flat, self.house):
+            self.index.add(d)
+
+    def test_parse_query(self):
+        self.assertEqual(parse_query("Pool garden OR beach"), [["pool", "garden"], ["beach"]])
+        self.assertEqual(parse_query("a AND b"), [["a", "b"]])
+
+    def test_and_is_default_and_ranked(self):
+        total, hits = self.index.search("pool")
+        self.assertEqual(total, 2)
+        self.assertEqual(hits[0][0], self.house.id)
+
+        total, hits = self.index.search("pool garden")
+        self.assertEqual([h[0] for h in hits], [self.villa.id])
+
+    def test_or(self):
+        total, _ = self.index.search("metro OR garden")
+        self.assertEqual(total, 2)
+
+    def test_incremental_update_and_remove(self):
+        self.flat.title = "Lighthouse Flat"
+        self.index.update(self.flat)
+        self.assertEqual(self.index.search("city")[0], 0)
+        self.assertEqual(self.index.search("lighthouse")[0], 1)
+
+        self.index.remove(self.house.id)
+        self.assertEqual(self.index.search("pool")[0], 1)
+        self.assertNotIn(self.house.id, self.index)
+
+    def test_memory_usage(self):
+        usage = self.index.memory_usage()
+        self.assertEqual(usage["documents"], 3)
+        self.assertGreater(usage["bytes"], 0)
+        before = usage["bytes"]
+        self.index.add(doc("Another", "entirely different words here"))
+        self.assertGreater(self.index.memory_usage()["bytes"], before)
+
+
+class TestSearchEndpoints(unittest.TestCase):
+    """Test suite for /places/search and /reviews/search"""
+
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+        self.word = "zq" + uuid.uuid4().hex[:8]
+
+        owner = self.client.post('/api/v1/users/', json={
+            "first_name": "Search", "last_name": "Owner",
+            "email": f"owner.{uuid.uuid4().hex[:8]}@example.com", "password": "password123"
+        }).get_json()
+        reviewer = self.client.post('/api/v1/users/', json={
+            "first_name": "Search", "last_name": "Reviewer",
+            "email": f"reviewer.{uuid.uuid4().hex[:8]}@example.com", "password": "password123"
+        }).get_json()
+        self.place = self.client.post('/api/v1/places/', json={
+            "title": f"Villa {self.word}", "description": "A villa", "price": 100.0,
+            "latitude": 10.0, "longitude": 10.0, "owner_id": owner["id"]
+        }).get_json()
+        self.review = self.client.post('/api/v1/reviews/', json={
+            "text": f"Lovely {self.word} stay", "rating": 5,
+            "user_id": reviewer["id"], "place_id": self.place["id"]
+        }).get_json()
+
+    def test_search_places(self):
+        data = self.client.get(f'/api/v1/places/search?q={self.word}').get_json()
+        self.assertEqual(data["total"], 1)
+        self.assertEqual(data["results"][0]["id"], self.place["id"])
+
+    def test_search_follows_place_updates(self):
+        self.client.put(f'/api/v1/places/{self.place["id"]}', json={"title": "Renamed"})
+        data = self.client.get(f'/api/v1/places/search?q={self.word}').get_json()
+        self.assertEqual(data["total"], 0)
+
+    def test_search_reviews_and_delete(self):
+        data = self.client.get(f'/api/v1/reviews/search?q={self.word}').get_json()
+        self.assertEqual(data["results"][0]["id"], self.review["id"])
+
+        self.client.delete(f'/api/v1/reviews/{self.review["id"]}')
+        data = self.client.get(f'/api/v1/reviews/search?q={self.word}').get_json()
+        self.assertEqual(data["total"], 0)
+
+    def test_search_requires_query(self):
+        response = self.client.get('/api/v1/places/search')
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,8 @@ import os
 class Config:
     SECRET_KEY = os.getenv("SECRET_KEY", "default_secret_key")
     DEBUG = False
+    # new ids: random or time-ordered, see app/models/ids.py
+    ID_GENERATOR = os.getenv("ID_GENERATOR", "uuid4")  # uuid4 | uuid7
 
 
 class DevelopmentConfig(Config):
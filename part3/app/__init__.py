@@ -5,7 +5,8 @@ from flask import Flask
 from flask_cors import CORS
 from flask_restx import Api
 from config import DevelopmentConfig
-from app.extensions import db, bcrypt, jwt
+from app.extensions import db, bcrypt, jwt, metrics, query_profiler
+from app import encoders, fragment_cache
 
 def create_app(config_class=DevelopmentConfig):
     app = Flask(__name__, instance_path=os.path.join(
@@ -16,6 +17,26 @@ def create_app(config_class=DevelopmentConfig):
     db.init_app(app)
     bcrypt.init_app(app)
     jwt.init_app(app)
+    metrics.init_app(app)
+    query_profiler.init_app(app)
+    from app.persistence.amenity_index import amenity_index
+    amenity_index.init_app(app)
+    from app.persistence.replicas import replica_router
+    replica_router.init_app(app)
+    from app.persistence.sharding import shards
+    shards.init_app(app)
+    from app.persistence.key_storage import configure_key_storage
+    configure_key_storage(app)
+    from app.persistence import primary_engines
+    from app.persistence.display_names import add_display_name_columns
+    for engine in primary_engines(app):
+        add_display_name_columns(engine)
+    from app.models.ids import configure_id_generator
+    configure_id_generator(app)
+    from app.services.review_queue import review_queue
+    review_queue.init_app(app)
+    from app.services.events import events
+    events.init_app(app)
     api = Api(
         app,
         version="1.0",
@@ -23,15 +44,21 @@ def create_app(config_class=DevelopmentConfig):
         description="HBnB Application API",
         doc="/api/v1/",
     )
+    encoders.init_app(app, api)
+    fragment_cache.init_app(app)
     from app.api.v1.auth import api as auth_ns
     from app.api.v1.users import api as users_ns
     from app.api.v1.amenities import api as amenities_ns
     from app.api.v1.places import api as places_ns
     from app.api.v1.reviews import api as reviews_ns
+    from app.api.v1.metrics import api as metrics_ns
+    from app.api.v1.export import api as export_ns
     api.add_namespace(auth_ns, path="/api/v1/auth")
     api.add_namespace(users_ns, path="/api/v1/users")
     api.add_namespace(amenities_ns, path="/api/v1/amenities")
     api.add_namespace(places_ns, path="/api/v1/places")
     api.add_namespace(reviews_ns, path="/api/v1/reviews")
+    api.add_namespace(metrics_ns, path="/api/v1/metrics")
+    api.add_namespace(export_ns, path="/api/v1/export")
     print("Namespaces added")
     return app
@@ -4,6 +4,11 @@
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt
 from app.services.facade import facade
+from app.api.v1.streaming import stream_json_array
+from app.fragment_cache import entity_key
+from app.api.v1.fieldsets import parse_fields, serialize
+from app.api.v1.multiget import parse_ids, multi_get_body
+from app.api.v1.validation import ValidatedResource
 
 api = Namespace("amenities", description="Amenity operations")
 
@@ -12,21 +17,36 @@ amenity_model = api.model("Amenity", {
     "description": fields.String(description="Description"),
 })
 
-def amenity_to_dict(amenity):
-    return {
-        "id":          amenity.id,
-        "name":        amenity.name,
-        "description": getattr(amenity, "description", ""),
-    }
+AMENITY_FIELDS = {
+    "id":          lambda a: a.id,
+    "name":        lambda a: a.name,
+    "description": lambda a: getattr(a, "description", ""),
+}
+
+def amenity_to_dict(amenity, fields=None):
+    return serialize(amenity, AMENITY_FIELDS, fields)
 
 
 @api.route("/")
-class AmenityList(Resource):
+class AmenityList(ValidatedResource):
 
+    @api.doc(params={"fields": "Comma-separated fields to return",
+                     "ids": "Comma-separated IDs to fetch (max 100)"})
     @api.response(200, "List of amenities retrieved successfully")
+    @api.response(400, "Unknown field")
     def get(self):
         """Retrieve all amenities - PUBLIC"""
-        return [amenity_to_dict(a) for a in facade.get_all_amenities()], 200
+        try:
+            fields = parse_fields(AMENITY_FIELDS)
+            ids = parse_ids()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        if ids is not None:
+            return multi_get_body(ids, facade.get_many_amenities(ids, fields),
+                                  lambda o: amenity_to_dict(o, fields)), 200
+        return stream_json_array(facade.get_all_amenities(fields),
+                                 lambda a: amenity_to_dict(a, fields),
+                                 key=entity_key("amenity", fields))
 
     @api.expect(amenity_model, validate=True)
     @api.response(201, "Amenity created successfully")
@@ -46,14 +66,20 @@ class AmenityList(Resource):
 @api.route("/<string:amenity_id>")
 class AmenityResource(Resource):
 
+    @api.doc(params={"fields": "Comma-separated fields to return"})
     @api.response(200, "Amenity details retrieved successfully")
+    @api.response(400, "Unknown field")
     @api.response(404, "Amenity not found")
     def get(self, amenity_id):
         """Get amenity by ID - PUBLIC"""
-        amenity = facade.get_amenity(amenity_id)
+        try:
+            fields = parse_fields(AMENITY_FIELDS)
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        amenity = facade.get_amenity(amenity_id, fields)
         if not amenity:
             return {"error": "Amenity not found"}, 404
-        return amenity_to_dict(amenity), 200
+        return amenity_to_dict(amenity, fields), 200
 
     @api.expect(amenity_model, validate=False)
     @api.response(200, "Amenity updated successfully")
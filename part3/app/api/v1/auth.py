@@ -4,6 +4,7 @@
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import create_access_token
 from app.services.facade import facade
+from app.api.v1.validation import ValidatedResource
 
 api = Namespace('auth', description='Authentication operations')
 
@@ -17,7 +18,7 @@ token_model = api.model('Token', {
 })
 
 @api.route('/login')
-class Login(Resource):
+class Login(ValidatedResource):
 
     @api.expect(login_model, validate=True)
     @api.response(200, 'Login successful', token_model)
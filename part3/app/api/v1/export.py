@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+"""Full-table export endpoints - ADMIN ONLY"""
+
+from flask import current_app, request
+from flask_restx import Namespace, Resource
+from flask_jwt_extended import jwt_required, get_jwt
+from app.services.facade import facade
+from app.api.v1.streaming import ROW_FORMATS, stream_rows
+
+api = Namespace("export", description="Bulk export operations")
+
+
+@api.route("/<string:entity>")
+class Export(Resource):
+
+    @api.doc(params={"format": "ndjson (default) or csv"})
+    @api.response(200, "Rows streamed as NDJSON or CSV, gzip when accepted")
+    @api.response(400, "Unknown format")
+    @api.response(403, "Admin access required")
+    @api.response(404, "Unknown entity")
+    @jwt_required()
+    def get(self, entity):
+        """Stream every row of users, places, reviews or amenities - ADMIN ONLY"""
+        if not get_jwt().get('is_admin'):
+            return {'error': 'Admin access required'}, 403
+        fmt = request.args.get("format", "ndjson")
+        if fmt not in ROW_FORMATS:
+            return {"error": f"Unknown format: {fmt}"}, 400
+        try:
+            columns, batches = facade.export_rows(entity, current_app.config["EXPORT_BATCH_SIZE"])
+        except ValueError as e:
+            return {"error": str(e)}, 404
+
+        gzip_level = None
+        if "gzip" in request.accept_encodings:
+            gzip_level = current_app.config["EXPORT_GZIP_LEVEL"]
+        response = stream_rows(columns, batches, fmt, gzip_level)
+        response.headers["Content-Disposition"] = f'attachment; filename="{entity}.{fmt}"'
+        return response
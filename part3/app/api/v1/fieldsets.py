@@ -0,0 +1,35 @@
+#!/usr/bin/python3
+"""Sparse fieldsets - ?fields= support shared by every namespace"""
+
+from flask import request
+
+
+def parse_fields(allowed):
+    """
+    Read ``?fields=a,b`` from the query string.
+
+    Returns a tuple of requested names in request order, or None when the
+    parameter is absent (meaning every field).
+
+    Raises:
+        ValueError: If a requested field is not in ``allowed``
+    """
+    return split_fields(request.args.get("fields"), allowed)
+
+
+def split_fields(raw, allowed):
+    """Framework-independent part of parse_fields."""
+    if not raw:
+        return None
+    requested = tuple(dict.fromkeys(f.strip() for f in raw.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    return requested or None
+
+
+def serialize(obj, getters, fields=None):
+    """Build a dict from ``getters``, touching only the requested fields."""
+    if fields is None:
+        return {name: get(obj) for name, get in getters.items()}
+    return {name: getters[name](obj) for name in fields}
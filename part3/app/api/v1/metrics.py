@@ -0,0 +1,22 @@
+#!/usr/bin/python3
+"""Metrics endpoint - Prometheus text exposition"""
+
+from flask import Response
+from flask_restx import Namespace, Resource
+from app.extensions import metrics
+from app.services.events import events
+from app.fragment_cache import current_fragment_cache
+
+api = Namespace("metrics", description="Request metrics")
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@api.route("")
+class Metrics(Resource):
+
+    @api.response(200, "Metrics in Prometheus text format")
+    def get(self):
+        """Request counts, errors, latency histograms, event delivery and fragment cache - PUBLIC"""
+        return Response(metrics.render() + events.render() + current_fragment_cache().render(),
+                        content_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+"""Multi-get by id - ?ids=a,b,c on every collection endpoint"""
+
+from flask import request
+
+MAX_IDS = 100
+
+
+def parse_ids(max_ids=MAX_IDS):
+    """
+    Read ``?ids=`` from the query string.
+
+    Returns:
+        list of ids in request order, or None when ``ids`` is absent
+
+    Raises:
+        ValueError: If the list is empty or longer than max_ids
+    """
+    if "ids" not in request.args:
+        return None
+    ids = [i.strip() for i in request.args["ids"].split(",") if i.strip()]
+    if not ids:
+        raise ValueError("ids must list at least one id")
+    if len(ids) > max_ids:
+        raise ValueError(f"At most {max_ids} ids per request")
+    return ids
+
+
+def multi_get_body(ids, objects, to_dict):
+    """
+    Response body for a multi-get.
+
+    ``results`` is aligned with ``ids`` (null for a miss) and ``missing``
+    lists the ids that were not found.
+    """
+    return {
+        "results": [to_dict(obj) if obj is not None else None for obj in objects],
+        "missing": [i for i, obj in zip(ids, objects) if obj is None],
+    }
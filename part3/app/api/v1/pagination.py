@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+"""Pagination shared by every namespace - ?page=/?per_page=, or ?after= cursors"""
+
+from flask import request
+
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+
+
+def parse_pagination(default_per_page=DEFAULT_PER_PAGE, max_per_page=MAX_PER_PAGE, args=None):
+    """
+    Read ``?page=`` (1-based) and ``?per_page=`` from the query string
+    (``args``, the current request's by default).
+
+    Returns:
+        (page, per_page)
+
+    Raises:
+        ValueError: If either value is not a positive integer
+    """
+    if args is None:
+        args = request.args
+    try:
+        page = int(args.get("page", 1))
+        per_page = int(args.get("per_page", default_per_page))
+    except ValueError:
+        raise ValueError("page and per_page must be integers")
+    if page < 1 or per_page < 1:
+        raise ValueError("page and per_page must be positive")
+    return page, min(per_page, max_per_page)
+
+
+def page_envelope(results, total, page, per_page, **extra):
+    """Standard paginated response body."""
+    return {
+        **extra,
+        "page": page,
+        "per_page": per_page,
+        "total": total,
+        "results": results,
+    }
+
+
+def parse_sort(allowed):
+    """
+    Read ``?sort=key`` / ``?sort=-key`` (descending) from the query string.
+
+    Returns:
+        (key, descending), or None when no sort was requested
+
+    Raises:
+        ValueError: If the key is not in ``allowed``
+    """
+    value = request.args.get("sort", "").strip()
+    if not value:
+        return None
+    descending = value.startswith("-")
+    key = value.lstrip("-")
+    if key not in allowed:
+        raise ValueError(f"Unknown sort key: {key} (allowed: {', '.join(allowed)})")
+    return key, descending
+
+
+def wants_page():
+    """True when the client asked for a sorted or paginated list."""
+    return any(name in request.args for name in ("sort", "page", "per_page"))
+
+
+def parse_cursor():
+    """
+    Read ``?after=<id>`` (keyset pagination in id order) from the query string.
+
+    ``?after=`` with no value asks for the first page; ``per_page`` sets
+    the page size.
+
+    Returns:
+        the id to continue after, or None when no cursor was requested
+
+    Raises:
+        ValueError: If combined with ``sort`` or ``page``
+    """
+    if "after" not in request.args:
+        return None
+    if "sort" in request.args or "page" in request.args:
+        raise ValueError("after cannot be combined with sort or page")
+    return request.args["after"].strip()
+
+
+def set_next_cursor(response, items, per_page):
+    """X-Next-Cursor: the id to pass as ?after= for the next page, absent on the last."""
+    if len(items) == per_page:
+        response.headers["X-Next-Cursor"] = items[-1].id
+    return response
@@ -1,9 +1,17 @@
 #!/usr/bin/python3
 """Place endpoints - Tasks 3 & 4 (Amaal)"""
 
+from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app.services.facade import facade
+from app.api.v1.streaming import stream_json_array
+from app.fragment_cache import entity_key
+from app.api.v1.fieldsets import parse_fields, serialize
+from app.api.v1.multiget import parse_ids, multi_get_body
+from app.api.v1.validation import ValidatedResource
+from app.api.v1.pagination import (parse_cursor, parse_pagination, parse_sort, page_envelope,
+                                    set_next_cursor, wants_page)
 
 api = Namespace("places", description="Place operations")
 
@@ -23,25 +31,92 @@ place_update_model = api.model("PlaceUpdate", {
     "longitude":   fields.Float(description="Longitude"),
 })
 
-def place_to_dict(place):
-    return {
-        "id":          place.id,
-        "title":       place.title,
-        "description": place.description,
-        "price":       place.price,
-        "latitude":    place.latitude,
-        "longitude":   place.longitude,
-        "owner_id":    getattr(place, 'owner_id', None),
-    }
+PLACE_FIELDS = {
+    "id":          lambda p: p.id,
+    "title":       lambda p: p.title,
+    "description": lambda p: p.description,
+    "price":       lambda p: p.price,
+    "latitude":    lambda p: p.latitude,
+    "longitude":   lambda p: p.longitude,
+    "owner_id":    lambda p: getattr(p, 'owner_id', None),
+    "owner_name":  lambda p: p.owner_name or _owner_name(p),
+    # from place_stats; never reads the reviews table
+    "review_count":   lambda p: p.stats.review_count if p.stats else 0,
+    "rating_avg":     lambda p: round(p.stats.rating_avg, 2) if p.stats else 0.0,
+    "stars":          lambda p: p.stats.stars if p.stats else {str(i): 0 for i in range(1, 6)},
+    "last_review_at": lambda p: (p.stats.last_review_at.isoformat()
+                                 if p.stats and p.stats.last_review_at else None),
+}
+
+def _owner_name(place):
+    """Fallback for rows written before places.owner_name existed."""
+    owner = getattr(place, "owner", None)
+    return f"{owner.first_name} {owner.last_name}" if owner else None
+
+PLACE_SORT_KEYS = ("price", "rating", "created_at", "reviews")
+
+STATS_FIELDS = ("review_count", "rating_avg", "stars", "last_review_at")
+
+def place_to_dict(place, fields=None):
+    return serialize(place, PLACE_FIELDS, fields)
+
+def _stats_version(place):
+    """Review statistics change without touching places.updated_at."""
+    stats = place.stats
+    return (stats.review_count, stats.rating_sum, tuple(stats.stars.values()),
+            stats.last_review_at) if stats else None
+
+def place_cache_key(fields=None):
+    with_stats = fields is None or not set(STATS_FIELDS).isdisjoint(fields)
+    return entity_key("place", fields, _stats_version if with_stats else None)
 
 
 @api.route("/")
-class PlaceList(Resource):
-
+class PlaceList(ValidatedResource):
+
+    @api.doc(params={"fields": "Comma-separated fields to return",
+                     "amenities": "Comma-separated amenity IDs; only places having all of them",
+                     "sort": "price, rating, created_at or reviews; prefix with - for descending",
+                     "page": "Page number (1-based)",
+                     "per_page": "Results per page (max 100)",
+                     "after": "Cursor: id to continue after, in id order (empty for the first page)",
+                     "ids": "Comma-separated IDs to fetch (max 100)"})
     @api.response(200, "List of places retrieved successfully")
+    @api.response(400, "Unknown field, sort key or invalid pagination")
     def get(self):
         """Retrieve all places - PUBLIC"""
-        return [place_to_dict(p) for p in facade.get_all_places()], 200
+        try:
+            fields = parse_fields(PLACE_FIELDS)
+            sort = parse_sort(PLACE_SORT_KEYS)
+            page, per_page = parse_pagination()
+            after = parse_cursor()
+            ids = parse_ids()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        if ids is not None:
+            return multi_get_body(ids, facade.get_many_places(ids, fields),
+                                  lambda o: place_to_dict(o, fields)), 200
+        amenity_ids = [a.strip() for a in request.args.get("amenities", "").split(",")
+                       if a.strip()]
+        if after is not None:
+            if amenity_ids:
+                return {"error": "after cannot be combined with amenities"}, 400
+            places = facade.list_places_after(after, per_page, fields)
+            return set_next_cursor(stream_json_array(places, lambda p: place_to_dict(p, fields),
+                                                     key=place_cache_key(fields)),
+                                   places, per_page)
+        if wants_page():
+            total, places = facade.list_places(sort, page, per_page, fields, amenity_ids)
+            response = stream_json_array(places, lambda p: place_to_dict(p, fields),
+                                         key=place_cache_key(fields))
+            response.headers["X-Total-Count"] = str(total)
+            return response
+        if amenity_ids:
+            places = facade.iter_places_with_amenities(amenity_ids, fields=fields)
+        else:
+            places = facade.iter_all_places(fields=fields)
+        return stream_json_array(places, lambda p: place_to_dict(p, fields),
+                                 key=place_cache_key(fields))
 
     @api.expect(place_model, validate=True)
     @api.response(201, "Place created successfully")
@@ -58,17 +133,43 @@ class PlaceList(Resource):
         return place_to_dict(new_place), 201
 
 
+@api.route("/search")
+class PlaceSearch(Resource):
+
+    @api.doc(params={"q": "Search terms", "page": "Page number (1-based)",
+                     "per_page": "Results per page (max 100)"})
+    @api.response(200, "Ranked search results with snippets")
+    @api.response(400, "Missing query or invalid pagination")
+    def get(self):
+        """Full-text search over place titles and descriptions - PUBLIC"""
+        query = request.args.get("q", "").strip()
+        if not query:
+            return {"error": "q is required"}, 400
+        try:
+            page, per_page = parse_pagination()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        total, results = facade.search_places(query, per_page, (page - 1) * per_page)
+        return page_envelope(results, total, page, per_page, query=query), 200
+
+
 @api.route("/<string:place_id>")
 class PlaceResource(Resource):
 
+    @api.doc(params={"fields": "Comma-separated fields to return"})
     @api.response(200, "Place details retrieved successfully")
+    @api.response(400, "Unknown field")
     @api.response(404, "Place not found")
     def get(self, place_id):
         """Get place by ID - PUBLIC"""
-        place = facade.get_place(place_id)
+        try:
+            fields = parse_fields(PLACE_FIELDS)
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        place = facade.get_place(place_id, fields)
         if not place:
             return {"error": "Place not found"}, 404
-        return place_to_dict(place), 200
+        return place_to_dict(place, fields), 200
 
     @api.expect(place_update_model, validate=False)
     @api.response(200, "Place updated successfully")
@@ -1,9 +1,18 @@
 #!/usr/bin/python3
 """Review endpoints - Tasks 3 and 4 (Amaal)"""
 
+from flask import request, url_for
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app.services.facade import facade
+from app.services.review_queue import review_queue
+from app.api.v1.streaming import stream_json_array
+from app.fragment_cache import entity_key
+from app.api.v1.fieldsets import parse_fields, serialize
+from app.api.v1.multiget import parse_ids, multi_get_body
+from app.api.v1.validation import ValidatedResource
+from app.api.v1.pagination import (parse_cursor, parse_pagination, page_envelope,
+                                    set_next_cursor)
 
 api = Namespace("reviews", description="Review operations")
 
@@ -18,27 +27,57 @@ review_update_model = api.model("ReviewUpdate", {
     "rating": fields.Integer(description="Rating 1-5"),
 })
 
-def review_to_dict(review):
-    return {
-        "id":       review.id,
-        "text":     review.text,
-        "rating":   review.rating,
-        "user_name": f"{review.user.first_name} {review.user.last_name}" if hasattr(review, "user") and review.user else "Anonymous",
-        "user_id":  getattr(review, "user_id",  None),
-        "place_id": getattr(review, "place_id", None),
-    }
+REVIEW_FIELDS = {
+    "id":        lambda r: r.id,
+    "text":      lambda r: r.text,
+    "rating":    lambda r: r.rating,
+    "user_name": lambda r: r.user_name or _author_name(r),
+    "user_id":   lambda r: getattr(r, "user_id",  None),
+    "place_id":  lambda r: getattr(r, "place_id", None),
+}
+
+def _author_name(review):
+    """Fallback for rows written before reviews.user_name existed."""
+    user = getattr(review, "user", None)
+    return f"{user.first_name} {user.last_name}" if user else "Anonymous"
+
+def review_to_dict(review, fields=None):
+    return serialize(review, REVIEW_FIELDS, fields)
 
 
 @api.route("/")
-class ReviewList(Resource):
+class ReviewList(ValidatedResource):
 
+    @api.doc(params={"fields": "Comma-separated fields to return",
+                     "after": "Cursor: id to continue after, in id order (empty for the first page)",
+                     "per_page": "Results per page with after (max 100)",
+                     "ids": "Comma-separated IDs to fetch (max 100)"})
     @api.response(200, "List of reviews retrieved successfully")
+    @api.response(400, "Unknown field or invalid pagination")
     def get(self):
         """Retrieve all reviews - PUBLIC"""
-        return [review_to_dict(r) for r in facade.get_all_reviews()], 200
+        try:
+            fields = parse_fields(REVIEW_FIELDS)
+            after = parse_cursor()
+            _, per_page = parse_pagination()
+            ids = parse_ids()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        if ids is not None:
+            return multi_get_body(ids, facade.get_many_reviews(ids, fields),
+                                  lambda o: review_to_dict(o, fields)), 200
+        if after is not None:
+            reviews = facade.list_reviews_after(after, per_page, fields)
+            return set_next_cursor(stream_json_array(reviews, lambda r: review_to_dict(r, fields),
+                                                     key=entity_key("review", fields)),
+                                   reviews, per_page)
+        return stream_json_array(facade.iter_all_reviews(fields=fields),
+                                 lambda r: review_to_dict(r, fields),
+                                 key=entity_key("review", fields))
 
     @api.expect(review_model, validate=True)
     @api.response(201, "Review created successfully")
+    @api.response(202, "Review queued (write-behind mode); poll the job")
     @api.response(403, "Cannot review your own place or duplicate review")
     @api.response(404, "Place not found")
     @jwt_required()
@@ -48,7 +87,7 @@ class ReviewList(Resource):
         review_data = api.payload
         place_id = review_data.get("place_id")
 
-        place = facade.get_place(place_id)
+        place = facade.get_place(place_id, ["owner_id"])
         if not place:
             return {"error": "Place not found"}, 404
 
@@ -56,25 +95,76 @@ class ReviewList(Resource):
         if owner_id and owner_id == current_user_id:
             return {"error": "Cannot review your own place"}, 403
 
+        queued = review_queue.enabled()
+        if facade.get_review_by_user_and_place(current_user_id, place_id) or \
+                (queued and review_queue.is_pending(current_user_id, place_id)):
+            return {"error": "You have already reviewed this place"}, 403
+
         review_data["user_id"] = current_user_id
         try:
+            if queued:
+                job = review_queue.submit(facade.build_review(review_data))
+                return job, 202, {"Location": url_for("reviews_review_job", job_id=job["id"])}
             new_review = facade.create_review(review_data)
         except ValueError as e:
             return {"error": str(e)}, 400
         return review_to_dict(new_review), 201
 
 
+@api.route("/jobs/<string:job_id>")
+class ReviewJob(Resource):
+
+    @api.response(200, "Job status: pending, done (review visible) or failed")
+    @api.response(403, "Unauthorized action")
+    @api.response(404, "Job not found")
+    @jwt_required()
+    def get(self, job_id):
+        """Status of a queued review - AUTHENTICATED + OWNER CHECK"""
+        job = review_queue.status(job_id) if review_queue.enabled() else None
+        if not job:
+            return {"error": "Job not found"}, 404
+        if job["user_id"] != get_jwt_identity() and not get_jwt().get("is_admin", False):
+            return {"error": "Unauthorized action"}, 403
+        return job, 200
+
+
+@api.route("/search")
+class ReviewSearch(Resource):
+
+    @api.doc(params={"q": "Search terms", "page": "Page number (1-based)",
+                     "per_page": "Results per page (max 100)"})
+    @api.response(200, "Ranked search results with snippets")
+    @api.response(400, "Missing query or invalid pagination")
+    def get(self):
+        """Full-text search over review text - PUBLIC"""
+        query = request.args.get("q", "").strip()
+        if not query:
+            return {"error": "q is required"}, 400
+        try:
+            page, per_page = parse_pagination()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        total, results = facade.search_reviews(query, per_page, (page - 1) * per_page)
+        return page_envelope(results, total, page, per_page, query=query), 200
+
+
 @api.route("/<string:review_id>")
 class ReviewResource(Resource):
 
+    @api.doc(params={"fields": "Comma-separated fields to return"})
     @api.response(200, "Review details retrieved successfully")
+    @api.response(400, "Unknown field")
     @api.response(404, "Review not found")
     def get(self, review_id):
         """Get review by ID - PUBLIC"""
-        review = facade.get_review(review_id)
+        try:
+            fields = parse_fields(REVIEW_FIELDS)
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        review = facade.get_review(review_id, fields)
         if not review:
             return {"error": "Review not found"}, 404
-        return review_to_dict(review), 200
+        return review_to_dict(review, fields), 200
 
     @api.expect(review_update_model, validate=False)
     @api.response(200, "Review updated successfully")
@@ -124,10 +214,17 @@ class ReviewResource(Resource):
 @api.route("/places/<string:place_id>/reviews")
 class PlaceReviewList(Resource):
 
+    @api.doc(params={"fields": "Comma-separated fields to return"})
     @api.response(200, "Reviews for place retrieved successfully")
+    @api.response(400, "Unknown field")
     @api.response(404, "Place not found")
     def get(self, place_id):
         """Get all reviews for a place - PUBLIC"""
-        if not facade.get_place(place_id):
+        try:
+            fields = parse_fields(REVIEW_FIELDS)
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        if not facade.get_place(place_id, ["id"]):
             return {"error": "Place not found"}, 404
-        return [review_to_dict(r) for r in facade.get_reviews_by_place(place_id)], 200
+        reviews = facade.get_reviews_by_place(place_id, fields)
+        return [review_to_dict(r, fields) for r in reviews], 200
@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+"""Streaming JSON array, NDJSON and CSV responses"""
+
+import csv
+import io
+import zlib
+from itertools import chain
+
+from flask import Response, stream_with_context
+from app.encoders import current_dumps
+from app.extensions import db
+from app.fragment_cache import FragmentCache, current_fragment_cache
+from app.persistence.sharding import shards
+
+CHUNK_SIZE = 64 * 1024
+
+_END = object()
+
+
+def _take_sessions():
+    """
+    Unregister the request's open sessions and return them.
+
+    The app context is torn down, closing its registered sessions, before
+    a streamed body is read; rows already loaded (and a cursor still
+    being read) must keep their session until the body has been sent.
+    """
+    taken = []
+    for scoped in [db.session, *(shards.sessions() if shards.enabled() else ())]:
+        if scoped.registry.has():
+            taken.append(scoped.registry())
+            scoped.registry.clear()
+    return taken
+
+
+def stream_json_array(rows, to_dict, status=200, key=None):
+    """
+    Stream ``rows`` as a JSON array without building the list in memory.
+
+    The first row is fetched before the response is built, so a failing
+    query still reaches Flask's error handling as a 500 instead of a
+    200 with a truncated body; the rest is flushed to the socket in
+    CHUNK_SIZE pieces as the cursor yields it, in the session that
+    loaded the first row. That session is closed when the body ends or
+    fails, or when the response is closed without being read. With
+    ``key`` (see app.fragment_cache.entity_key) rows that have not changed
+    since an earlier response are copied from the fragment cache instead
+    of being serialized again.
+    """
+    cache = current_fragment_cache() if key is not None else FragmentCache(0)
+    encode = cache.encoder(current_dumps(), to_dict, key)
+    rows = iter(rows)
+    first = next(rows, _END)
+
+    sessions = _take_sessions()
+
+    def close_sessions():
+        for session in sessions:
+            session.close()
+
+    def generate():
+        try:
+            yield b"["
+            if first is _END:
+                yield b"]"
+                return
+            buffer, size, sep = [], 0, b""
+            for row in chain((first,), rows):
+                chunk = sep + encode(row)
+                sep = b","
+                buffer.append(chunk)
+                size += len(chunk)
+                if size >= CHUNK_SIZE:
+                    yield b"".join(buffer)
+                    buffer, size = [], 0
+            buffer.append(b"]")
+            yield b"".join(buffer)
+        finally:
+            # a client may read the body and never close the response
+            close_sessions()
+
+    response = Response(stream_with_context(generate()), status=status,
+                        mimetype="application/json")
+    # the body may also never be read at all (HEAD, dropped clients)
+    response.call_on_close(close_sessions)
+    return response
+
+
+def _ndjson_encoder(columns):
+    dumps = current_dumps()
+
+    def encode(batch):
+        return b"".join([dumps(dict(zip(columns, row))) + b"\n" for row in batch])
+
+    return None, encode
+
+
+def _csv_encoder(columns):
+    text = io.StringIO()
+    writer = csv.writer(text, lineterminator="\n")
+
+    def encode(batch):
+        text.seek(0)
+        text.truncate()
+        writer.writerows(batch)
+        return text.getvalue().encode("utf-8")
+
+    writer.writerow(columns)
+    return text.getvalue().encode("utf-8"), encode
+
+
+ROW_FORMATS = {
+    "ndjson": (_ndjson_encoder, "application/x-ndjson"),
+    "csv": (_csv_encoder, "text/csv"),
+}
+
+
+def stream_rows(columns, batches, fmt, gzip_level=None):
+    """
+    Stream batches of row tuples as NDJSON or CSV (header row first).
+
+    Rows are encoded a batch at a time and flushed in CHUNK_SIZE pieces,
+    so memory stays flat however many rows the cursor yields. With
+    ``gzip_level`` the body is gzip-compressed on the fly and sent with
+    ``Content-Encoding: gzip``.
+    """
+    make_encoder, mimetype = ROW_FORMATS[fmt]
+    header, encode = make_encoder(columns)
+    compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31) if gzip_level else None
+
+    def chunks():
+        buffer, size = [header] if header else [], len(header or b"")
+        for batch in batches:
+            data = encode(batch)
+            buffer.append(data)
+            size += len(data)
+            if size >= CHUNK_SIZE:
+                yield b"".join(buffer)
+                buffer, size = [], 0
+        yield b"".join(buffer)
+
+    def generate():
+        if compressor is None:
+            yield from chunks()
+            return
+        for chunk in chunks():
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+
+    response = Response(stream_with_context(generate()), mimetype=mimetype)
+    if compressor is not None:
+        response.headers["Content-Encoding"] = "gzip"
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
@@ -4,6 +4,11 @@
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app.services.facade import facade
+from app.api.v1.streaming import stream_json_array
+from app.fragment_cache import entity_key
+from app.api.v1.fieldsets import parse_fields, serialize
+from app.api.v1.multiget import parse_ids, multi_get_body
+from app.api.v1.validation import ValidatedResource
 
 api = Namespace("users", description="User operations")
 
@@ -19,24 +24,38 @@ user_update_model = api.model("UserUpdate", {
     "last_name":  fields.String(description="Last name of the user"),
 })
 
-def user_to_dict(user):
+USER_FIELDS = {
+    "id":         lambda u: u.id,
+    "first_name": lambda u: u.first_name,
+    "last_name":  lambda u: u.last_name,
+    "email":      lambda u: u.email,
+    "is_admin":   lambda u: u.is_admin,
+}
+
+def user_to_dict(user, fields=None):
     """Convert user to dictionary WITHOUT password."""
-    return {
-        "id":         user.id,
-        "first_name": user.first_name,
-        "last_name":  user.last_name,
-        "email":      user.email,
-        "is_admin":   user.is_admin,
-    }
+    return serialize(user, USER_FIELDS, fields)
 
 
 @api.route("/")
-class UserList(Resource):
+class UserList(ValidatedResource):
 
+    @api.doc(params={"fields": "Comma-separated fields to return",
+                     "ids": "Comma-separated IDs to fetch (max 100)"})
     @api.response(200, "List of users retrieved successfully")
+    @api.response(400, "Unknown field")
     def get(self):
         """Retrieve a list of users - PUBLIC"""
-        return [user_to_dict(u) for u in facade.get_users()], 200
+        try:
+            fields = parse_fields(USER_FIELDS)
+            ids = parse_ids()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        if ids is not None:
+            return multi_get_body(ids, facade.get_many_users(ids, fields),
+                                  lambda o: user_to_dict(o, fields)), 200
+        return stream_json_array(facade.get_users(fields), lambda u: user_to_dict(u, fields),
+                                 key=entity_key("user", fields))
 
     @api.expect(user_model, validate=True)
     @api.response(201, "User successfully created")
@@ -57,14 +76,20 @@ class UserList(Resource):
 @api.route("/<string:user_id>")
 class UserResource(Resource):
 
+    @api.doc(params={"fields": "Comma-separated fields to return"})
     @api.response(200, "User details retrieved successfully")
+    @api.response(400, "Unknown field")
     @api.response(404, "User not found")
     def get(self, user_id):
         """Get user details by ID - PUBLIC"""
-        user = facade.get_user(user_id)
+        try:
+            fields = parse_fields(USER_FIELDS)
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        user = facade.get_user(user_id, fields)
         if not user:
             return {"error": "User not found"}, 404
-        return user_to_dict(user), 200
+        return user_to_dict(user, fields), 200
 
     @api.expect(user_update_model, validate=False)
     @api.response(200, "User updated successfully")
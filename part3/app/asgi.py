@@ -0,0 +1,208 @@
+#!/usr/bin/python3
+"""ASGI read API - public GET endpoints served from the async repositories"""
+
+import re
+from urllib.parse import parse_qs
+
+from config import DevelopmentConfig
+from app import create_app
+from app.encoders import get_encoder
+from app.extensions import db
+from app.models.types import use_binary_keys
+from app.api.v1.fieldsets import serialize, split_fields
+from app.api.v1.pagination import page_envelope, parse_pagination
+from app.api.v1.places import PLACE_FIELDS
+from app.api.v1.reviews import REVIEW_FIELDS
+from app.api.v1.users import USER_FIELDS
+from app.api.v1.amenities import AMENITY_FIELDS
+from app.persistence.async_repository import (
+    AsyncUserRepository, AsyncPlaceRepository, AsyncReviewRepository,
+    AsyncAmenityRepository, create_async_sessionmaker,
+)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ReadAPI:
+    """
+    Minimal ASGI application for the public read endpoints.
+
+    Routes and payloads mirror the flask_restx namespaces (same *_FIELDS
+    serializers, same ?fields= handling, same error bodies); list
+    endpoints are streamed from the database cursor. HEAD gets the GET
+    status and headers without a body.
+    """
+
+    def __init__(self, sessionmaker, dumps):
+        self.sessionmaker = sessionmaker
+        self.dumps = dumps
+        resources = {
+            "users": (AsyncUserRepository(sessionmaker), USER_FIELDS, "User"),
+            "places": (AsyncPlaceRepository(sessionmaker), PLACE_FIELDS, "Place"),
+            "reviews": (AsyncReviewRepository(sessionmaker), REVIEW_FIELDS, "Review"),
+            "amenities": (AsyncAmenityRepository(sessionmaker), AMENITY_FIELDS, "Amenity"),
+        }
+        self.resources = resources
+        self.routes = [
+            (re.compile(r"^/api/v1/reviews/places/(?P<place_id>[^/]+)/reviews/?$"),
+             self.place_reviews),
+            (re.compile(r"^/api/v1/(?P<name>places|reviews)/search/?$"), self.search),
+            (re.compile(r"^/api/v1/(?P<name>users|places|reviews|amenities)/$"),
+             self.list_resource),
+            (re.compile(r"^/api/v1/(?P<name>users|places|reviews|amenities)/(?P<obj_id>[^/]+)$"),
+             self.get_resource),
+        ]
+
+    # ==================== ASGI entry point ====================
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] not in ("GET", "HEAD"):
+            await self._send_json(send, 405, {"error": "Method not allowed"})
+            return
+        if scope["method"] == "HEAD":
+            send = _without_body(send)
+
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        for pattern, handler in self.routes:
+            match = pattern.match(scope["path"])
+            if match:
+                await handler(send, query, **match.groupdict())
+                return
+        await self._send_json(send, 404, {"error": "Not found"})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.sessionmaker.kw["bind"].dispose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    # ==================== Handlers ====================
+
+    async def list_resource(self, send, query, name):
+        repo, getters, _ = self.resources[name]
+        fields = await self._fields(send, query, getters)
+        if fields is False:
+            return
+        await self._stream_json_array(send, repo.iter_all(fields=fields),
+                                      lambda obj: serialize(obj, getters, fields))
+
+    async def get_resource(self, send, query, name, obj_id):
+        repo, getters, label = self.resources[name]
+        fields = await self._fields(send, query, getters)
+        if fields is False:
+            return
+        obj = await repo.get(obj_id, fields)
+        if obj is None:
+            await self._send_json(send, 404, {"error": f"{label} not found"})
+            return
+        await self._send_json(send, 200, serialize(obj, getters, fields))
+
+    async def place_reviews(self, send, query, place_id):
+        places, _, _ = self.resources["places"]
+        reviews, getters, _ = self.resources["reviews"]
+        fields = await self._fields(send, query, getters)
+        if fields is False:
+            return
+        if await places.get(place_id, ("id",)) is None:
+            await self._send_json(send, 404, {"error": "Place not found"})
+            return
+        rows = await reviews.get_by_attribute("place_id", place_id, fields)
+        await self._send_json(send, 200, [serialize(r, getters, fields) for r in rows])
+
+    async def search(self, send, query, name):
+        repo, _, _ = self.resources[name]
+        text = query.get("q", [""])[0].strip()
+        if not text:
+            await self._send_json(send, 400, {"error": "q is required"})
+            return
+        try:
+            page, per_page = parse_pagination(args={k: v[0] for k, v in query.items()})
+        except ValueError as e:
+            await self._send_json(send, 400, {"error": str(e)})
+            return
+        total, results = await repo.search(text, per_page, (page - 1) * per_page)
+        await self._send_json(send, 200, page_envelope(results, total, page, per_page, query=text))
+
+    # ==================== Helpers ====================
+
+    async def _fields(self, send, query, getters):
+        """Parsed ?fields=, or False once a 400 has been sent."""
+        try:
+            return split_fields(query.get("fields", [""])[0], getters)
+        except ValueError as e:
+            await self._send_json(send, 400, {"error": str(e)})
+            return False
+
+    async def _send_json(self, send, status, data):
+        body = self.dumps(data)
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _stream_json_array(self, send, rows, to_dict):
+        # run the query before the 200 goes out, so a failure is still a 500
+        rows = aiter(rows)
+        try:
+            first = [await anext(rows)]
+        except StopAsyncIteration:
+            first = []
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        })
+        await send({"type": "http.response.body", "body": b"[", "more_body": True})
+        buffer, size, sep = [], 0, b""
+        if first:
+            buffer.append(self.dumps(to_dict(first[0])))
+            size, sep = len(buffer[0]), b","
+        async for row in rows:
+            chunk = sep + self.dumps(to_dict(row))
+            sep = b","
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= CHUNK_SIZE:
+                await send({"type": "http.response.body", "body": b"".join(buffer),
+                            "more_body": True})
+                buffer, size = [], 0
+        buffer.append(b"]")
+        await send({"type": "http.response.body", "body": b"".join(buffer)})
+
+
+def _without_body(send):
+    """send() for HEAD: every body message goes out empty."""
+    async def send_head(message):
+        if message["type"] == "http.response.body":
+            message = {**message, "body": b""}
+        await send(message)
+    return send_head
+
+
+def create_asgi_app(config_class=DevelopmentConfig):
+    """
+    Build the read API on the same database and config as the Flask app.
+
+    The Flask app is created once to resolve the database URL (including
+    the instance path for relative SQLite files) and the JSON encoder.
+    """
+    flask_app = create_app(config_class)
+    with flask_app.app_context():
+        url = db.engine.url
+    dumps = get_encoder(flask_app.config.get("JSON_ENCODER", "auto"))
+    sessionmaker = create_async_sessionmaker(url)
+    use_binary_keys(sessionmaker.kw["bind"], flask_app.config["ID_STORAGE"] == "binary")
+    return ReadAPI(sessionmaker, dumps)
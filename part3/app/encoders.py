@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+"""Pluggable JSON encoders - orjson when installed, stdlib json otherwise"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from flask import current_app, make_response
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def _default(obj):
+    """Encode the types the *_to_dict helpers may hand us."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def stdlib_dumps(data):
+    return json.dumps(data, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def orjson_dumps(data):
+    # datetime and UUID are handled natively by orjson
+    return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+ENCODERS = {"json": stdlib_dumps}
+if orjson is not None:
+    ENCODERS["orjson"] = orjson_dumps
+
+
+def get_encoder(name="auto"):
+    """
+    Return a ``dumps(data) -> bytes`` callable.
+
+    "auto" picks orjson when it is installed and falls back to the stdlib.
+    """
+    if name == "auto":
+        return ENCODERS.get("orjson", stdlib_dumps)
+    if name not in ENCODERS:
+        raise ValueError(f"JSON encoder '{name}' is not available")
+    return ENCODERS[name]
+
+
+def init_app(app, api):
+    """Register the configured encoder as the flask-restx JSON representation."""
+    dumps = get_encoder(app.config.get("JSON_ENCODER", "auto"))
+    app.extensions["hbnb_json_dumps"] = dumps
+
+    def output_json(data, code, headers=None):
+        resp = make_response(dumps(data), code)
+        resp.headers.extend(headers or {})
+        resp.mimetype = "application/json"
+        return resp
+
+    api.representations["application/json"] = output_json
+
+
+def current_dumps():
+    """The current app's configured ``dumps`` callable."""
+    return current_app.extensions.get("hbnb_json_dumps", stdlib_dumps)
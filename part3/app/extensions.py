@@ -5,6 +5,12 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 
-db = SQLAlchemy()
+from app.metrics import RequestMetrics
+from app.persistence.replicas import RoutingSession
+from app.profiling import QueryProfiler
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 bcrypt = Bcrypt()
 jwt = JWTManager()
+metrics = RequestMetrics()
+query_profiler = QueryProfiler()
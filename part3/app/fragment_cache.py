@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+"""Encoded-JSON cache for unchanged entities in list responses"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+from flask import current_app
+
+# dict slot, key tuple and bookkeeping per entry, on top of the bytes object
+ENTRY_OVERHEAD = 200
+
+
+class FragmentCache:
+    """
+    Memory-bounded LRU of encoded JSON objects.
+
+    Keys are (entity and fields, id, updated_at, version): an entity that
+    has not been written since it was encoded gets the same key, so its
+    bytes can be spliced into a JSON array as they are. A write bumps
+    updated_at, the next request misses and re-encodes, and the old entry
+    simply ages out. ``version`` covers what updated_at does not (a
+    place's review statistics live in another table).
+
+    The cache belongs to one app and so to one JSON encoder. ``max_bytes``
+    bounds the encoded bytes plus ENTRY_OVERHEAD per entry; 0 disables it.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._size = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def encoder(self, dumps, to_dict, key):
+        """
+        ``row -> bytes`` for stream_json_array, served from the cache.
+
+        ``key(row)`` returns the cache key, or None for rows that cannot
+        be cached (no updated_at); those are always encoded.
+        """
+        if not self.max_bytes:
+            return lambda row: dumps(to_dict(row))
+
+        def encode(row):
+            k = key(row)
+            if k is None:
+                return dumps(to_dict(row))
+            with self._lock:
+                data = self._entries.get(k)
+                if data is not None:
+                    self._entries.move_to_end(k)
+                    self.hits += 1
+                    return data
+                self.misses += 1
+            data = dumps(to_dict(row))
+            self._put(k, data)
+            return data
+
+        return encode
+
+    def _put(self, key, data):
+        size = sys.getsizeof(data) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= sys.getsizeof(old) + ENTRY_OVERHEAD
+            self._entries[key] = data
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= sys.getsizeof(evicted) + ENTRY_OVERHEAD
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._size,
+                    "max_bytes": self.max_bytes, "hits": self.hits,
+                    "misses": self.misses, "evictions": self.evictions}
+
+    def render(self):
+        """Hit/miss/eviction counters and size in Prometheus text format."""
+        stats = self.stats()
+        lines = []
+        for name, kind, help_text in (
+                ("hits", "counter", "List items served from the fragment cache."),
+                ("misses", "counter", "List items encoded and added to the fragment cache."),
+                ("evictions", "counter", "Fragments dropped to stay within max_bytes."),
+                ("entries", "gauge", "Fragments currently cached."),
+                ("bytes", "gauge", "Approximate memory held by the fragment cache.")):
+            metric = f"hbnb_fragment_cache_{name}" + ("_total" if kind == "counter" else "")
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}",
+                      f"{metric} {stats[name]}"]
+        return "\n".join(lines) + "\n"
+
+
+def entity_key(entity, fields, version=None):
+    """
+    ``row -> cache key`` for rows of ``entity`` serialized with ``fields``.
+
+    ``version(row)`` adds state that is not reflected in the row's own
+    updated_at.
+    """
+    # one string instead of (entity, fields): str caches its hash
+    prefix = f"{entity}:{','.join(fields) if fields is not None else '*'}"
+
+    def key(row):
+        updated_at = getattr(row, "updated_at", None)
+        if updated_at is None:
+            return None
+        return (prefix, row.id, updated_at, version(row) if version else None)
+    return key
+
+
+def init_app(app):
+    app.config.setdefault("FRAGMENT_CACHE_BYTES", 32 * 1024 * 1024)
+    app.extensions["hbnb_fragment_cache"] = FragmentCache(app.config["FRAGMENT_CACHE_BYTES"])
+
+
+def current_fragment_cache():
+    """The current app's FragmentCache (disabled when the app has none)."""
+    cache = current_app.extensions.get("hbnb_fragment_cache")
+    return cache if cache is not None else FragmentCache(0)
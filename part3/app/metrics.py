@@ -0,0 +1,168 @@
+#!/usr/bin/python3
+"""Request instrumentation exposed in Prometheus text format"""
+
+import threading
+import time
+from bisect import bisect_left
+
+from flask import g, request
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (cumulated only when rendered)."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, size):
+        self.counts = [0] * (size + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+
+
+class RequestMetrics:
+    """
+    Per-namespace request counters, error counters, latency histograms
+    and in-flight gauges.
+
+    Hooks are registered on the Flask app, so every flask_restx resource is
+    measured without touching the namespaces. A single lock guards the
+    counters; the hot path is a dict lookup and a bisect per request.
+    """
+
+    def __init__(self, app=None, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._requests = {}     # (namespace, method, status) -> count
+        self._errors = {}       # (namespace, method) -> count
+        self._latency = {}      # (namespace, resource, method) -> Histogram
+        self._in_flight = {}    # namespace -> gauge
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("METRICS_ENABLED", True)
+        if not app.config["METRICS_ENABLED"]:
+            return
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+
+    # ==================== Request hooks ====================
+
+    @staticmethod
+    def _labels():
+        rule = request.url_rule
+        if rule is None:
+            return "unmatched", "unmatched"
+        # /api/v1/<namespace>/... -> <namespace>
+        parts = rule.rule.split("/", 4)
+        namespace = parts[3] if len(parts) > 3 and parts[3] else "root"
+        return namespace, request.endpoint or "unknown"
+
+    def _before_request(self):
+        namespace, resource = self._labels()
+        g._metrics = [time.perf_counter(), namespace, resource, 500]
+        with self._lock:
+            self._in_flight[namespace] = self._in_flight.get(namespace, 0) + 1
+
+    def _after_request(self, response):
+        state = g.get("_metrics")
+        if state is not None:
+            state[3] = response.status_code
+        return response
+
+    def _teardown_request(self, exc=None):
+        state = g.pop("_metrics", None)
+        if state is None:
+            return
+        elapsed = time.perf_counter() - state[0]
+        _, namespace, resource, status = state
+        if exc is not None:
+            status = 500
+        self.observe(namespace, resource, request.method, status, elapsed, started=True)
+
+    def observe(self, namespace, resource, method, status, elapsed, started=False):
+        """Record one finished request."""
+        index = bisect_left(self.buckets, elapsed)
+        with self._lock:
+            if started:
+                self._in_flight[namespace] -= 1
+            key = (namespace, method, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            if status >= 500:
+                err_key = (namespace, method)
+                self._errors[err_key] = self._errors.get(err_key, 0) + 1
+            hist_key = (namespace, resource, method)
+            hist = self._latency.get(hist_key)
+            if hist is None:
+                hist = self._latency[hist_key] = Histogram(len(self.buckets))
+            hist.counts[index] += 1
+            hist.total += elapsed
+            hist.count += 1
+
+    def reset(self):
+        with self._lock:
+            self._requests.clear()
+            self._errors.clear()
+            self._latency.clear()
+            self._in_flight.clear()
+
+    # ==================== Exposition ====================
+
+    def render(self):
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            requests = sorted(self._requests.items())
+            errors = sorted(self._errors.items())
+            in_flight = sorted(self._in_flight.items())
+            latency = sorted(
+                (key, list(h.counts), h.total, h.count)
+                for key, h in self._latency.items()
+            )
+
+        lines = [
+            "# HELP hbnb_http_requests_total Total HTTP requests.",
+            "# TYPE hbnb_http_requests_total counter",
+        ]
+        for (namespace, method, status), value in requests:
+            lines.append(
+                f'hbnb_http_requests_total{{namespace="{namespace}",'
+                f'method="{method}",status="{status}"}} {value}'
+            )
+
+        lines += [
+            "# HELP hbnb_http_request_errors_total HTTP requests that ended in a 5xx.",
+            "# TYPE hbnb_http_request_errors_total counter",
+        ]
+        for (namespace, method), value in errors:
+            lines.append(
+                f'hbnb_http_request_errors_total{{namespace="{namespace}",'
+                f'method="{method}"}} {value}'
+            )
+
+        lines += [
+            "# HELP hbnb_http_requests_in_flight HTTP requests currently being served.",
+            "# TYPE hbnb_http_requests_in_flight gauge",
+        ]
+        for namespace, value in in_flight:
+            lines.append(f'hbnb_http_requests_in_flight{{namespace="{namespace}"}} {value}')
+
+        lines += [
+            "# HELP hbnb_http_request_duration_seconds HTTP request latency.",
+            "# TYPE hbnb_http_request_duration_seconds histogram",
+        ]
+        bounds = [repr(b) for b in self.buckets] + ["+Inf"]
+        for (namespace, resource, method), counts, total, count in latency:
+            labels = f'namespace="{namespace}",resource="{resource}",method="{method}"'
+            cumulative = 0
+            for bound, value in zip(bounds, counts):
+                cumulative += value
+                lines.append(
+                    f'hbnb_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f"hbnb_http_request_duration_seconds_sum{{{labels}}} {total}")
+            lines.append(f"hbnb_http_request_duration_seconds_count{{{labels}}} {count}")
+
+        return "\n".join(lines) + "\n"
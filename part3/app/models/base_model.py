@@ -2,9 +2,10 @@
 """Base model with SQLAlchemy - Task 6"""
 
 from datetime import datetime
-import uuid
 
 from app.extensions import db
+from app.models.ids import new_id
+from app.models.types import UUIDKey
 
 
 class BaseModel(db.Model):
@@ -12,7 +13,7 @@ class BaseModel(db.Model):
     
     __abstract__ = True  # This class won't create a table in DB
 
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUIDKey, primary_key=True, default=new_id)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -25,7 +26,7 @@ class BaseModel(db.Model):
         
         # Ensure id is set
         if not self.id:
-            self.id = str(uuid.uuid4())
+            self.id = new_id()
         
         # Set timestamps if not provided
         if not self.created_at:
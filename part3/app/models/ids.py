@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+"""Entity id generators: random UUIDv4 or time-ordered UUIDv7
+
+Both produce the canonical 36-character UUID string, so either works
+with text and binary key storage (app/models/types.py) and the two can
+coexist in one table.
+
+UUIDv7 (RFC 9562) starts with the 48-bit Unix time in milliseconds, so
+new ids sort after older ones: inserts append to the right edge of the
+primary-key B-tree instead of splitting pages all over it, and ordering
+by id is ordering by creation (see ``?after=`` cursor pagination). The
+trade-off is that an id reveals when its row was created.
+"""
+
+import os
+import threading
+import time
+import uuid
+
+_RAND_BITS = 74  # rand_a (12) + rand_b (62)
+_RAND_MAX = (1 << _RAND_BITS) - 1
+
+
+def uuid4_id():
+    return str(uuid.uuid4())
+
+
+class _UUID7:
+    """
+    Monotonic UUIDv7 source.
+
+    Within one millisecond the 74 random bits are increased by a random
+    step instead of being redrawn, so ids from one process always sort
+    in creation order (RFC 9562 method 2). A forked child starts over
+    with a fresh draw, so workers never continue the same sequence.
+    """
+
+    def __init__(self):
+        self._reset()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._last_rand = 0
+
+    def __call__(self):
+        ms = time.time_ns() // 1_000_000
+        rand = int.from_bytes(os.urandom(10), "big") >> (80 - _RAND_BITS)
+        with self._lock:
+            if ms <= self._last_ms:
+                # same millisecond (or the clock stepped back): keep counting
+                ms = self._last_ms
+                rand = self._last_rand + 1 + (rand >> 42)
+                if rand > _RAND_MAX:
+                    ms, rand = ms + 1, rand & _RAND_MAX
+            self._last_ms, self._last_rand = ms, rand
+        value = (ms << 80 | 0x7 << 76 | (rand >> 62) << 64
+                 | 0b10 << 62 | rand & ((1 << 62) - 1))
+        h = f"{value:032x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+uuid7_id = _UUID7()
+
+GENERATORS = {"uuid4": uuid4_id, "uuid7": uuid7_id}
+
+_generator = uuid4_id
+
+
+def new_id():
+    """A new entity id from the configured generator."""
+    return _generator()
+
+
+def use_generator(name):
+    """Select the generator new_id() uses in this process."""
+    global _generator
+    if name not in GENERATORS:
+        raise ValueError(f"ID_GENERATOR must be one of {', '.join(GENERATORS)}, not {name!r}")
+    _generator = GENERATORS[name]
+
+
+def uuid7_time(entity_id):
+    """Creation time (Unix seconds) encoded in a UUIDv7 id, None for other versions."""
+    value = uuid.UUID(entity_id)
+    return (value.int >> 80) / 1000 if value.version == 7 else None
+
+
+def configure_id_generator(app):
+    """Apply ID_GENERATOR; the setting is process-wide, the last app created wins."""
+    app.config.setdefault("ID_GENERATOR", "uuid4")
+    use_generator(app.config["ID_GENERATOR"])
@@ -6,11 +6,13 @@ import re
 from typing import Any
 from app.extensions import db
 from .base_model import BaseModel
+from .types import UUIDKey
+from .place_stats import PlaceStats  # noqa: F401 - mapped for Place.stats
 
 place_amenity = db.Table(    #Task 8, Amaal
     'place_amenity',
-    db.Column('place_id',   db.String(36), db.ForeignKey('places.id'),    primary_key=True),
-    db.Column('amenity_id', db.String(36), db.ForeignKey('amenities.id'), primary_key=True)
+    db.Column('place_id',   UUIDKey, db.ForeignKey('places.id'),    primary_key=True),
+    db.Column('amenity_id', UUIDKey, db.ForeignKey('amenities.id'), primary_key=True)
 )
 
 class Place(BaseModel):
@@ -26,6 +28,16 @@ class Place(BaseModel):
     """
 
     __tablename__ = 'places'
+    __table_args__ = (
+        # ?sort=price / ?sort=created_at read the top page straight off these
+        db.Index('ix_places_price', 'price', 'id'),
+        db.Index('ix_places_created_at', 'created_at', 'id'),
+    )
+
+    # validation bounds, also used by the bulk importer's range checks
+    PRICE_MAX = 1000000
+    LATITUDE_RANGE = (-90, 90)
+    LONGITUDE_RANGE = (-180, 180)
 
     # ==================== TASK 7: SQLAlchemy Columns ====================
     title       = db.Column(db.String(100), nullable=False)
@@ -35,11 +47,15 @@ class Place(BaseModel):
     longitude   = db.Column(db.Float,       nullable=False)
 
     # ==================== TASK 8: Relationships - Amaal ====================
-    owner_id  = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
+    owner_id  = db.Column(UUIDKey, db.ForeignKey('users.id'), nullable=False)
+    # copy of "first last" of the owner, see app/persistence/display_names.py
+    owner_name = db.Column(db.String(101), nullable=True)
     reviews   = db.relationship('Review',  backref='place', lazy=True,
                                 cascade='all, delete-orphan')
     amenities = db.relationship('Amenity', secondary=place_amenity, lazy='subquery',
                                 backref=db.backref('places', lazy=True))
+    stats     = db.relationship('PlaceStats', uselist=False, lazy=True,
+                                cascade='all, delete-orphan')
 
     def __init__(self, **kwargs):
         """
@@ -69,33 +85,34 @@ class Place(BaseModel):
             raise ValueError("Price is required")
         if self.price <= 0:
             raise ValueError("Price must be greater than 0")
-        if self.price > 1000000:
+        if self.price > self.PRICE_MAX:
             raise ValueError("Price must be under 1,000,000")
 
         # Latitude validation
         if self.latitude is None:
             raise ValueError("Latitude is required")
-        if not (-90 <= self.latitude <= 90):
+        if not (self.LATITUDE_RANGE[0] <= self.latitude <= self.LATITUDE_RANGE[1]):
             raise ValueError("Latitude must be between -90 and 90")
 
         # Longitude validation
         if self.longitude is None:
             raise ValueError("Longitude is required")
-        if not (-180 <= self.longitude <= 180):
+        if not (self.LONGITUDE_RANGE[0] <= self.longitude <= self.LONGITUDE_RANGE[1]):
             raise ValueError("Longitude must be between -180 and 180")
 
     # ============= Business Methods =============
 
     def get_average_rating(self) -> float:    #Task 8, Amaal
-        if not self.reviews:
-            return 0.0
-        return sum(r.rating for r in self.reviews) / len(self.reviews)
+        # read from place_stats instead of loading every review
+        return self.stats.rating_avg if self.stats else 0.0
 
     # ============= Serialization =============
 
     def to_dict(self) -> dict:    #Task 8, Amaal
         base_dict = super().to_dict()
-        owner_name = f"{self.owner.first_name} {self.owner.last_name}" if self.owner else None
+        owner_name = self.owner_name
+        if owner_name is None and self.owner:
+            owner_name = f"{self.owner.first_name} {self.owner.last_name}"
         base_dict.update({
             "title":       self.title,
             "description": self.description,
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+"""Materialized per-place review statistics"""
+
+from __future__ import annotations
+
+from app.extensions import db
+from .types import UUIDKey
+
+
+class PlaceStats(db.Model):
+    """
+    One row per place, kept in step with its reviews.
+
+    Maintained by app/persistence/place_stats.py in the same transaction
+    as every review insert, update and delete, so listings can show
+    ratings and counts without reading the reviews table.
+
+    Attributes:
+        review_count (int): Number of reviews
+        rating_sum (int): Sum of all ratings
+        rating_avg (float): rating_sum / review_count (0 without reviews)
+        stars_1 .. stars_5 (int): Number of reviews per star rating
+        last_review_at (datetime): created_at of the newest review
+    """
+
+    __tablename__ = 'place_stats'
+    __table_args__ = (
+        db.Index('ix_place_stats_rating', 'rating_avg', 'place_id'),
+        db.Index('ix_place_stats_reviews', 'review_count', 'place_id'),
+    )
+
+    place_id       = db.Column(UUIDKey, db.ForeignKey('places.id'), primary_key=True)
+    review_count   = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum     = db.Column(db.Integer, nullable=False, default=0)
+    rating_avg     = db.Column(db.Float,   nullable=False, default=0.0)
+    stars_1        = db.Column(db.Integer, nullable=False, default=0)
+    stars_2        = db.Column(db.Integer, nullable=False, default=0)
+    stars_3        = db.Column(db.Integer, nullable=False, default=0)
+    stars_4        = db.Column(db.Integer, nullable=False, default=0)
+    stars_5        = db.Column(db.Integer, nullable=False, default=0)
+    last_review_at = db.Column(db.DateTime, nullable=True)
+
+    @property
+    def stars(self) -> dict:
+        """Review count per star rating, {"1": n, ..., "5": n}."""
+        return {str(i): getattr(self, f"stars_{i}") for i in range(1, 6)}
+
+    def to_dict(self) -> dict:
+        return {
+            "review_count":   self.review_count,
+            "rating_avg":     round(self.rating_avg, 2),
+            "stars":          self.stars,
+            "last_review_at": self.last_review_at.isoformat() if self.last_review_at else None,
+        }
+
+    def __repr__(self) -> str:
+        return f"<PlaceStats place_id={self.place_id} count={self.review_count}>"
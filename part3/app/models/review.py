@@ -7,6 +7,7 @@ from typing import Any
 
 from app.extensions import db
 from .base_model import BaseModel
+from .types import UUIDKey
 
 
 class Review(BaseModel):
@@ -19,14 +20,25 @@ class Review(BaseModel):
     """
     
     __tablename__ = 'reviews'
+    __table_args__ = (
+        # covers the per-place COUNT/AVG(rating) aggregate
+        db.Index('ix_reviews_place_rating', 'place_id', 'rating'),
+        # one review per user and place
+        db.Index('ix_reviews_place_user', 'place_id', 'user_id', unique=True),
+    )
+
+    # validation bounds, also used by the bulk importer's range checks
+    RATING_RANGE = (1, 5)
 
     # ==================== TASK 7: SQLAlchemy Columns ====================
     text = db.Column(db.Text, nullable=False)
     rating = db.Column(db.Integer, nullable=False)
 
     # ==================== TASK 8: Foreign Keys - Amaal ====================
-    user_id  = db.Column(db.String(36), db.ForeignKey('users.id'),  nullable=False)
-    place_id = db.Column(db.String(36), db.ForeignKey('places.id'), nullable=False)
+    user_id  = db.Column(UUIDKey, db.ForeignKey('users.id'),  nullable=False)
+    place_id = db.Column(UUIDKey, db.ForeignKey('places.id'), nullable=False)
+    # copy of "first last" of the author, see app/persistence/display_names.py
+    user_name = db.Column(db.String(101), nullable=True)
 
     def __init__(self, **kwargs):
         """
@@ -50,7 +62,7 @@ class Review(BaseModel):
             raise ValueError("rating is required")
         try:
             rating_int = int(self.rating)
-            if rating_int < 1 or rating_int > 5:
+            if not (self.RATING_RANGE[0] <= rating_int <= self.RATING_RANGE[1]):
                 raise ValueError("rating must be between 1 and 5")
             self.rating = rating_int
         except (TypeError, ValueError):
@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+"""Column types shared by the models"""
+
+import uuid
+
+from sqlalchemy import LargeBinary, String
+from sqlalchemy.types import TypeDecorator
+
+# set on each engine's dialect by use_binary_keys()
+_BINARY_FLAG = "hbnb_binary_uuid_keys"
+
+
+def binary_keys(dialect):
+    """True when ``dialect`` stores UUIDKey columns as 16-byte blobs."""
+    return getattr(dialect, _BINARY_FLAG, False)
+
+
+def is_uuid(value):
+    try:
+        uuid.UUID(value)
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return True
+
+
+def uuid_bytes(value):
+    """Canonical UUID string -> 16 bytes."""
+    try:
+        return uuid.UUID(value).bytes
+    except (AttributeError, TypeError, ValueError):
+        # Not a UUID, so no stored key can equal it: keep lookups by a
+        # malformed id a plain miss (404) instead of a bind error. The
+        # padding keeps it away from the 16-byte length of real keys.
+        return ("!" + str(value)).encode().ljust(17, b"!")
+
+
+def uuid_str(value):
+    """16 bytes -> canonical UUID string (what str(uuid.UUID) returns)."""
+    h = value.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+class UUIDKey(TypeDecorator):
+    """
+    UUID primary/foreign key, always a ``str`` in Python.
+
+    Stored as 36-character text by default, or as a 16-byte blob on
+    engines configured for binary keys (ID_STORAGE = "binary"), which
+    more than halves every id in tables, foreign keys and indexes. The
+    storage belongs to the engine rather than the column, so one set of
+    models serves both layouts; text engines get no conversion at all.
+    """
+
+    impl = String(36)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if binary_keys(dialect):
+            return dialect.type_descriptor(LargeBinary(16))
+        return dialect.type_descriptor(String(36))
+
+    def bind_processor(self, dialect):
+        if not binary_keys(dialect):
+            return None
+
+        def process(value):
+            return None if value is None else uuid_bytes(value)
+        return process
+
+    def result_processor(self, dialect, coltype):
+        if not binary_keys(dialect):
+            return None
+
+        def process(value):
+            return None if value is None else uuid_str(value)
+        return process
+
+
+def use_binary_keys(engine, enabled=True):
+    """Switch an engine's UUIDKey storage; do it before its first statement."""
+    setattr(engine.dialect, _BINARY_FLAG, enabled)
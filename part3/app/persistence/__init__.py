@@ -1,2 +1,27 @@
 #!/usr/bin/python3
 """Persistence package."""
+
+
+def all_engines(app):
+    """Every engine the app owns: primary binds, read replicas and shards."""
+    from app.extensions import db
+    from app.persistence.replicas import replica_router
+    from app.persistence.sharding import shards
+
+    with app.app_context():
+        engines = list(db.engines.values()) + list(replica_router.engines().values())
+        if shards.enabled():
+            engines += shards.engines()
+    return engines
+
+
+def primary_engines(app):
+    """The engines the app writes to: primary binds and shards (no replicas)."""
+    from app.extensions import db
+    from app.persistence.sharding import shards
+
+    with app.app_context():
+        engines = list(db.engines.values())
+        if shards.enabled():
+            engines += shards.engines()
+    return engines
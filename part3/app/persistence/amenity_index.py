@@ -0,0 +1,215 @@
+#!/usr/bin/python3
+"""
+Per-amenity place bitmaps for amenity filter queries.
+
+Every place gets a dense ordinal; each amenity keeps a Python int whose
+bit ``n`` is set when the place with ordinal ``n`` has that amenity.
+"WiFi AND Pool AND Parking" is then two big-int ANDs plus decoding the
+surviving bits, instead of loading every place with its amenities.
+
+The bitmaps are built from ``place_amenity`` on first use and kept up to
+date from ORM flushes: changes are staged per session on ``after_flush``
+and applied on ``after_commit`` (dropped on rollback). The index lives in
+each process; rows written outside the ORM (raw SQL, other workers) are
+picked up on the next rebuild, which ``AMENITY_INDEX_MAX_AGE`` seconds
+(0 = never) can schedule.
+"""
+
+import threading
+import time
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, inspect as sa_inspect, select
+
+from app.extensions import db
+from app.models.amenity import Amenity
+from app.models.place import Place, place_amenity
+
+_BYTE_BITS = [tuple(i for i in range(8) if byte >> i & 1) for byte in range(256)]
+
+
+def bit_positions(bitmap):
+    """Positions of the set bits of ``bitmap``, ascending."""
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    return [(index << 3) + bit
+            for index, byte in enumerate(data) if byte
+            for bit in _BYTE_BITS[byte]]
+
+
+class AmenityBitmaps:
+    """Place ordinals and one bitmap per amenity."""
+
+    def __init__(self):
+        self.ordinals = {}      # place_id -> ordinal
+        self.place_ids = []     # ordinal -> place_id (None once deleted)
+        self.bitmaps = {}       # amenity_id -> int
+        self.built_at = time.monotonic()
+
+    def _ordinal(self, place_id):
+        ordinal = self.ordinals.get(place_id)
+        if ordinal is None:
+            ordinal = self.ordinals[place_id] = len(self.place_ids)
+            self.place_ids.append(place_id)
+        return ordinal
+
+    def load(self, pairs):
+        """
+        Bulk-add (place_id, amenity_id) pairs.
+
+        Bits are set in a bytearray per amenity and converted once; OR-ing
+        into an int per row would copy the whole bitmap every time.
+        """
+        arrays = {}
+        for place_id, amenity_id in pairs:
+            ordinal = self._ordinal(place_id)
+            array = arrays.get(amenity_id)
+            if array is None:
+                array = arrays[amenity_id] = bytearray()
+            byte = ordinal >> 3
+            if byte >= len(array):
+                array.extend(bytes(byte + 1 - len(array)))
+            array[byte] |= 1 << (ordinal & 7)
+        for amenity_id, array in arrays.items():
+            bitmap = int.from_bytes(array, "little")
+            self.bitmaps[amenity_id] = self.bitmaps.get(amenity_id, 0) | bitmap
+
+    def add(self, place_id, amenity_id):
+        bit = 1 << self._ordinal(place_id)
+        self.bitmaps[amenity_id] = self.bitmaps.get(amenity_id, 0) | bit
+
+    def discard(self, place_id, amenity_id):
+        ordinal = self.ordinals.get(place_id)
+        if ordinal is not None and amenity_id in self.bitmaps:
+            self.bitmaps[amenity_id] &= ~(1 << ordinal)
+
+    def drop_place(self, place_id):
+        ordinal = self.ordinals.pop(place_id, None)
+        if ordinal is None:
+            return
+        self.place_ids[ordinal] = None
+        mask = ~(1 << ordinal)
+        for amenity_id, bitmap in self.bitmaps.items():
+            if bitmap >> ordinal & 1:
+                self.bitmaps[amenity_id] = bitmap & mask
+
+    def drop_amenity(self, amenity_id):
+        self.bitmaps.pop(amenity_id, None)
+
+    def match_all(self, amenity_ids):
+        """Ids of the places that have every amenity in ``amenity_ids``."""
+        if not amenity_ids:
+            return []
+        bitmaps = sorted((self.bitmaps.get(a, 0) for a in amenity_ids), key=int.bit_count)
+        result = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            if not result:
+                break
+            result &= bitmap
+        place_ids = self.place_ids
+        return [place_ids[n] for n in bit_positions(result)]
+
+    def stats(self):
+        return {
+            "places": len(self.ordinals),
+            "amenities": len(self.bitmaps),
+            "bytes": sum((b.bit_length() + 7) // 8 for b in self.bitmaps.values()),
+        }
+
+
+class AmenityIndex:
+    """
+    Flask extension owning one AmenityBitmaps per application.
+
+    ``places_with(amenity_ids)`` is the query entry point; it builds the
+    bitmaps from ``place_amenity`` the first time it is called.
+    """
+
+    _listening = False
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("AMENITY_INDEX_MAX_AGE", 0)
+        app.extensions["amenity_index"] = None
+        if not AmenityIndex._listening:
+            event.listen(db.session, "after_flush", self._after_flush)
+            event.listen(db.session, "after_commit", self._after_commit)
+            event.listen(db.session, "after_soft_rollback", self._after_rollback)
+            AmenityIndex._listening = True
+
+    # ==================== Building ====================
+
+    def bitmaps(self):
+        """The current app's bitmaps, (re)built from the database when needed."""
+        app = current_app._get_current_object()
+        index = app.extensions.get("amenity_index")
+        max_age = app.config.get("AMENITY_INDEX_MAX_AGE") or 0
+        if index is None or (max_age and time.monotonic() - index.built_at > max_age):
+            with self._lock:
+                index = app.extensions.get("amenity_index")
+                if index is None or (max_age and time.monotonic() - index.built_at > max_age):
+                    index = app.extensions["amenity_index"] = self.build()
+        return index
+
+    @staticmethod
+    def build():
+        index = AmenityBitmaps()
+        index.load(db.session.execute(
+            select(place_amenity.c.place_id, place_amenity.c.amenity_id)
+            .order_by(place_amenity.c.place_id)
+        ))
+        return index
+
+    def invalidate(self):
+        """Force a rebuild on the next query (e.g. after a bulk SQL import)."""
+        current_app.extensions["amenity_index"] = None
+
+    def places_with(self, amenity_ids):
+        """Ids of the places having all of ``amenity_ids``."""
+        return self.bitmaps().match_all(amenity_ids)
+
+    # ==================== Session events ====================
+
+    @staticmethod
+    def _after_flush(session, flush_context):
+        changes = session.info.setdefault("amenity_index_changes", [])
+        for obj in session.new | session.dirty:
+            if not isinstance(obj, Place):
+                continue
+            history = sa_inspect(obj).attrs.amenities.history
+            changes.extend(("add", obj.id, a.id) for a in history.added)
+            changes.extend(("discard", obj.id, a.id) for a in history.deleted)
+        for obj in session.deleted:
+            if isinstance(obj, Place):
+                changes.append(("drop_place", obj.id, None))
+            elif isinstance(obj, Amenity):
+                changes.append(("drop_amenity", None, obj.id))
+
+    def _after_commit(self, session):
+        changes = session.info.pop("amenity_index_changes", None)
+        if not changes or not has_app_context():
+            return
+        with self._lock:
+            index = current_app.extensions.get("amenity_index")
+            if index is None:
+                return  # not built yet; the first query reads the committed rows
+            for op, place_id, amenity_id in changes:
+                if op == "add":
+                    index.add(place_id, amenity_id)
+                elif op == "discard":
+                    index.discard(place_id, amenity_id)
+                elif op == "drop_place":
+                    index.drop_place(place_id)
+                else:
+                    index.drop_amenity(amenity_id)
+
+    @staticmethod
+    def _after_rollback(session, previous_transaction):
+        if previous_transaction.parent is None:
+            session.info.pop("amenity_index_changes", None)
+
+
+amenity_index = AmenityIndex()
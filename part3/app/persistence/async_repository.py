@@ -0,0 +1,139 @@
+#!/usr/bin/python3
+"""Async SQLAlchemy repository for the read-only ASGI API."""
+
+from sqlalchemy import inspect as sa_inspect, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import joinedload, lazyload, load_only
+
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from app.persistence import full_text
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url):
+    """Map a sync database URL onto its asyncio driver."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver configured for '{backend}'")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+def create_async_sessionmaker(url, **engine_options):
+    """Async engine + sessionmaker over the same database as the sync app."""
+    engine = create_async_engine(to_async_url(url), **engine_options)
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+class AsyncSQLAlchemyRepository:
+    """
+    Read-only async counterpart of SQLAlchemyRepository.
+
+    Shares the mapped classes in app.models. Relationships are never lazy
+    loaded (that would need a greenlet), so everything a serializer touches
+    has to come from load_options/iter_options.
+    """
+
+    def __init__(self, model, sessionmaker):
+        self.model = model
+        self.sessionmaker = sessionmaker
+
+    async def get(self, obj_id, fields=None):
+        async with self.sessionmaker() as session:
+            return await session.get(
+                self.model, obj_id,
+                options=[*self.load_options(fields), *self.iter_options(fields)],
+            )
+
+    async def get_all(self, fields=None):
+        return [obj async for obj in self.iter_all(fields=fields)]
+
+    async def iter_all(self, batch_size=500, fields=None):
+        """Yield every row, streaming batch_size rows at a time."""
+        stmt = (
+            select(self.model)
+            .options(*self.load_options(fields), *self.iter_options(fields))
+            .execution_options(yield_per=batch_size)
+        )
+        async with self.sessionmaker() as session:
+            result = await session.stream_scalars(stmt)
+            async for obj in result:
+                yield obj
+
+    async def get_by_attribute(self, attr_name, attr_value, fields=None):
+        if not hasattr(self.model, attr_name):
+            return []
+        stmt = (
+            select(self.model)
+            .where(getattr(self.model, attr_name) == attr_value)
+            .options(*self.load_options(fields), *self.iter_options(fields))
+        )
+        async with self.sessionmaker() as session:
+            return list((await session.scalars(stmt)).all())
+
+    def load_options(self, fields=None):
+        """Restrict the SELECT to the mapped columns named in ``fields``."""
+        if not fields:
+            return []
+        column_attrs = sa_inspect(self.model).column_attrs
+        columns = [getattr(self.model, f) for f in fields if f in column_attrs]
+        return [load_only(self.model.id, *columns)]
+
+    def iter_options(self, fields=None):
+        return ()
+
+
+class AsyncUserRepository(AsyncSQLAlchemyRepository):
+    def __init__(self, sessionmaker):
+        super().__init__(User, sessionmaker)
+
+
+class AsyncPlaceRepository(AsyncSQLAlchemyRepository):
+    def __init__(self, sessionmaker):
+        super().__init__(Place, sessionmaker)
+
+    def iter_options(self, fields=None):
+        options = [lazyload(Place.amenities)]
+        if fields is None or {"review_count", "rating_avg", "stars", "last_review_at"} & set(fields):
+            options.append(joinedload(Place.stats))
+        if fields is None or "owner_name" in fields:
+            # rows predating places.owner_name fall back to the owner
+            options.append(joinedload(Place.owner).load_only(User.first_name, User.last_name))
+        return options
+
+
+    async def search(self, query, limit=20, offset=0):
+        """Ranked full-text search over title and description."""
+        async with self.sessionmaker() as session:
+            return await full_text.search_async(session, "places", query, limit, offset)
+
+
+class AsyncReviewRepository(AsyncSQLAlchemyRepository):
+    def __init__(self, sessionmaker):
+        super().__init__(Review, sessionmaker)
+
+    def iter_options(self, fields=None):
+        # rows predating reviews.user_name fall back to the user, and the
+        # async path cannot lazy load it
+        if fields is not None and "user_name" not in fields:
+            return ()
+        return (joinedload(Review.user).load_only(User.first_name, User.last_name),)
+
+    async def search(self, query, limit=20, offset=0):
+        """Ranked full-text search over review text."""
+        async with self.sessionmaker() as session:
+            return await full_text.search_async(session, "reviews", query, limit, offset)
+
+
+class AsyncAmenityRepository(AsyncSQLAlchemyRepository):
+    def __init__(self, sessionmaker):
+        super().__init__(Amenity, sessionmaker)
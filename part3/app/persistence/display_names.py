@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+"""
+Denormalized display names: places.owner_name and reviews.user_name.
+
+Listings render the owner/author name from these columns instead of
+joining (or lazy loading) users per row. Mapper events keep them right:
+
+- on insert, and when owner_id/user_id changes, the name is copied from
+  the user row;
+- when a user's first or last name changes, one bulk UPDATE per table
+  rewrites every copy (and bumps updated_at) inside the same flush.
+  Shards are not part of that flush; the facade runs the same
+  rename_copies() statements on each of them.
+
+Databases created before the columns existed get them from
+add_display_name_columns(), which create_app() runs on startup; the
+copies stay NULL until backfill_display_names() fills them, and
+serializers read the owner/author for NULL names meanwhile.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import event, inspect as sa_inspect, select, text, update
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+
+DISPLAY_NAME_COLUMNS = ((Place, "owner_name", "owner_id"),
+                        (Review, "user_name", "user_id"))
+
+
+def display_name(first_name, last_name):
+    return f"{first_name} {last_name}"
+
+
+def _name_of(connection, user_id):
+    row = connection.execute(
+        select(User.first_name, User.last_name).where(User.id == user_id)
+    ).first()
+    return display_name(*row) if row else None
+
+
+def _copy_name(column, fk):
+    def listener(mapper, connection, target):
+        state = sa_inspect(target)
+        fk_changed = state.attrs[fk].history.has_changes()
+        if getattr(target, column) is None or fk_changed:
+            setattr(target, column, _name_of(connection, getattr(target, fk)))
+    return listener
+
+
+for _model, _column, _fk in DISPLAY_NAME_COLUMNS:
+    event.listen(_model, "before_insert", _copy_name(_column, _fk))
+    event.listen(_model, "before_update", _copy_name(_column, _fk))
+
+
+def rename_copies(model, user_id, name):
+    """Bulk UPDATE setting user_id's name copies in ``model``'s table (and bumping updated_at)."""
+    column, fk = next((c, f) for m, c, f in DISPLAY_NAME_COLUMNS if m is model)
+    table = model.__table__
+    return (
+        update(table)
+        .where(table.c[fk] == user_id)
+        .values({column: name, "updated_at": datetime.utcnow()})
+    )
+
+
+@event.listens_for(User, "after_update")
+def _propagate_rename(mapper, connection, user):
+    state = sa_inspect(user)
+    if not (state.attrs.first_name.history.has_changes()
+            or state.attrs.last_name.history.has_changes()):
+        return
+    name = display_name(user.first_name, user.last_name)
+    for model, _, _ in DISPLAY_NAME_COLUMNS:
+        connection.execute(rename_copies(model, user.id, name))
+
+
+def add_display_name_columns(engine):
+    """
+    ALTER TABLE ... ADD COLUMN for the display name columns missing on
+    ``engine`` (tables that do not exist yet are left to create_all).
+
+    Returns the "table.column" names added.
+    """
+    added = []
+    with engine.begin() as connection:
+        inspector = sa_inspect(connection)
+        for model, column, _ in DISPLAY_NAME_COLUMNS:
+            table = model.__tablename__
+            if not inspector.has_table(table):
+                continue
+            if column in {c["name"] for c in inspector.get_columns(table)}:
+                continue
+            column_type = model.__table__.c[column].type.compile(engine.dialect)
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"))
+            added.append(f"{table}.{column}")
+    return added
+
+
+def backfill_display_names(session):
+    """Fill NULL owner_name/user_name from users. The caller commits."""
+    for model, column, fk in DISPLAY_NAME_COLUMNS:
+        table = model.__table__
+        users = User.__table__
+        name = (
+            select(users.c.first_name + " " + users.c.last_name)
+            .where(users.c.id == table.c[fk])
+            .scalar_subquery()
+        )
+        session.execute(update(table).where(table.c[column].is_(None)).values({column: name}))
+
+
+def ensure_display_names(engine):
+    """Add any missing display name column on ``engine`` and backfill the NULL copies."""
+    added = add_display_name_columns(engine)
+    with Session(engine) as session:
+        backfill_display_names(session)
+        session.commit()
+    return added
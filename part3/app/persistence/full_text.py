@@ -0,0 +1,158 @@
+#!/usr/bin/python3
+"""Full-text search over places and reviews with SQLite FTS5.
+
+places_fts and reviews_fts are external-content FTS5 tables keyed by the
+base table rowid and kept in sync by triggers. The same DDL lives in
+sql_scripts/schema.sql; here it is attached to the SQLAlchemy tables so
+db.create_all()/drop_all() manage it too.
+
+Databases created before the index existed get it from
+ensure_search_index() (upgrade_database.py). VACUUM may renumber rowids
+of tables without an INTEGER PRIMARY KEY, so run rebuild_search_index()
+after a VACUUM.
+"""
+
+import re
+
+from sqlalchemy import DDL, event, text
+from sqlalchemy.orm import Session
+
+from app.models.place import Place
+from app.models.review import Review
+from app.models.types import UUIDKey
+
+FTS_TABLES = {
+    "places": ("places_fts", ("title", "description")),
+    "reviews": ("reviews_fts", ("text",)),
+}
+
+SNIPPET_OPEN = "<mark>"
+SNIPPET_CLOSE = "</mark>"
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def fts_ddl(table):
+    """CREATE statements for one table's FTS index and sync triggers."""
+    fts, columns = FTS_TABLES[table]
+    cols = ", ".join(columns)
+    new_vals = ", ".join(f"new.{c}" for c in columns)
+    old_vals = ", ".join(f"old.{c}" for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{cols}, content='{table}', content_rowid='rowid', tokenize='porter unicode61')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new_vals}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old_vals}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old_vals}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new_vals}); END",
+    ]
+
+
+def _register(model):
+    table = model.__tablename__
+    fts, _ = FTS_TABLES[table]
+    for statement in fts_ddl(table):
+        event.listen(model.__table__, "after_create",
+                     DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(model.__table__, "before_drop",
+                 DDL(f"DROP TABLE IF EXISTS {fts}").execute_if(dialect="sqlite"))
+
+
+_register(Place)
+_register(Review)
+
+
+def match_expression(query):
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Every word is quoted (so FTS operators in user input are inert) and
+    the words are ANDed; the last word also matches as a prefix.
+    """
+    terms = _TERM_RE.findall(query or "")
+    if not terms:
+        return None
+    quoted = [f'"{t}"' for t in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def rebuild_search_index(session):
+    """Rebuild both FTS indexes from their content tables."""
+    for fts, _ in FTS_TABLES.values():
+        session.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+    session.commit()
+
+
+def ensure_search_index(engine):
+    """Create any missing FTS table or trigger on ``engine`` and reindex every row."""
+    if engine.dialect.name != "sqlite":
+        return
+    with Session(engine) as session:
+        for table in FTS_TABLES:
+            for statement in fts_ddl(table):
+                session.execute(text(statement))
+        rebuild_search_index(session)
+
+
+# .columns() marks the statements as SELECTs, so they can run on a read replica;
+# typing the keys converts them back to strings on binary-key engines
+PLACE_SEARCH_SQL = text(f"""
+    SELECT p.id, p.title, p.price,
+           snippet(places_fts, -1, '{SNIPPET_OPEN}', '{SNIPPET_CLOSE}', '…', 12) AS snippet,
+           bm25(places_fts, 10.0, 1.0) AS score
+    FROM places_fts
+    JOIN places p ON p.rowid = places_fts.rowid
+    WHERE places_fts MATCH :match
+    ORDER BY score
+    LIMIT :limit OFFSET :offset
+""").columns(id=UUIDKey)
+
+REVIEW_SEARCH_SQL = text(f"""
+    SELECT r.id, r.place_id, r.rating,
+           snippet(reviews_fts, 0, '{SNIPPET_OPEN}', '{SNIPPET_CLOSE}', '…', 12) AS snippet,
+           bm25(reviews_fts) AS score
+    FROM reviews_fts
+    JOIN reviews r ON r.rowid = reviews_fts.rowid
+    WHERE reviews_fts MATCH :match
+    ORDER BY score
+    LIMIT :limit OFFSET :offset
+""").columns(id=UUIDKey, place_id=UUIDKey)
+
+
+def _search_statements(table):
+    """(count statement, page statement) for ``table``."""
+    fts, _ = FTS_TABLES[table]
+    count = text(f"SELECT count(*) FROM {fts} WHERE {fts} MATCH :match").columns()
+    return count, PLACE_SEARCH_SQL if table == "places" else REVIEW_SEARCH_SQL
+
+
+def search(session, table, query, limit, offset):
+    """
+    Ranked search over ``places`` or ``reviews``.
+
+    Returns:
+        (total, rows): total matches and the requested page of row dicts,
+        best match first (lower bm25 score is better).
+    """
+    match = match_expression(query)
+    if match is None:
+        return 0, []
+    count, sql = _search_statements(table)
+    total = session.execute(count, {"match": match}).scalar()
+    rows = session.execute(sql, {"match": match, "limit": limit, "offset": offset})
+    return total, [dict(row._mapping) for row in rows]
+
+
+async def search_async(session, table, query, limit, offset):
+    """search() on an AsyncSession."""
+    match = match_expression(query)
+    if match is None:
+        return 0, []
+    count, sql = _search_statements(table)
+    total = (await session.execute(count, {"match": match})).scalar()
+    rows = await session.execute(sql, {"match": match, "limit": limit, "offset": offset})
+    return total, [dict(row._mapping) for row in rows]
@@ -1,6 +1,8 @@
 #!/usr/bin/python3
 """In-memory repository (temporary fallback)."""
 
+from datetime import datetime
+
 from app.persistence.repository import Repository
 
 
@@ -12,12 +14,34 @@ class InMemoryRepository(Repository):
         self._storage[getattr(obj, "id")] = obj
         return obj
 
-    def get(self, obj_id):
+    def add_many(self, objs):
+        for obj in objs:
+            self.add(obj)
+        return objs
+
+    def get(self, obj_id, fields=None):
         return self._storage.get(obj_id)
 
-    def get_all(self):
+    def get_many(self, ids, fields=None):
+        return [self._storage.get(i) for i in ids]
+
+    def get_all(self, fields=None):
         return list(self._storage.values())
 
+    def iter_all(self, batch_size=500, fields=None):
+        return iter(list(self._storage.values()))
+
+    def iter_by_ids(self, ids, batch_size=500, fields=None):
+        return iter([self._storage[i] for i in ids if i in self._storage])
+
+    def iter_row_batches(self, columns, batch_size=1000):
+        rows = [tuple(getattr(obj, c) for c in columns) for obj in self._storage.values()]
+        return (rows[i:i + batch_size] for i in range(0, len(rows), batch_size))
+
+    def get_after(self, after=None, limit=20, fields=None):
+        ids = sorted(i for i in self._storage if not after or i > after)
+        return [self._storage[i] for i in ids[:limit]]
+
     def update(self, obj_id, data):
         obj = self.get(obj_id)
         if not obj:
@@ -26,6 +50,8 @@ class InMemoryRepository(Repository):
         for key, value in data.items():
             if hasattr(obj, key):
                 setattr(obj, key, value)
+        # no ORM onupdate here; cached fragments are keyed on updated_at
+        obj.updated_at = datetime.utcnow()
         return obj
 
     def delete(self, obj_id):
@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+"""UUID key storage: text or binary, per app, and copying between the two.
+
+Which layout an engine uses is set once when the app is created
+(ID_STORAGE, see app/models/types.py). A database keeps the layout it
+was created with, so switching an existing one means copying it:
+``copy_database()`` reads every table through an engine configured for
+the old layout and writes it through one configured for the new one,
+letting UUIDKey convert the keys. migrate_id_storage.py wraps it for
+SQLite files.
+"""
+
+from sqlalchemy import LargeBinary, inspect as sa_inspect, insert, select
+
+from app.extensions import db
+from app.persistence import full_text  # noqa: F401 - FTS tables/triggers on create_all
+from app.models.types import UUIDKey, binary_keys, is_uuid, use_binary_keys
+
+STORAGES = ("text", "binary")
+
+
+def configure_key_storage(app):
+    """Apply ID_STORAGE to every engine of the app (primary, replicas, shards)."""
+    app.config.setdefault("ID_STORAGE", "text")
+    storage = app.config["ID_STORAGE"]
+    if storage not in STORAGES:
+        raise ValueError(f"ID_STORAGE must be one of {', '.join(STORAGES)}, not {storage!r}")
+    from app.persistence import all_engines
+    for engine in all_engines(app):
+        use_binary_keys(engine, storage == "binary")
+
+
+def detect_storage(engine):
+    """Layout of the database behind ``engine`` ("text"/"binary"), None if it has no tables."""
+    inspector = sa_inspect(engine)
+    if not inspector.has_table("users"):
+        return None
+    column = next(c for c in inspector.get_columns("users") if c["name"] == "id")
+    return "binary" if isinstance(column["type"], LargeBinary) else "text"
+
+
+def copy_database(source, target, batch_size=5000, progress=None):
+    """
+    Copy every model table from ``source`` into a fresh ``target``.
+
+    Both engines must already be set to their layouts (use_binary_keys).
+    Tables are created on the target first, so the FTS indexes and their
+    triggers come along and fill as rows arrive. A binary target only
+    accepts real UUIDs: a non-UUID key raises ValueError before anything
+    is committed.
+
+    Returns:
+        dict: table name -> rows copied.
+    """
+    db.metadata.create_all(target)
+    check = binary_keys(target.dialect)
+    counts = {}
+    with source.connect() as reader, target.begin() as writer:
+        for table in db.metadata.sorted_tables:
+            keys = [c.name for c in table.columns if isinstance(c.type, UUIDKey)]
+            result = reader.execution_options(yield_per=batch_size).execute(select(table))
+            counts[table.name] = 0
+            for rows in result.partitions():
+                rows = [row._asdict() for row in rows]
+                if check:
+                    for row in rows:
+                        for key in keys:
+                            if row[key] is not None and not is_uuid(row[key]):
+                                raise ValueError(f"{table.name}.{key} {row[key]!r} is not a UUID")
+                writer.execute(insert(table), rows)
+                counts[table.name] += len(rows)
+                if progress is not None:
+                    progress(table.name, counts[table.name])
+    return counts
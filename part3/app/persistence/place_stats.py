@@ -0,0 +1,216 @@
+#!/usr/bin/python3
+"""
+Keep place_stats in step with reviews.
+
+An ``after_flush`` listener turns the reviews inserted, updated and
+deleted by each flush into per-place deltas and applies them with one
+UPDATE per place on the flush's connection, so the counters commit or
+roll back together with the reviews. New places get a zeroed row.
+A place without a row (e.g. inserted with raw SQL) has its row
+recomputed from ``reviews``; rebuild_place_stats() repairs everything,
+and ensure_place_stats() adds the table to databases created without it.
+"""
+
+from collections import defaultdict
+
+from sqlalchemy import case, event, func, insert, inspect as sa_inspect, select, update
+from sqlalchemy.orm import Session
+
+from app.extensions import db
+from app.models.place import Place
+from app.models.place_stats import PlaceStats
+from app.models.review import Review
+
+STAR_COLUMNS = [f"stars_{i}" for i in range(1, 6)]
+
+
+def _aggregate_select(place_ids=None):
+    """SELECT producing place_stats rows from places LEFT JOIN reviews."""
+    stmt = (
+        select(
+            Place.id,
+            func.count(Review.id),
+            func.coalesce(func.sum(Review.rating), 0),
+            func.coalesce(func.avg(Review.rating), 0.0),
+            *[func.count(case((Review.rating == i, 1))) for i in range(1, 6)],
+            func.max(Review.created_at),
+        )
+        .select_from(Place)
+        .outerjoin(Review, Review.place_id == Place.id)
+        .group_by(Place.id)
+    )
+    if place_ids is not None:
+        stmt = stmt.where(Place.id.in_(place_ids))
+    return stmt
+
+
+_STATS_COLUMNS = ["place_id", "review_count", "rating_sum", "rating_avg",
+                  *STAR_COLUMNS, "last_review_at"]
+
+
+def rebuild_place_stats(session, place_ids=None):
+    """
+    Recompute place_stats from reviews (all places, or just place_ids).
+
+    Returns the number of rows written. The caller commits.
+    """
+    table = PlaceStats.__table__
+    delete = table.delete()
+    if place_ids is not None:
+        delete = delete.where(table.c.place_id.in_(place_ids))
+    session.execute(delete)
+    result = session.execute(
+        insert(table).from_select(_STATS_COLUMNS, _aggregate_select(place_ids))
+    )
+    return result.rowcount
+
+
+def find_drift(session):
+    """Place ids whose stored stats differ from (or are missing for) their reviews."""
+    expected = _aggregate_select().subquery()
+    stored = PlaceStats.__table__
+    columns = list(expected.c)
+    mismatch = (
+        (stored.c.place_id.is_(None))
+        | (stored.c.review_count != columns[1])
+        | (stored.c.rating_sum != columns[2])
+        | stored.c.last_review_at.is_distinct_from(columns[9])
+    )
+    for star, column in zip(STAR_COLUMNS, columns[4:9]):
+        mismatch = mismatch | (stored.c[star] != column)
+    rows = session.execute(
+        select(columns[0])
+        .select_from(expected.outerjoin(stored, stored.c.place_id == columns[0]))
+        .where(mismatch)
+    )
+    return [row[0] for row in rows]
+
+
+def ensure_place_stats(engine):
+    """
+    Create place_stats on ``engine`` if it is missing and fill in the
+    rows that are missing or drifted.
+
+    Returns the number of places whose stats were (re)computed.
+    """
+    with Session(engine) as session:
+        created = not sa_inspect(session.connection()).has_table(PlaceStats.__tablename__)
+        PlaceStats.__table__.create(session.connection(), checkfirst=True)
+        if created:
+            rows = rebuild_place_stats(session)
+        else:
+            drifted = find_drift(session)
+            rows = rebuild_place_stats(session, drifted) if drifted else 0
+        session.commit()
+    return rows
+
+
+# ==================== Flush listener ====================
+
+class _Delta:
+    __slots__ = ("count", "total", "stars", "newest", "recheck_newest")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.stars = [0] * 5
+        self.newest = None
+        self.recheck_newest = False
+
+    def add(self, rating, created_at, sign):
+        self.count += sign
+        self.total += sign * rating
+        self.stars[rating - 1] += sign
+        if sign > 0 and created_at is not None:
+            self.newest = max(self.newest or created_at, created_at)
+        elif sign < 0:
+            self.recheck_newest = True
+
+
+def _old_value(state, key):
+    """Value of ``key`` as of the last flush (before this one's changes)."""
+    history = state.attrs[key].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(state.obj(), key)
+
+
+def _collect(session):
+    deltas = defaultdict(_Delta)
+    new_places, deleted_places = set(), set()
+
+    for obj in session.new:
+        if isinstance(obj, Review):
+            deltas[obj.place_id].add(obj.rating, obj.created_at, +1)
+        elif isinstance(obj, Place):
+            new_places.add(obj.id)
+
+    for obj in session.dirty:
+        if not isinstance(obj, Review):
+            continue
+        state = sa_inspect(obj)
+        old_rating = _old_value(state, "rating")
+        old_place = _old_value(state, "place_id")
+        if old_rating == obj.rating and old_place == obj.place_id:
+            continue
+        deltas[old_place].add(old_rating, None, -1)
+        deltas[obj.place_id].add(obj.rating, obj.created_at, +1)
+
+    for obj in session.deleted:
+        if isinstance(obj, Review):
+            state = sa_inspect(obj)
+            deltas[_old_value(state, "place_id")].add(_old_value(state, "rating"), None, -1)
+        elif isinstance(obj, Place):
+            deleted_places.add(obj.id)
+
+    return deltas, new_places, deleted_places
+
+
+def _apply(connection, place_id, delta):
+    table = PlaceStats.__table__
+    c = table.c
+    values = {
+        "review_count": c.review_count + delta.count,
+        "rating_sum": c.rating_sum + delta.total,
+        "rating_avg": case(
+            (c.review_count + delta.count > 0,
+             (c.rating_sum + delta.total) * 1.0 / (c.review_count + delta.count)),
+            else_=0.0,
+        ),
+    }
+    for star, change in zip(STAR_COLUMNS, delta.stars):
+        if change:
+            values[star] = c[star] + change
+    if delta.recheck_newest:
+        values["last_review_at"] = (
+            select(func.max(Review.created_at))
+            .where(Review.place_id == place_id)
+            .scalar_subquery()
+        )
+    elif delta.newest is not None:
+        values["last_review_at"] = case(
+            (c.last_review_at.is_(None), delta.newest),
+            (c.last_review_at < delta.newest, delta.newest),
+            else_=c.last_review_at,
+        )
+    result = connection.execute(update(table).where(c.place_id == place_id).values(values))
+    if result.rowcount == 0:
+        # no row yet: derive it from the (already flushed) reviews
+        connection.execute(
+            insert(table).from_select(_STATS_COLUMNS, _aggregate_select([place_id]))
+        )
+
+
+@event.listens_for(db.session, "after_flush")
+def apply_after_flush(session, flush_context):
+    """after_flush listener; also registered on the shard sessions."""
+    deltas, new_places, deleted_places = _collect(session)
+    if not (deltas or new_places):
+        return
+    connection = session.connection()
+    for place_id in new_places - set(deltas):
+        connection.execute(insert(PlaceStats.__table__).values(place_id=place_id))
+    for place_id, delta in deltas.items():
+        if place_id in deleted_places:
+            continue
+        _apply(connection, place_id, delta)
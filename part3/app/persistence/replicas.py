@@ -0,0 +1,182 @@
+#!/usr/bin/python3
+"""
+Read-replica routing for db.session.
+
+Each URI in ``SQLALCHEMY_REPLICAS`` gets an engine named ``replica_0``,
+``replica_1``... (kept out of SQLALCHEMY_BINDS, so create_all() and the
+models only see the primary). RoutingSession sends a SELECT to a replica
+only while handling a GET/HEAD request; the replica is picked once per
+request among those within the endpoint's lag tolerance. Everything else
+runs on the primary:
+
+    - INSERT/UPDATE/DELETE and every statement issued during a flush
+    - all statements of write requests and outside requests (scripts)
+    - reads after the request's first flush (read-your-writes)
+
+Tolerance is ``REPLICA_MAX_LAG`` seconds, overridden per Flask endpoint
+by ``REPLICA_ENDPOINT_MAX_LAG`` (0 pins an endpoint to the primary).
+
+With a SQLite primary, SQLite replicas are copies refreshed by
+``replica_router.sync()`` through the sqlite3 backup API (every
+``REPLICA_SYNC_INTERVAL`` seconds in a background thread, or on demand);
+their lag is the time since the last copy started, and they are not used
+before the first one. A file copy records that time as its mtime, so
+processes forked from the one running the sync (serve.py workers) see
+the same lag; in-memory copies keep it in this process only. Other replicas are assumed to be kept current by
+the database's own replication and count as lag 0.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+
+from flask import current_app, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+
+READ_METHODS = frozenset(("GET", "HEAD"))
+NAME_PREFIX = "replica_"
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_url(app, uri):
+    """URL for ``uri``; relative SQLite paths live in the instance folder, as for db."""
+    url = make_url(uri)
+    if url.drivername.startswith("sqlite") and url.database not in (None, "", ":memory:") \
+            and not os.path.isabs(url.database):
+        url = url.set(database=os.path.join(app.instance_path, url.database))
+    return url
+
+
+class RoutingSession(Session):
+    """db.session class sending request-time SELECTs to a replica."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and getattr(clause, "is_select", False):
+            replica = replica_router.pick(self)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_primary(session, flush_context):
+    session.info["replica_bind"] = None
+
+
+class ReplicaRouter:
+    """Flask extension owning the replica engines and their sync state."""
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("SQLALCHEMY_REPLICAS", [])
+        app.config.setdefault("REPLICA_MAX_LAG", 5.0)
+        app.config.setdefault("REPLICA_ENDPOINT_MAX_LAG", {})
+        app.config.setdefault("REPLICA_SYNC_INTERVAL", 0)
+
+        urls = {f"{NAME_PREFIX}{n}": resolve_url(app, uri)
+                for n, uri in enumerate(app.config["SQLALCHEMY_REPLICAS"])}
+        engines = {name: create_engine(url) for name, url in urls.items()}
+        files = {name: url.database for name, url in urls.items()
+                 if url.drivername.startswith("sqlite") and url.database not in (None, "", ":memory:")}
+        app.extensions["replicas"] = {"engines": engines, "files": files, "synced_at": {}}
+        if not engines:
+            return
+
+        app.before_request(self._reset)
+        interval = app.config["REPLICA_SYNC_INTERVAL"]
+        if interval:
+            threading.Thread(target=self._sync_loop, args=(app, interval),
+                             name="replica-sync", daemon=True).start()
+
+    @staticmethod
+    def _primary():
+        return current_app.extensions["sqlalchemy"].engine
+
+    @staticmethod
+    def engines():
+        """Replica name -> engine for the current app."""
+        return current_app.extensions["replicas"]["engines"]
+
+    # ==================== Routing ====================
+
+    @staticmethod
+    def _reset():
+        # the session outlives the request when an app context is reused
+        current_app.extensions["sqlalchemy"].session.info.pop("replica_bind", None)
+
+    def max_lag(self):
+        """Lag tolerance (seconds) of the current request's endpoint."""
+        config = current_app.config
+        return config["REPLICA_ENDPOINT_MAX_LAG"].get(request.endpoint, config["REPLICA_MAX_LAG"])
+
+    def lag(self, name):
+        """Seconds a replica may be behind the primary (inf if never synced)."""
+        if not self._managed(name):
+            return 0.0
+        state = current_app.extensions["replicas"]
+        synced_at = state["synced_at"].get(name)
+        if name in state["files"]:
+            try:
+                synced_at = os.stat(state["files"][name]).st_mtime
+            except FileNotFoundError:
+                synced_at = None
+        return float("inf") if synced_at is None else time.time() - synced_at
+
+    def _managed(self, name):
+        return (self._primary().dialect.name == "sqlite"
+                and self.engines()[name].dialect.name == "sqlite")
+
+    def pick(self, session):
+        """Replica engine for this request's reads, or None for the primary."""
+        if not has_request_context() or request.method not in READ_METHODS:
+            return None
+        if "replica_bind" in session.info:
+            return session.info["replica_bind"]
+        engines = self.engines()
+        if not engines:
+            return None
+        max_lag = self.max_lag()
+        candidates = [name for name in engines if max_lag > 0 and self.lag(name) <= max_lag]
+        engine = engines[random.choice(candidates)] if candidates else None
+        session.info["replica_bind"] = engine
+        return engine
+
+    # ==================== SQLite copies ====================
+
+    def sync(self):
+        """Copy the primary into every managed replica with the backup API."""
+        state = current_app.extensions["replicas"]
+        for name, engine in state["engines"].items():
+            if not self._managed(name):
+                continue
+            started = time.time()
+            source = self._primary().raw_connection()
+            target = engine.raw_connection()
+            try:
+                source.driver_connection.backup(target.driver_connection)
+            finally:
+                target.close()
+                source.close()
+            if name in state["files"]:
+                os.utime(state["files"][name], (started, started))
+            state["synced_at"][name] = started
+
+    def _sync_loop(self, app, interval):
+        while True:
+            with app.app_context():
+                try:
+                    self.sync()
+                except Exception:
+                    logger.exception("Replica sync failed")
+            time.sleep(interval)
+
+
+replica_router = ReplicaRouter()
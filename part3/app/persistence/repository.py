@@ -9,14 +9,38 @@ class Repository(ABC):
     def add(self, obj):
         pass
 
+    @abstractmethod
+    def add_many(self, objs):
+        pass
+
     @abstractmethod
     def get(self, obj_id):
         pass
 
+    @abstractmethod
+    def get_many(self, ids, fields=None):
+        pass
+
     @abstractmethod
     def get_all(self):
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size=500, fields=None):
+        pass
+
+    @abstractmethod
+    def iter_by_ids(self, ids, batch_size=500, fields=None):
+        pass
+
+    @abstractmethod
+    def iter_row_batches(self, columns, batch_size=1000):
+        pass
+
+    @abstractmethod
+    def get_after(self, after=None, limit=20, fields=None):
+        pass
+
     @abstractmethod
     def update(self, obj_id, data):
         pass
@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+"""
+One review per user and place on databases that predate the rule.
+
+ix_reviews_place_user makes (place_id, user_id) unique, but create_all()
+does not add indexes to existing tables, and an existing table may
+already hold duplicates that would make CREATE UNIQUE INDEX fail.
+ensure_review_unique_index() reports them instead; once they are
+resolved it creates the index.
+"""
+
+from sqlalchemy import func, select
+
+from app.models.review import Review
+
+UNIQUE_INDEX = "ix_reviews_place_user"
+
+
+def find_duplicate_reviews(connection):
+    """(place_id, user_id, count) for every pair with more than one review."""
+    table = Review.__table__
+    rows = connection.execute(
+        select(table.c.place_id, table.c.user_id, func.count())
+        .group_by(table.c.place_id, table.c.user_id)
+        .having(func.count() > 1)
+        .order_by(table.c.place_id, table.c.user_id)
+    )
+    return [tuple(row) for row in rows]
+
+
+def ensure_review_unique_index(engine):
+    """
+    Create ix_reviews_place_user on ``engine`` unless duplicates exist.
+
+    Returns the duplicates found (see find_duplicate_reviews); the index
+    is only created, if it was missing, when the list is empty.
+    """
+    index = next(i for i in Review.__table__.indexes if i.name == UNIQUE_INDEX)
+    with engine.begin() as connection:
+        duplicates = find_duplicate_reviews(connection)
+        if not duplicates:
+            index.create(connection, checkfirst=True)
+    return duplicates
@@ -0,0 +1,351 @@
+#!/usr/bin/python3
+"""
+Hash-sharded storage for places and reviews.
+
+With ``DATABASE_SHARDS`` set (a list of SQLite URIs), places, their
+reviews, amenity links and stats live in N shard databases instead of
+the primary. A place goes to shard ``crc32(place_id) % N`` and its
+reviews follow their ``place_id``, so every place or review write
+touches one shard file and writers on different shards do not queue on
+the same database lock.
+
+Users and amenities stay on the primary, which every shard connection
+ATTACHes as ``core``: unqualified ``users`` / ``amenities`` resolve
+there, so owners, authors, display names and amenity joins load as
+before.
+
+ShardedPlaceRepository and ShardedReviewRepository wrap one
+PlaceRepository / ReviewRepository per shard. Place lookups go to one
+shard; review ids do not name their place, so review lookups ask every
+shard. Listings merge the per-shard pages, each shard reading
+``offset + limit`` rows.
+
+Left on the primary: the amenity bitmaps (sharded amenity filters run
+the SQL filter on each shard). The user -> places/reviews cascade and
+the rename listener cannot reach the shards, so the facade deletes a
+user's shard rows itself before deleting the user, and rewrites the
+shard name copies after renaming one.
+"""
+
+import heapq
+import zlib
+from itertools import chain
+
+from flask import current_app, has_app_context
+from flask.globals import app_ctx
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+
+from app.extensions import db
+from app.models.place import Place, place_amenity
+from app.models.place_stats import PlaceStats
+from app.models.review import Review
+from app.persistence import place_stats
+from app.persistence.replicas import resolve_url
+from app.persistence.repository import Repository
+from app.persistence.sqlalchemy_repository import PlaceRepository, ReviewRepository
+
+SHARDED_TABLES = (Place.__table__, Review.__table__, place_amenity, PlaceStats.__table__)
+CORE_SCHEMA = "core"
+
+
+def shard_index(place_id, count):
+    """Shard number of a place id (stable across processes and restarts)."""
+    return zlib.crc32(place_id.encode()) % count
+
+
+class ShardSession(Session):
+    """Session bound to one shard."""
+
+
+# stats deltas commit with the reviews on every shard too
+event.listen(ShardSession, "after_flush", place_stats.apply_after_flush)
+
+
+def _app_ctx_id():
+    return id(app_ctx._get_current_object())
+
+
+class Shards:
+    """Flask extension owning the shard engines and their scoped sessions."""
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("DATABASE_SHARDS", [])
+        urls = app.config["DATABASE_SHARDS"]
+        app.extensions["shards"] = None
+        if not urls:
+            return
+
+        primary = resolve_url(app, app.config["SQLALCHEMY_DATABASE_URI"])
+        if not primary.drivername.startswith("sqlite") or primary.database in (None, "", ":memory:"):
+            raise RuntimeError("DATABASE_SHARDS needs a SQLite file as SQLALCHEMY_DATABASE_URI")
+
+        engines, sessions = [], []
+        for url in urls:
+            engine = create_engine(resolve_url(app, url))
+            event.listen(engine, "connect", self._attach(primary.database))
+            engines.append(engine)
+            sessions.append(scoped_session(
+                sessionmaker(bind=engine, class_=ShardSession), scopefunc=_app_ctx_id))
+        app.extensions["shards"] = {"engines": engines, "sessions": sessions}
+        app.teardown_appcontext(self._remove_sessions)
+
+    @staticmethod
+    def _attach(path):
+        def on_connect(dbapi_connection, connection_record):
+            dbapi_connection.execute(f"ATTACH DATABASE ? AS {CORE_SCHEMA}", (path,))
+        return on_connect
+
+    @staticmethod
+    def _remove_sessions(exc=None):
+        state = current_app.extensions.get("shards")
+        for session in state["sessions"] if state else ():
+            session.remove()
+
+    @staticmethod
+    def enabled():
+        return has_app_context() and current_app.extensions.get("shards") is not None
+
+    @staticmethod
+    def sessions():
+        return current_app.extensions["shards"]["sessions"]
+
+    @staticmethod
+    def engines():
+        return current_app.extensions["shards"]["engines"]
+
+    def create_all(self):
+        for engine in self.engines():
+            db.metadata.create_all(engine, tables=SHARDED_TABLES)
+
+    def drop_all(self):
+        for engine in self.engines():
+            db.metadata.drop_all(engine, tables=SHARDED_TABLES)
+
+
+shards = Shards()
+
+
+# ==================== Repositories ====================
+
+class ShardedRepository(Repository):
+    """
+    One inner repository per shard, built on first use for the current app.
+
+    ``shard_key`` is the attribute holding the place id that decides
+    where an object is stored.
+    """
+
+    inner_class = None
+    shard_key = "id"
+
+    def _inner(self):
+        state = current_app.extensions["shards"]
+        repos = state.get(self.inner_class)
+        if repos is None:
+            repos = state[self.inner_class] = [self.inner_class(s) for s in state["sessions"]]
+        return repos
+
+    def _for_place(self, place_id):
+        repos = self._inner()
+        return repos[shard_index(place_id, len(repos))]
+
+    def _locate(self, obj_id):
+        """(repository, object) of the shard holding obj_id, or (None, None)."""
+        for repo in self._inner():
+            obj = repo.get(obj_id)
+            if obj is not None:
+                return repo, obj
+        return None, None
+
+    def add(self, obj):
+        return self._for_place(getattr(obj, self.shard_key)).add(obj)
+
+    def add_many(self, objs):
+        """One transaction per shard touched."""
+        by_shard = {}
+        for obj in objs:
+            repo = self._for_place(getattr(obj, self.shard_key))
+            by_shard.setdefault(id(repo), (repo, []))[1].append(obj)
+        for repo, shard_objs in by_shard.values():
+            repo.add_many(shard_objs)
+        return objs
+
+    def get(self, obj_id, fields=None):
+        for repo in self._inner():
+            obj = repo.get(obj_id, fields)
+            if obj is not None:
+                return obj
+        return None
+
+    def get_many(self, ids, fields=None):
+        found = {}
+        for repo in self._inner():
+            wanted = [i for i in ids if i not in found]
+            if not wanted:
+                break
+            found.update((obj.id, obj) for obj in repo.get_many(wanted, fields) if obj is not None)
+        return [found.get(i) for i in ids]
+
+    def get_all(self, fields=None):
+        return [obj for repo in self._inner() for obj in repo.get_all(fields)]
+
+    def iter_all(self, batch_size=500, fields=None):
+        return chain.from_iterable(repo.iter_all(batch_size, fields) for repo in self._inner())
+
+    def iter_row_batches(self, columns, batch_size=1000):
+        return chain.from_iterable(repo.iter_row_batches(columns, batch_size)
+                                   for repo in self._inner())
+
+    def iter_by_ids(self, ids, batch_size=500, fields=None):
+        ids = list(ids)
+        return chain.from_iterable(repo.iter_by_ids(ids, batch_size, fields)
+                                   for repo in self._inner())
+
+    def get_after(self, after=None, limit=20, fields=None):
+        """Merge of each shard's next ``limit`` objects in id order."""
+        pages = [repo.get_after(after, limit, fields) for repo in self._inner()]
+        return list(heapq.merge(*pages, key=lambda obj: obj.id))[:limit]
+
+    def update(self, obj_id, data):
+        repo, obj = self._locate(obj_id)
+        return repo.update(obj_id, data) if repo else None
+
+    def delete(self, obj_id):
+        repo, obj = self._locate(obj_id)
+        return repo.delete(obj_id) if repo else False
+
+    def get_by_attribute(self, attr_name, attr_value):
+        for repo in self._inner():
+            obj = repo.get_by_attribute(attr_name, attr_value)
+            if obj is not None:
+                return obj
+        return None
+
+    def search(self, query, limit=20, offset=0):
+        """Merge of the per-shard rankings (lower bm25 score first)."""
+        total, pages = 0, []
+        for repo in self._inner():
+            count, rows = repo.search(query, offset + limit, 0)
+            total += count
+            pages.append(rows)
+        merged = heapq.merge(*pages, key=lambda row: row["score"])
+        return total, list(merged)[offset:offset + limit]
+
+
+class ShardedPlaceRepository(ShardedRepository):
+    """Places stored on shard crc32(id) % N."""
+
+    inner_class = PlaceRepository
+    shard_key = "id"
+
+    # sort key -> (field the merge reads, value of a place)
+    SORT_VALUES = {
+        "price": ("price", lambda p: p.price),
+        "created_at": ("created_at", lambda p: p.created_at),
+        "rating": ("rating_avg", lambda p: p.stats.rating_avg if p.stats else 0),
+        "reviews": ("review_count", lambda p: p.stats.review_count if p.stats else 0),
+    }
+
+    def get(self, obj_id, fields=None):
+        return self._for_place(obj_id).get(obj_id, fields)
+
+    def _locate(self, obj_id):
+        repo = self._for_place(obj_id)
+        obj = repo.get(obj_id)
+        return (repo, obj) if obj is not None else (None, None)
+
+    def _group(self, ids):
+        """(repository, ids) per shard holding some of ``ids``."""
+        repos = self._inner()
+        by_shard = [[] for _ in repos]
+        for place_id in ids:
+            by_shard[shard_index(place_id, len(repos))].append(place_id)
+        return [(repo, shard_ids) for repo, shard_ids in zip(repos, by_shard) if shard_ids]
+
+    def get_many(self, ids, fields=None):
+        found = {}
+        for repo, shard_ids in self._group(ids):
+            found.update((p.id, p) for p in repo.get_many(shard_ids, fields) if p is not None)
+        return [found.get(i) for i in ids]
+
+    def iter_by_ids(self, ids, batch_size=500, fields=None):
+        return chain.from_iterable(repo.iter_by_ids(shard_ids, batch_size, fields)
+                                   for repo, shard_ids in self._group(ids))
+
+    def iter_with_amenities(self, amenity_ids, batch_size=500, fields=None):
+        """Stream the places having all of amenity_ids, filtered in SQL on each shard."""
+        def shard_rows(repo):
+            return (
+                repo.session.query(Place)
+                .filter(Place.id.in_(repo.with_amenities(amenity_ids)))
+                .options(*repo.load_options(fields), *repo.iter_options(fields))
+                .yield_per(batch_size)
+            )
+        return chain.from_iterable(shard_rows(repo) for repo in self._inner())
+
+    def get_page(self, sort=None, limit=20, offset=0, fields=None, amenity_ids=None):
+        """
+        One merged page of places across shards -> (total, places).
+
+        Sorted pages merge each shard's first offset + limit rows on
+        (value, id), the order every shard returns. Unsorted pages walk
+        the shards in order, skipping whole shards by their counts.
+        """
+        repos = self._inner()
+        if sort is None:
+            total, places = 0, []
+            for repo in repos:
+                count, rows = repo.get_page(None, limit - len(places), max(offset - total, 0),
+                                            fields, amenity_ids)
+                total += count
+                places.extend(rows)
+            return total, places
+
+        key, descending = sort
+        field, value = self.SORT_VALUES[key]
+        if fields is not None and field not in fields:
+            fields = [*fields, field]
+        total, pages = 0, []
+        for repo in repos:
+            count, rows = repo.get_page(sort, offset + limit, 0, fields, amenity_ids)
+            total += count
+            pages.append(rows)
+        merged = heapq.merge(*pages, key=lambda p: (value(p), p.id), reverse=descending)
+        return total, list(merged)[offset:offset + limit]
+
+    def delete_by_owner(self, owner_id):
+        """One transaction per shard."""
+        return sum(repo.delete_by_owner(owner_id) for repo in self._inner())
+
+    def rename_owner(self, owner_id, name):
+        """One transaction per shard."""
+        return sum(repo.rename_owner(owner_id, name) for repo in self._inner())
+
+
+class ShardedReviewRepository(ShardedRepository):
+    """Reviews stored with their place."""
+
+    inner_class = ReviewRepository
+    shard_key = "place_id"
+
+    def get_by_user_and_place(self, user_id, place_id):
+        return self._for_place(place_id).get_by_user_and_place(user_id, place_id)
+
+    def get_by_place(self, place_id, fields=None):
+        return self._for_place(place_id).get_by_place(place_id, fields)
+
+    def get_by_user(self, user_id, fields=None):
+        return [review for repo in self._inner() for review in repo.get_by_user(user_id, fields)]
+
+    def delete_by_user(self, user_id):
+        """One transaction per shard."""
+        return sum(repo.delete_by_user(user_id) for repo in self._inner())
+
+    def rename_user(self, user_id, name):
+        """One transaction per shard."""
+        return sum(repo.rename_user(user_id, name) for repo in self._inner())
@@ -1,30 +1,176 @@
 #!/usr/bin/python3
 """SQLAlchemy repository implementation (Tasks 5, 6 & 7)."""
 
+from sqlalchemy import func, inspect as sa_inspect, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import contains_eager, joinedload, lazyload, load_only
+
 from app.extensions import db
+from app.persistence import display_names, full_text, place_stats  # noqa: F401 - registers listeners
+from app.persistence.amenity_index import amenity_index
 from app.persistence.repository import Repository
 from app.models.user import User
-from app.models.place import Place
+from app.models.place import Place, place_amenity
+from app.models.place_stats import PlaceStats
 from app.models.review import Review
 from app.models.amenity import Amenity
+from app.models.types import UUIDKey, binary_keys, uuid_str
+
+
+def _keys_to_str(row, keys):
+    row = list(row)
+    for i in keys:
+        if row[i] is not None:
+            row[i] = uuid_str(row[i])
+    return row
 
 
 class SQLAlchemyRepository(Repository):
     """Generic repository for SQLAlchemy persistence."""
 
-    def __init__(self, model):
+    def __init__(self, model, session=None):
         self.model = model
+        self._session = session
+
+    @property
+    def session(self):
+        """Session the queries run in: db.session unless bound to a shard."""
+        return db.session if self._session is None else self._session
 
     def add(self, obj):
-        db.session.add(obj)
-        db.session.commit()
+        self.session.add(obj)
+        self.session.commit()
         return obj
 
-    def get(self, obj_id):
-        return db.session.get(self.model, obj_id)
+    def add_many(self, objs):
+        """Insert several objects in one transaction (rolled back on failure)."""
+        self.session.add_all(objs)
+        try:
+            self.session.commit()
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+        return objs
+
+    def get(self, obj_id, fields=None):
+        return self.session.get(self.model, obj_id, options=self.load_options(fields))
+
+    def get_many(self, ids, fields=None):
+        """
+        Fetch several rows with one IN query.
+
+        Returns a list aligned with ``ids``: the row for each id, or None
+        where there is no such row. Duplicate ids are fetched once.
+        """
+        if not ids:
+            return []
+        rows = (
+            self.session.query(self.model)
+            .filter(self.model.id.in_(set(ids)))
+            .options(*self.load_options(fields), *self.iter_options(fields))
+            .all()
+        )
+        by_id = {row.id: row for row in rows}
+        return [by_id.get(i) for i in ids]
+
+    def get_all(self, fields=None):
+        return self.session.query(self.model).options(*self.load_options(fields)).all()
+
+    def iter_all(self, batch_size=500, fields=None):
+        """
+        Yield every row, fetching batch_size rows at a time.
+
+        Rows are streamed from the cursor with yield_per, so memory stays
+        flat regardless of table size.
+        """
+        query = (
+            self.session.query(self.model)
+            .options(*self.load_options(fields), *self.iter_options(fields))
+            .yield_per(batch_size)
+        )
+        yield from query
+
+    def iter_by_ids(self, ids, batch_size=500, fields=None):
+        """
+        Yield the rows whose id is in ``ids``, one IN query per batch_size ids.
+
+        Unknown ids are skipped; rows come back in database order within
+        each batch.
+        """
+        ids = list(ids)
+        options = (*self.load_options(fields), *self.iter_options(fields))
+        for start in range(0, len(ids), batch_size):
+            chunk = ids[start:start + batch_size]
+            yield from (
+                self.session.query(self.model)
+                .filter(self.model.id.in_(chunk))
+                .options(*options)
+            )
+
+    def iter_row_batches(self, columns, batch_size=1000):
+        """
+        Yield lists of raw row tuples holding ``columns``, batch_size at a time.
+
+        Reads straight from the DBAPI cursor of the session's connection,
+        skipping the ORM and SQLAlchemy's result processing, so values come
+        back as the driver returns them (SQLite: timestamps as text). Meant
+        for full-table exports. Binary UUID keys are the one exception:
+        they are turned back into strings.
+        """
+        table = self.model.__table__
+        stmt = select(*(table.c[name] for name in columns))
+        connection = self.session.connection(bind_arguments={"mapper": self.model,
+                                                             "clause": stmt})
+        keys = []
+        if binary_keys(connection.dialect):
+            keys = [i for i, name in enumerate(columns) if isinstance(table.c[name].type, UUIDKey)]
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute(str(stmt.compile(dialect=connection.dialect)))
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    return
+                if keys:
+                    batch = [_keys_to_str(row, keys) for row in batch]
+                yield batch
+        finally:
+            cursor.close()
+
+    def get_after(self, after=None, limit=20, fields=None):
+        """
+        Up to ``limit`` objects with an id greater than ``after``, in id order.
+
+        Keyset pagination on the primary key: every page is one index range
+        scan however deep it is, where OFFSET reads and drops all the rows
+        before it. With time-ordered ids (ID_GENERATOR = "uuid7") id order
+        is creation order, so clients page through rows as they were added.
+        """
+        query = self.session.query(self.model)
+        if after:
+            query = query.filter(self.model.id > after)
+        return (
+            query.options(*self.load_options(fields), *self.iter_options(fields))
+            .order_by(self.model.id).limit(limit).all()
+        )
 
-    def get_all(self):
-        return db.session.query(self.model).all()
+    def load_options(self, fields=None):
+        """
+        Restrict the SELECT to the mapped columns named in ``fields``.
+
+        Names that are not columns (e.g. computed fields) are ignored here;
+        the primary key and updated_at (the fragment cache key, see
+        app/fragment_cache.py) are always loaded.
+        """
+        if not fields:
+            return []
+        column_attrs = sa_inspect(self.model).column_attrs
+        columns = [getattr(self.model, f) for f in fields if f in column_attrs]
+        return [load_only(self.model.id, self.model.updated_at, *columns)]
+
+    def iter_options(self, fields=None):
+        """Loader options for iter_all (must be compatible with yield_per)."""
+        return ()
 
     def update(self, obj_id, data):
         obj = self.get(obj_id)
@@ -35,7 +181,7 @@ class SQLAlchemyRepository(Repository):
             if hasattr(obj, key):
                 setattr(obj, key, value)
 
-        db.session.commit()
+        self.session.commit()
         return obj
 
     def delete(self, obj_id):
@@ -43,8 +189,8 @@ class SQLAlchemyRepository(Repository):
         if not obj:
             return False
 
-        db.session.delete(obj)
-        db.session.commit()
+        self.session.delete(obj)
+        self.session.commit()
         return True
 
     def get_by_attribute(self, attr_name, attr_value):
@@ -52,7 +198,7 @@ class SQLAlchemyRepository(Repository):
             return None
 
         return (
-            db.session.query(self.model)
+            self.session.query(self.model)
             .filter(getattr(self.model, attr_name) == attr_value)
             .first()
         )
@@ -76,7 +222,7 @@ class UserRepository(SQLAlchemyRepository):
         Returns:
             User: User object or None if not found
         """
-        return self.model.query.filter_by(email=email).first()
+        return self.session.query(self.model).filter_by(email=email).first()
 
 
 # ==================== TASK 7: PlaceRepository ====================
@@ -84,8 +230,119 @@ class UserRepository(SQLAlchemyRepository):
 class PlaceRepository(SQLAlchemyRepository):
     """Place-specific repository."""
     
-    def __init__(self):
-        super().__init__(Place)
+    def __init__(self, session=None):
+        super().__init__(Place, session)
+
+    STATS_FIELDS = {"review_count", "rating_avg", "stars", "last_review_at"}
+
+    # larger amenity matches are filtered with with_amenities() rather than
+    # one bound parameter per id
+    MAX_IN_IDS = 5000
+
+    def load_options(self, fields=None, stats_loader=joinedload):
+        options = super().load_options(fields)
+        if fields is None or self.STATS_FIELDS.intersection(fields):
+            options.append(stats_loader(Place.stats))
+        if fields is not None and "amenities" not in fields:
+            options.append(lazyload(Place.amenities))
+        return options
+
+    def iter_options(self, fields=None):
+        # subquery eager loading cannot be combined with yield_per
+        return (lazyload(Place.amenities),)
+
+    @staticmethod
+    def with_amenities(amenity_ids):
+        """SELECT of the ids of the places having every amenity in amenity_ids."""
+        amenity_ids = set(amenity_ids)
+        return (
+            select(place_amenity.c.place_id)
+            .where(place_amenity.c.amenity_id.in_(amenity_ids))
+            .group_by(place_amenity.c.place_id)
+            .having(func.count() == len(amenity_ids))
+        )
+
+    def iter_with_amenities(self, amenity_ids, batch_size=500, fields=None):
+        """Stream the places having all of amenity_ids, found with the bitmap index."""
+        return self.iter_by_ids(amenity_index.places_with(amenity_ids), batch_size, fields)
+
+    def delete_by_owner(self, owner_id):
+        """Delete the places of owner_id (with their reviews); returns how many there were."""
+        places = self.session.query(self.model).filter(self.model.owner_id == owner_id).all()
+        for place in places:
+            self.session.delete(place)
+        self.session.commit()
+        return len(places)
+
+    def rename_owner(self, owner_id, name):
+        """Set owner_name on the places of owner_id; returns how many rows changed."""
+        count = self.session.execute(display_names.rename_copies(self.model, owner_id, name)).rowcount
+        self.session.commit()
+        return count
+
+    def search(self, query, limit=20, offset=0):
+        """Ranked full-text search over title and description."""
+        return full_text.search(self.session, "places", query, limit, offset)
+
+    def get_page(self, sort=None, limit=20, offset=0, fields=None, amenity_ids=None):
+        """
+        One page of places, optionally sorted and filtered by amenities.
+
+        Args:
+            sort: (key, descending) with key in price, rating,
+                created_at or reviews; None keeps table order
+            amenity_ids: only places having all of these amenities
+
+        Returns:
+            (total, places)
+
+        price and created_at are served from a (column, id) index on
+        places so LIMIT stops after one page. rating and reviews come from
+        place_stats through an outer join, a place without a stats row
+        sorting as 0.
+
+        The amenity filter reads the bitmap index, which gives the total
+        and, for unsorted pages, the page ids directly. It indexes the
+        primary database only; repositories bound to a shard session
+        filter in SQL instead.
+        """
+        query = self.session.query(self.model)
+        if amenity_ids and self._session is None:
+            ids = sorted(amenity_index.places_with(amenity_ids))
+            if sort is None:
+                places = self.get_many(ids[offset:offset + limit], fields)
+                return len(ids), [p for p in places if p is not None]
+            total = len(ids)
+            if total <= self.MAX_IN_IDS:
+                query = query.filter(self.model.id.in_(ids))
+            else:
+                query = query.filter(self.model.id.in_(self.with_amenities(amenity_ids)))
+        else:
+            if amenity_ids:
+                query = query.filter(self.model.id.in_(self.with_amenities(amenity_ids)))
+            total = query.with_entities(func.count(self.model.id)).scalar()
+
+        stats_loader = joinedload
+        if sort is not None:
+            key, descending = sort
+            if key in ("price", "created_at"):
+                column, tiebreak = getattr(self.model, key), self.model.id
+            else:
+                query = query.outerjoin(PlaceStats, PlaceStats.place_id == self.model.id)
+                column = func.coalesce(
+                    PlaceStats.rating_avg if key == "rating" else PlaceStats.review_count, 0)
+                tiebreak = self.model.id
+                stats_loader = contains_eager
+            if descending:
+                query = query.order_by(column.desc(), tiebreak.desc())
+            else:
+                query = query.order_by(column.asc(), tiebreak.asc())
+
+        places = (
+            query.options(*self.load_options(fields, stats_loader), *self.iter_options(fields))
+            .limit(limit).offset(offset).all()
+        )
+        return total, places
 
 
 # ==================== TASK 7: ReviewRepository ====================
@@ -93,8 +350,52 @@ class PlaceRepository(SQLAlchemyRepository):
 class ReviewRepository(SQLAlchemyRepository):
     """Review-specific repository."""
     
-    def __init__(self):
-        super().__init__(Review)
+    def __init__(self, session=None):
+        super().__init__(Review, session)
+
+    def get_by_user_and_place(self, user_id, place_id):
+        """The review user_id wrote for place_id, if any (ix_reviews_place_user)."""
+        return (
+            self.session.query(self.model)
+            .filter_by(place_id=place_id, user_id=user_id)
+            .first()
+        )
+
+    def get_by_place(self, place_id, fields=None):
+        """Reviews of place_id, loading only ``fields`` (ix_reviews_place_rating)."""
+        return (
+            self.session.query(self.model)
+            .options(*self.load_options(fields))
+            .filter(self.model.place_id == place_id)
+            .all()
+        )
+
+    def get_by_user(self, user_id, fields=None):
+        """Reviews written by user_id, loading only ``fields``."""
+        return (
+            self.session.query(self.model)
+            .options(*self.load_options(fields))
+            .filter(self.model.user_id == user_id)
+            .all()
+        )
+
+    def delete_by_user(self, user_id):
+        """Delete the reviews written by user_id; returns how many there were."""
+        reviews = self.get_by_user(user_id)
+        for review in reviews:
+            self.session.delete(review)
+        self.session.commit()
+        return len(reviews)
+
+    def rename_user(self, user_id, name):
+        """Set user_name on the reviews of user_id; returns how many rows changed."""
+        count = self.session.execute(display_names.rename_copies(self.model, user_id, name)).rowcount
+        self.session.commit()
+        return count
+
+    def search(self, query, limit=20, offset=0):
+        """Ranked full-text search over review text."""
+        return full_text.search(self.session, "reviews", query, limit, offset)
 
 
 # ==================== TASK 7: AmenityRepository ====================
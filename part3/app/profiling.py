@@ -0,0 +1,165 @@
+#!/usr/bin/python3
+"""SQL query profiling - per-request query counts, timings and slow-query log"""
+
+import heapq
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import current_app, g, has_app_context, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("hbnb.sql")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_PLACEHOLDER_LIST_RE = re.compile(r"\((?:\?|%s|:\w+)(?:,\s*(?:\?|%s|:\w+))+\)")
+
+
+def normalize_statement(statement):
+    """Collapse whitespace and IN-lists; parameters are never recorded."""
+    statement = _WHITESPACE_RE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST_RE.sub("(...)", statement)
+
+
+class QueryStats:
+    """Statement count, total DB time and the slowest statements."""
+
+    def __init__(self, keep_slowest=5, collect=False):
+        self.count = 0
+        self.total = 0.0
+        self.keep_slowest = keep_slowest
+        self._slowest = []   # min-heap of (elapsed, seq, statement)
+        self.statements = [] if collect else None
+
+    def record(self, statement, elapsed):
+        self.count += 1
+        self.total += elapsed
+        if self.statements is not None:
+            self.statements.append(statement)
+        item = (elapsed, self.count, statement)
+        if len(self._slowest) < self.keep_slowest:
+            heapq.heappush(self._slowest, item)
+        elif elapsed > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, item)
+
+    @property
+    def slowest(self):
+        """[(elapsed_seconds, statement)] sorted slowest first."""
+        return [(e, s) for e, _, s in sorted(self._slowest, reverse=True)]
+
+
+class QueryProfiler:
+    """
+    Hooks SQLAlchemy engine events to profile every statement.
+
+    Statements are attributed to the current request (``g``) and to any
+    active ``count_queries()`` recorders on the current thread. Statements
+    slower than ``SQLALCHEMY_SLOW_QUERY_MS`` are logged to ``hbnb.sql``.
+    With ``SQLALCHEMY_PROFILE_HEADERS`` (defaults to DEBUG) responses carry
+    ``X-DB-Queries`` and ``Server-Timing`` headers.
+
+    Headers go out before a streamed body is generated, so on streamed
+    responses they only count the statements run up to then; the final
+    totals are logged to ``hbnb.sql`` at DEBUG when the response closes.
+    """
+
+    _listening = False
+
+    def __init__(self, app=None, keep_slowest=5):
+        self.keep_slowest = keep_slowest
+        self._local = threading.local()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("SQLALCHEMY_SLOW_QUERY_MS", 100.0)
+        app.config.setdefault("SQLALCHEMY_PROFILE_HEADERS", app.debug)
+        if not QueryProfiler._listening:
+            event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+            event.listen(Engine, "handle_error", self._handle_error)
+            QueryProfiler._listening = True
+        app.before_request(self._start_request)
+        app.after_request(self._add_headers)
+
+    # ==================== Engine events ====================
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("hbnb_query_start", []).append(time.perf_counter())
+
+    @staticmethod
+    def _handle_error(exception_context):
+        # a failed statement never reaches after_cursor_execute; drop its
+        # start time so the next statement on this pooled connection is
+        # not timed from it (statements on one connection never nest)
+        conn = exception_context.connection
+        if conn is not None:
+            conn.info.pop("hbnb_query_start", None)
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("hbnb_query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        statement = normalize_statement(statement)
+
+        for stats in getattr(self._local, "recorders", ()):
+            stats.record(statement, elapsed)
+
+        if has_request_context():
+            stats = g.get("_db_stats")
+            if stats is not None:
+                stats.record(statement, elapsed)
+
+        if has_app_context():
+            threshold = current_app.config.get("SQLALCHEMY_SLOW_QUERY_MS")
+            if threshold is not None and elapsed * 1000 >= threshold:
+                logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement)
+
+    # ==================== Request hooks ====================
+
+    def _start_request(self):
+        g._db_stats = QueryStats(self.keep_slowest)
+
+    @staticmethod
+    def _add_headers(response):
+        stats = g.get("_db_stats")
+        if stats is None:
+            return response
+        if current_app.config.get("SQLALCHEMY_PROFILE_HEADERS"):
+            response.headers["X-DB-Queries"] = str(stats.count)
+            response.headers.add(
+                "Server-Timing",
+                f'db;dur={stats.total * 1000:.2f};desc="{stats.count} queries"',
+            )
+        if response.is_streamed:
+            method, path = request.method, request.path
+            # stats keeps counting while the body is generated
+            response.call_on_close(lambda: logger.debug(
+                "Streamed %s %s: %d queries, %.2f ms", method, path,
+                stats.count, stats.total * 1000))
+        return response
+
+    # ==================== Public API ====================
+
+    @staticmethod
+    def current_stats():
+        """Stats of the request being served, or None outside a request."""
+        return g.get("_db_stats") if has_request_context() else None
+
+    @contextmanager
+    def count_queries(self):
+        """Record every statement run on this thread inside the block."""
+        stats = QueryStats(self.keep_slowest, collect=True)
+        recorders = getattr(self._local, "recorders", None)
+        if recorders is None:
+            recorders = self._local.recorders = []
+        recorders.append(stats)
+        try:
+            yield stats
+        finally:
+            recorders.remove(stats)
@@ -0,0 +1,441 @@
+#!/usr/bin/python3
+"""
+Bulk import of users, amenities, places and reviews from NDJSON/CSV.
+
+Rows are read in chunks. Each chunk is validated in a worker process:
+values are coerced to the column types and checked against the API's
+payload model (app/api/v1/validation.py, same messages as a POST),
+numeric ranges (price, latitude, longitude, rating) are checked for the
+whole chunk at once (with numpy when it is installed), and every
+surviving row is built through its model constructor, so the importer
+enforces exactly the rules of ``Model.__init__`` (including password
+hashing for users).
+
+Back in the parent process a chunk is checked against the database
+(unknown owners/authors/places/amenities, taken emails and ids,
+duplicate reviews, non-UUID ids on binary-key databases) and inserted
+with one executemany per table, denormalized names and place
+statistics included, then committed.
+A chunk that still fails on insert is retried row by row so a single
+bad row only rejects itself.
+"""
+
+import csv
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from flask import Flask
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.exc import IntegrityError
+
+from app.api.v1.amenities import amenity_model
+from app.api.v1.places import place_model
+from app.api.v1.reviews import review_model
+from app.api.v1.users import user_model
+from app.api.v1.validation import compile_model
+from app.extensions import bcrypt, db
+from app.models.amenity import Amenity
+from app.models.ids import configure_id_generator
+from app.models.place import Place, place_amenity
+from app.models.review import Review
+from app.models.types import binary_keys, is_uuid
+from app.models.user import User
+from app.persistence.place_stats import rebuild_place_stats
+
+try:
+    import numpy
+except ImportError:  # optional dependency
+    numpy = None
+
+# dependency order: later entities reference earlier ones
+ENTITIES = ("users", "amenities", "places", "reviews")
+MODELS = {"users": User, "amenities": Amenity, "places": Place, "reviews": Review}
+# the POST payload models: rows get the API's type/required checks and messages
+PAYLOADS = {"users": user_model, "amenities": amenity_model,
+            "places": place_model, "reviews": review_model}
+
+NUMBERS = {
+    "places": {"price": float, "latitude": float, "longitude": float},
+    "reviews": {"rating": int},
+}
+BOOLEANS = {"users": ("is_admin",)}
+TIMESTAMPS = ("created_at", "updated_at")
+
+# (field, check, message): check takes a float or a numpy array of floats;
+# messages are the ones Place/Review.__init__ raise for the same values
+RANGE_CHECKS = {
+    "places": (
+        ("price", lambda v: v > 0, "Price must be greater than 0"),
+        ("price", lambda v: v <= Place.PRICE_MAX, "Price must be under 1,000,000"),
+        ("latitude", lambda v: (v >= Place.LATITUDE_RANGE[0]) & (v <= Place.LATITUDE_RANGE[1]),
+         "Latitude must be between -90 and 90"),
+        ("longitude", lambda v: (v >= Place.LONGITUDE_RANGE[0]) & (v <= Place.LONGITUDE_RANGE[1]),
+         "Longitude must be between -180 and 180"),
+    ),
+    "reviews": (
+        ("rating", lambda v: (v >= Review.RATING_RANGE[0]) & (v <= Review.RATING_RANGE[1]),
+         "rating must be an integer between 1 and 5"),
+    ),
+}
+
+
+# ==================== Reading ====================
+
+def read_rows(path):
+    """Yield (line number, dict) from a .csv or .ndjson/.jsonl file."""
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            # line 1 is the header; empty cells are missing values
+            for line, row in enumerate(csv.DictReader(f), start=2):
+                yield line, {k: v for k, v in row.items() if v != ""}
+        else:
+            for line, text in enumerate(f, start=1):
+                if not text.strip():
+                    continue
+                try:
+                    yield line, json.loads(text)
+                except ValueError:
+                    yield line, text.strip()  # rejected by validate_chunk
+
+
+def chunked(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ==================== Validation (worker side) ====================
+
+def init_worker(config):
+    """Pool initializer: give the worker's bcrypt and id generator the app's settings."""
+    app = Flask("hbnb-import")
+    app.config.update(config)
+    bcrypt.init_app(app)
+    configure_id_generator(app)
+
+
+def _coerce(entity, row):
+    """Convert CSV/JSON values to the column types, in place."""
+    for field, kind in NUMBERS.get(entity, {}).items():
+        value = row.get(field)
+        if value is None:
+            continue
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{field} must be a number")
+        if kind is int:
+            if not number.is_integer():
+                raise ValueError(f"{field} must be an integer")
+            number = int(number)
+        row[field] = number
+    for field in BOOLEANS.get(entity, ()):
+        if isinstance(row.get(field), str):
+            row[field] = row[field].strip().lower() in ("1", "true", "yes")
+    for field in TIMESTAMPS:
+        if isinstance(row.get(field), str):
+            try:
+                row[field] = datetime.fromisoformat(row[field])
+            except ValueError:
+                raise ValueError(f"{field} must be an ISO 8601 timestamp")
+    if entity == "places":
+        ids = row.pop("amenity_ids", None) or []
+        if isinstance(ids, str):
+            ids = [i.strip() for i in ids.split(";") if i.strip()]
+        row["amenity_ids"] = list(ids)
+
+
+def range_errors(entity, rows):
+    """
+    One error message (or None) per row, from RANGE_CHECKS over the chunk.
+
+    Missing values pass; the model constructor reports them.
+    """
+    errors = [None] * len(rows)
+    for field, check, message in RANGE_CHECKS.get(entity, ()):
+        values = [row.get(field) for row in rows]
+        if numpy is not None:
+            array = numpy.array([numpy.nan if v is None else v for v in values], dtype=float)
+            with numpy.errstate(invalid="ignore"):
+                bad = numpy.flatnonzero(~(check(array) | numpy.isnan(array)))
+        else:
+            bad = [i for i, v in enumerate(values) if v is not None and not check(v)]
+        for i in bad:
+            if errors[i] is None:
+                errors[i] = message
+    return errors
+
+
+def validate_chunk(entity, chunk):
+    """
+    Validate [(line, row)] for entity -> (valid, rejects).
+
+    ``valid`` holds (line, column values, amenity ids) ready to insert;
+    ``rejects`` holds (line, row, error).
+    """
+    model = MODELS[entity]
+    columns = model.__table__.columns
+    coerced, rejects = [], []
+    for line, row in chunk:
+        if not isinstance(row, dict):
+            rejects.append((line, {"raw": row}, "row must be a JSON object"))
+            continue
+        original = dict(row)
+        try:
+            _coerce(entity, row)
+        except ValueError as e:
+            rejects.append((line, original, str(e)))
+            continue
+        coerced.append((line, original, row))
+
+    payload = compile_model(PAYLOADS[entity])
+    checked = []
+    for line, original, row in coerced:
+        errors = payload.errors(row)
+        if errors:
+            rejects.append((line, original, "; ".join(errors.values())))
+        else:
+            checked.append((line, original, row))
+
+    valid = []
+    errors = range_errors(entity, [row for _, _, row in checked])
+    for (line, original, row), error in zip(checked, errors):
+        if error is not None:
+            rejects.append((line, original, error))
+            continue
+        amenity_ids = row.pop("amenity_ids", [])
+        try:
+            obj = model(**row)
+        except (TypeError, ValueError) as e:
+            rejects.append((line, original, str(e)))
+            continue
+        valid.append((line, _column_values(obj, columns), amenity_ids))
+    return valid, rejects
+
+
+def _column_values(obj, columns):
+    """Row for a Core insert; unset columns get their scalar defaults."""
+    values = {}
+    for column in columns:
+        value = getattr(obj, column.name)
+        if value is None and column.default is not None and column.default.is_scalar:
+            value = column.default.arg
+        values[column.name] = value
+    return values
+
+
+def _validate_job(job):
+    return validate_chunk(*job)
+
+
+# ==================== Loading (parent side) ====================
+
+class Importer:
+    """
+    Import files into the current app's database.
+
+    ``workers`` processes validate chunks of ``chunk_size`` rows (0 runs
+    validation inline); ``progress(entity, stats)`` is called after every
+    committed chunk and ``report`` (a file object) receives one NDJSON
+    line per rejected row.
+    """
+
+    def __init__(self, session=None, workers=None, chunk_size=1000, report=None,
+                 progress=None, config=None):
+        self.session = session or db.session
+        self.workers = os.cpu_count() if workers is None else workers
+        self.chunk_size = chunk_size
+        self.report = report
+        self.progress = progress
+        self.config = config or {}
+        self._seen = {"ids": set(), "emails": set(), "reviews": set()}
+
+    def run(self, files):
+        """files maps entity -> path; returns {entity: stats}."""
+        unknown = set(files) - set(ENTITIES)
+        if unknown:
+            raise ValueError(f"Unknown entity: {', '.join(sorted(unknown))}")
+        return {entity: self.import_file(entity, files[entity])
+                for entity in ENTITIES if entity in files}
+
+    def import_file(self, entity, path):
+        stats = {"read": 0, "imported": 0, "rejected": 0, "seconds": 0.0}
+        start = time.perf_counter()
+        for valid, rejects in self._validated(entity, chunked(read_rows(path), self.chunk_size)):
+            stats["read"] += len(valid) + len(rejects)
+            imported, failed = self._load(entity, valid)
+            rejects += failed
+            stats["imported"] += imported
+            stats["rejected"] += len(rejects)
+            for line, row, error in sorted(rejects, key=lambda r: r[0]):
+                self._reject(entity, line, row, error)
+            stats["seconds"] = time.perf_counter() - start
+            if self.progress is not None:
+                self.progress(entity, stats)
+        stats["seconds"] = time.perf_counter() - start
+        return stats
+
+    def _validated(self, entity, chunks):
+        """Validated chunks in input order, at most 2 per worker in flight."""
+        if not self.workers:
+            for chunk in chunks:
+                yield validate_chunk(entity, chunk)
+            return
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(self.workers, mp_context=context, initializer=init_worker,
+                                 initargs=(self.config,)) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_validate_job, (entity, chunk)))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _reject(self, entity, line, row, error):
+        if self.report is not None:
+            row = {k: v for k, v in row.items() if k != "password"}
+            self.report.write(json.dumps({"entity": entity, "line": line, "error": error,
+                                          "row": row}, default=str) + "\n")
+
+    # ---------- referential checks ----------
+
+    def _existing(self, column, values):
+        values = list(set(values))
+        found = set()
+        for start in range(0, len(values), 500):
+            found.update(self.session.execute(
+                select(column).where(column.in_(values[start:start + 500]))
+            ).scalars())
+        return found
+
+    def _names(self, ids):
+        users = User.__table__
+        ids = list(set(ids))
+        names = {}
+        for start in range(0, len(ids), 500):
+            names.update(
+                (row.id, f"{row.first_name} {row.last_name}")
+                for row in self.session.execute(
+                    select(users.c.id, users.c.first_name, users.c.last_name)
+                    .where(users.c.id.in_(ids[start:start + 500]))
+                )
+            )
+        return names
+
+    def _check(self, entity, valid):
+        """Drop rows that clash with the database or earlier rows -> rejects."""
+        table = MODELS[entity].__table__
+        taken = self._existing(table.c.id, [values["id"] for _, values, _ in valid])
+        rejects, kept = [], []
+        extra = {"binary_keys": binary_keys(self.session.get_bind(mapper=MODELS[entity]).dialect)}
+        if entity == "users":
+            extra["emails"] = self._existing(table.c.email,
+                                             [values["email"] for _, values, _ in valid])
+        elif entity == "places":
+            extra["owners"] = self._names(values["owner_id"] for _, values, _ in valid)
+            extra["amenities"] = self._existing(
+                Amenity.__table__.c.id, [a for _, _, ids in valid for a in ids])
+        elif entity == "reviews":
+            extra["authors"] = self._names(values["user_id"] for _, values, _ in valid)
+            places = Place.__table__
+            place_ids = list({values["place_id"] for _, values, _ in valid})
+            extra["owners"] = dict(self.session.execute(
+                select(places.c.id, places.c.owner_id).where(places.c.id.in_(place_ids))
+            ).all())
+            reviews = table
+            pairs = [(values["place_id"], values["user_id"]) for _, values, _ in valid]
+            extra["reviewed"] = set(self.session.execute(
+                select(reviews.c.place_id, reviews.c.user_id)
+                .where(tuple_(reviews.c.place_id, reviews.c.user_id).in_(pairs))
+            ).all()) if pairs else set()
+
+        for line, values, amenity_ids in valid:
+            error = self._row_error(entity, values, amenity_ids, taken, extra)
+            if error:
+                rejects.append((line, values, error))
+            else:
+                kept.append((line, values, amenity_ids))
+        return kept, rejects
+
+    def _row_error(self, entity, values, amenity_ids, taken, extra):
+        seen = self._seen
+        if values["id"] in taken or values["id"] in seen["ids"]:
+            return "id already exists"
+        if extra["binary_keys"] and not is_uuid(values["id"]):
+            return "id must be a UUID"
+        if entity == "users":
+            email = values["email"]
+            if email in extra["emails"] or email in seen["emails"]:
+                return "Email already registered"
+            seen["emails"].add(email)
+        elif entity == "places":
+            name = extra["owners"].get(values["owner_id"])
+            if name is None:
+                return "Owner not found"
+            for amenity_id in amenity_ids:
+                if amenity_id not in extra["amenities"]:
+                    return f"Amenity {amenity_id} not found"
+            values["owner_name"] = name
+        elif entity == "reviews":
+            name = extra["authors"].get(values["user_id"])
+            if name is None:
+                return "User not found"
+            owner_id = extra["owners"].get(values["place_id"])
+            if owner_id is None:
+                return "Place not found"
+            if owner_id == values["user_id"]:
+                return "Cannot review your own place"
+            pair = (values["place_id"], values["user_id"])
+            if pair in extra["reviewed"] or pair in seen["reviews"]:
+                return "You have already reviewed this place"
+            seen["reviews"].add(pair)
+            values["user_name"] = name
+        seen["ids"].add(values["id"])
+        return None
+
+    # ---------- inserts ----------
+
+    def _insert(self, entity, rows):
+        table = MODELS[entity].__table__
+        self.session.execute(insert(table), [values for _, values, _ in rows])
+        links = [{"place_id": values["id"], "amenity_id": a}
+                 for _, values, amenity_ids in rows for a in amenity_ids]
+        if links:
+            self.session.execute(insert(place_amenity), links)
+        if entity in ("places", "reviews"):
+            key = "id" if entity == "places" else "place_id"
+            rebuild_place_stats(self.session, list({values[key] for _, values, _ in rows}))
+
+    def _load(self, entity, valid):
+        """Insert one validated chunk and commit -> (rows imported, rejects)."""
+        valid, rejects = self._check(entity, valid)
+        if not valid:
+            return 0, rejects
+        try:
+            self._insert(entity, valid)
+            self.session.commit()
+            return len(valid), rejects
+        except IntegrityError:
+            self.session.rollback()
+        # isolate the offending rows
+        imported = 0
+        for row in valid:
+            try:
+                with self.session.begin_nested():
+                    self._insert(entity, [row])
+                imported += 1
+            except IntegrityError as e:
+                rejects.append((row[0], row[1], str(e.orig)))
+        self.session.commit()
+        return imported, rejects
@@ -0,0 +1,265 @@
+#!/usr/bin/python3
+"""
+In-process change events emitted by the facade.
+
+Every facade create, update and delete publishes an ``EntityEvent``
+once its transaction has committed. Inside a request the events are
+buffered on ``g`` and delivered together when the request tears down;
+outside a request (scripts, the review queue worker) each publish is
+delivered at once.
+
+Subscribers receive a list of events, filtered to the entity types they
+asked for. Plain functions run in the publishing thread; ``async def``
+subscribers run on the bus's own event loop thread, so they never hold
+up a response. A failing subscriber is logged and does not affect the
+others. Publish-to-delivered latency is kept per subscriber and exported
+with the request metrics.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from flask import g, has_request_context
+
+from app.metrics import DEFAULT_BUCKETS, Histogram
+
+logger = logging.getLogger(__name__)
+
+ENTITIES = ("user", "place", "review", "amenity")
+ACTIONS = ("created", "updated", "deleted")
+
+
+class EntityEvent:
+    """One committed change: ``entity`` ``action`` on ``entity_id``."""
+
+    __slots__ = ("entity", "action", "entity_id", "fields", "published_at")
+
+    def __init__(self, entity, action, entity_id, fields=()):
+        if entity not in ENTITIES:
+            raise ValueError(f"Unknown entity: {entity}")
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+        self.entity = entity
+        self.action = action
+        self.entity_id = entity_id
+        self.fields = tuple(fields)  # changed fields, for updates
+        self.published_at = time.perf_counter()
+
+    @property
+    def type(self):
+        return f"{self.entity}.{self.action}"
+
+    def __repr__(self):
+        return f"<EntityEvent {self.type} {self.entity_id}>"
+
+
+class _Subscription:
+    __slots__ = ("handler", "name", "entities", "is_async")
+
+    def __init__(self, handler, name, entities):
+        self.handler = handler
+        self.name = name
+        self.entities = frozenset(entities) if entities else None
+        self.is_async = inspect.iscoroutinefunction(handler)
+
+    def select(self, events):
+        if self.entities is None:
+            return events
+        return [e for e in events if e.entity in self.entities]
+
+
+class EventBus:
+    """Publish/subscribe for EntityEvents; see the module docstring."""
+
+    def __init__(self, app=None, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._subscriptions = []
+        self._lock = threading.Lock()
+        self._published = {}    # event type -> count
+        self._errors = {}       # subscriber -> count
+        self._latency = {}      # subscriber -> Histogram
+        self._loop = None
+        self._loop_pid = None
+        self._pending = set()   # futures of async deliveries in flight
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.teardown_request(self._flush_request)
+
+    # ==================== Subscribing ====================
+
+    def subscribe(self, handler, entities=None, name=None):
+        """
+        Call handler(events) with each batch of events for ``entities``
+        (all entities when None); ``async def`` handlers run on the bus
+        loop. Returns the handler.
+        """
+        for entity in entities or ():
+            if entity not in ENTITIES:
+                raise ValueError(f"Unknown entity: {entity}")
+        name = name or getattr(handler, "__qualname__", repr(handler))
+        with self._lock:
+            self._subscriptions.append(_Subscription(handler, name, entities))
+        return handler
+
+    def unsubscribe(self, handler):
+        with self._lock:
+            self._subscriptions = [s for s in self._subscriptions if s.handler != handler]
+
+    # ==================== Publishing ====================
+
+    def publish(self, entity, action, entity_id, fields=()):
+        """Record a committed change; delivered now or at request teardown."""
+        event = EntityEvent(entity, action, entity_id, fields)
+        with self._lock:
+            self._published[event.type] = self._published.get(event.type, 0) + 1
+        if has_request_context():
+            g.setdefault("_entity_events", []).append(event)
+        else:
+            self.deliver([event])
+        return event
+
+    def _flush_request(self, exc=None):
+        # events are only published after a commit, so they stand even
+        # if the request failed later on
+        events = g.pop("_entity_events", None)
+        if events:
+            self.deliver(events)
+
+    def deliver(self, events):
+        """Hand one batch to every interested subscriber."""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for sub in subscriptions:
+            batch = sub.select(events)
+            if not batch:
+                continue
+            if sub.is_async:
+                self._schedule(sub, batch)
+                continue
+            try:
+                sub.handler(batch)
+            except Exception:
+                self._failed(sub)
+            else:
+                self._delivered(sub, batch)
+
+    # ==================== Async subscribers ====================
+
+    def _event_loop(self):
+        with self._lock:
+            # a forked worker inherits the attribute but not the thread
+            if self._loop is None or self._loop_pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._loop_pid = os.getpid()
+                self._pending = set()
+                threading.Thread(target=self._loop.run_forever, name="event-bus",
+                                 daemon=True).start()
+            return self._loop
+
+    def _schedule(self, sub, batch):
+        future = asyncio.run_coroutine_threadsafe(self._run_async(sub, batch),
+                                                  self._event_loop())
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+
+    async def _run_async(self, sub, batch):
+        try:
+            await sub.handler(batch)
+        except Exception:
+            self._failed(sub)
+        else:
+            self._delivered(sub, batch)
+
+    def _forget(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def join(self, timeout=5.0):
+        """Wait for async deliveries in flight; True when none are left."""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                pending[0].result(remaining)
+            except Exception:
+                pass  # logged by _run_async; timeouts re-checked above
+
+    # ==================== Instrumentation ====================
+
+    def _delivered(self, sub, batch):
+        now = time.perf_counter()
+        with self._lock:
+            hist = self._latency.get(sub.name)
+            if hist is None:
+                hist = self._latency[sub.name] = Histogram(len(self.buckets))
+            for event in batch:
+                elapsed = now - event.published_at
+                hist.counts[bisect_left(self.buckets, elapsed)] += 1
+                hist.total += elapsed
+                hist.count += 1
+
+    def _failed(self, sub):
+        logger.exception("Event subscriber %s failed", sub.name)
+        with self._lock:
+            self._errors[sub.name] = self._errors.get(sub.name, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._published.clear()
+            self._errors.clear()
+            self._latency.clear()
+
+    def render(self):
+        """Event counters and delivery latency in Prometheus text format."""
+        with self._lock:
+            published = sorted(self._published.items())
+            errors = sorted(self._errors.items())
+            latency = sorted((name, list(h.counts), h.total, h.count)
+                             for name, h in self._latency.items())
+
+        lines = [
+            "# HELP hbnb_events_published_total Entity change events published.",
+            "# TYPE hbnb_events_published_total counter",
+        ]
+        for event_type, value in published:
+            lines.append(f'hbnb_events_published_total{{type="{event_type}"}} {value}')
+
+        lines += [
+            "# HELP hbnb_event_subscriber_errors_total Event batches a subscriber raised on.",
+            "# TYPE hbnb_event_subscriber_errors_total counter",
+        ]
+        for name, value in errors:
+            lines.append(f'hbnb_event_subscriber_errors_total{{subscriber="{name}"}} {value}')
+
+        lines += [
+            "# HELP hbnb_event_delivery_seconds Time from publish to subscriber done, per event.",
+            "# TYPE hbnb_event_delivery_seconds histogram",
+        ]
+        bounds = [repr(b) for b in self.buckets] + ["+Inf"]
+        for name, counts, total, count in latency:
+            labels = f'subscriber="{name}"'
+            cumulative = 0
+            for bound, value in zip(bounds, counts):
+                cumulative += value
+                lines.append(f'hbnb_event_delivery_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"hbnb_event_delivery_seconds_sum{{{labels}}} {total}")
+            lines.append(f"hbnb_event_delivery_seconds_count{{{labels}}} {count}")
+
+        return "\n".join(lines) + "\n"
+
+
+events = EventBus()
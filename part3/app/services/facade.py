@@ -1,13 +1,18 @@
 #!/usr/bin/python3
 """HBnB Facade (Tasks 1, 5, 6 & 7)."""
 
+from app.persistence.display_names import display_name
 from app.persistence.sqlalchemy_repository import (
     UserRepository, PlaceRepository, ReviewRepository, AmenityRepository
 )
+from app.persistence.sharding import (
+    ShardedPlaceRepository, ShardedReviewRepository, shards
+)
 from app.models.user import User
 from app.models.place import Place
 from app.models.review import Review
 from app.models.amenity import Amenity
+from app.services.events import events
 
 
 class HBnBFacade:
@@ -24,10 +29,35 @@ class HBnBFacade:
         self.user_repo = UserRepository()
         
         # ==================== TASK 7: Place, Review, Amenity ====================
-        self.place_repo = PlaceRepository()
-        self.review_repo = ReviewRepository()
+        self._place_repo = PlaceRepository()
+        self._review_repo = ReviewRepository()
         self.amenity_repo = AmenityRepository()
 
+        # used instead when the app has DATABASE_SHARDS
+        self._sharded_place_repo = ShardedPlaceRepository()
+        self._sharded_review_repo = ShardedReviewRepository()
+
+    @staticmethod
+    def _updated(entity, entity_id, data, obj):
+        """Publish entity.updated once the repository has committed."""
+        if obj is not None:
+            events.publish(entity, "updated", entity_id, data)
+        return obj
+
+    @staticmethod
+    def _deleted(entity, entity_id, deleted):
+        if deleted:
+            events.publish(entity, "deleted", entity_id)
+        return deleted
+
+    @property
+    def place_repo(self):
+        return self._sharded_place_repo if shards.enabled() else self._place_repo
+
+    @property
+    def review_repo(self):
+        return self._sharded_review_repo if shards.enabled() else self._review_repo
+
     # ==================== USERS (Tasks 1, 5 & 6) ====================
 
     def create_user(self, user_data):
@@ -51,15 +81,21 @@ class HBnBFacade:
         user = User(**user_data)
         
         # Save to database (Task 6)
-        return self.user_repo.add(user)
+        user = self.user_repo.add(user)
+        events.publish("user", "created", user.id)
+        return user
 
-    def get_user(self, user_id):
+    def get_user(self, user_id, fields=None):
         """Get user by ID (Task 6)."""
-        return self.user_repo.get(user_id)
+        return self.user_repo.get(user_id, fields)
 
-    def get_users(self):
+    def get_users(self, fields=None):
         """Get all users (Task 6)."""
-        return self.user_repo.get_all()
+        return self.user_repo.get_all(fields)
+
+    def get_many_users(self, ids, fields=None):
+        """Fetch users by id in one query; None where an id is missing."""
+        return self.user_repo.get_many(ids, fields)
 
     def get_user_by_email(self, email):
         """Get user by email using UserRepository (Task 6)."""
@@ -91,11 +127,23 @@ class HBnBFacade:
                 raise ValueError("Email already registered")
         
         # Update user (Task 6)
-        return self.user_repo.update(user_id, data)
+        old_name = display_name(user.first_name, user.last_name)
+        user = self.user_repo.update(user_id, data)
+        if user and shards.enabled():
+            # the rename listener only rewrites the primary's copies
+            name = display_name(user.first_name, user.last_name)
+            if name != old_name:
+                self.place_repo.rename_owner(user_id, name)
+                self.review_repo.rename_user(user_id, name)
+        return self._updated("user", user_id, data, user)
 
     def delete_user(self, user_id):
         """Delete user by ID (Task 6)."""
-        return self.user_repo.delete(user_id)
+        if shards.enabled() and self.user_repo.get(user_id):
+            # the ORM cascade only reaches the primary; shard rows go first
+            self.review_repo.delete_by_user(user_id)
+            self.place_repo.delete_by_owner(user_id)
+        return self._deleted("user", user_id, self.user_repo.delete(user_id))
 
     # ==================== PLACES (Task 7) ====================
 
@@ -112,24 +160,53 @@ class HBnBFacade:
         Raises:
             ValueError: If validation fails
         """
-        place = Place(**place_data)
-        return self.place_repo.add(place)
+        place_data = {k: v for k, v in place_data.items() if k != "owner_name"}
+        place = self.place_repo.add(Place(**place_data))
+        events.publish("place", "created", place.id)
+        return place
 
-    def get_place(self, place_id):
+    def get_place(self, place_id, fields=None):
         """Get place by ID (Task 7)."""
-        return self.place_repo.get(place_id)
+        return self.place_repo.get(place_id, fields)
+
+    def get_many_places(self, ids, fields=None):
+        """Fetch places by id in one query; None where an id is missing."""
+        return self.place_repo.get_many(ids, fields)
 
     def get_all_places(self):
         """Get all places (Task 7)."""
         return self.place_repo.get_all()
 
+    def iter_all_places(self, batch_size=500, fields=None):
+        """Stream all places, batch_size rows at a time."""
+        return self.place_repo.iter_all(batch_size, fields)
+
+    def list_places(self, sort=None, page=1, per_page=20, fields=None, amenity_ids=None):
+        """One sorted/filtered page of places -> (total, places)."""
+        return self.place_repo.get_page(sort, per_page, (page - 1) * per_page,
+                                        fields, amenity_ids)
+
+    def list_places_after(self, after=None, limit=20, fields=None):
+        """Next page of places in id order after the ``after`` cursor."""
+        return self.place_repo.get_after(after, limit, fields)
+
+    def iter_places_with_amenities(self, amenity_ids, batch_size=500, fields=None):
+        """Stream the places that have every amenity in amenity_ids."""
+        return self.place_repo.iter_with_amenities(amenity_ids, batch_size, fields)
+
+    def search_places(self, query, limit=20, offset=0):
+        """Full-text search over places, best match first."""
+        return self.place_repo.search(query, limit, offset)
+
     def update_place(self, place_id, data):
         """Update place information (Task 7)."""
-        return self.place_repo.update(place_id, data)
+        # owner_name is derived from the owner, never client-supplied
+        data = {k: v for k, v in data.items() if k != "owner_name"}
+        return self._updated("place", place_id, data, self.place_repo.update(place_id, data))
 
     def delete_place(self, place_id):
         """Delete place by ID (Task 7)."""
-        return self.place_repo.delete(place_id)
+        return self._deleted("place", place_id, self.place_repo.delete(place_id))
 
     # ==================== REVIEWS (Task 7) ====================
 
@@ -146,36 +223,60 @@ class HBnBFacade:
         Raises:
             ValueError: If validation fails
         """
-        review = Review(**review_data)
-        return self.review_repo.add(review)
+        review = self.review_repo.add(self.build_review(review_data))
+        events.publish("review", "created", review.id)
+        return review
+
+    def build_review(self, review_data):
+        """Validated, unsaved Review; raises ValueError like create_review."""
+        review_data = {k: v for k, v in review_data.items() if k != "user_name"}
+        return Review(**review_data)
+
+    def add_reviews(self, reviews):
+        """Save already built reviews in one transaction."""
+        reviews = self.review_repo.add_many(reviews)
+        for review in reviews:
+            events.publish("review", "created", review.id)
+        return reviews
 
-    def get_review(self, review_id):
+    def get_review(self, review_id, fields=None):
         """Get review by ID (Task 7)."""
-        return self.review_repo.get(review_id)
+        return self.review_repo.get(review_id, fields)
+
+    def get_many_reviews(self, ids, fields=None):
+        """Fetch reviews by id in one query; None where an id is missing."""
+        return self.review_repo.get_many(ids, fields)
 
     def get_all_reviews(self):
         """Get all reviews (Task 7)."""
         return self.review_repo.get_all()
 
-    def get_reviews_by_place(self, place_id):    #Task 8, Amaal
-        place = self.place_repo.get(place_id)
-        if not place:
-            return []
-        return place.reviews
+    def iter_all_reviews(self, batch_size=500, fields=None):
+        """Stream all reviews, batch_size rows at a time."""
+        return self.review_repo.iter_all(batch_size, fields)
 
-    def get_reviews_by_user(self, user_id):    #Task 8, Amaal
-        user = self.user_repo.get(user_id)
-        if not user:
-            return []
-        return user.reviews
+    def list_reviews_after(self, after=None, limit=20, fields=None):
+        """Next page of reviews in id order after the ``after`` cursor."""
+        return self.review_repo.get_after(after, limit, fields)
+
+    def search_reviews(self, query, limit=20, offset=0):
+        """Full-text search over reviews, best match first."""
+        return self.review_repo.search(query, limit, offset)
+
+    def get_reviews_by_place(self, place_id, fields=None):    #Task 8, Amaal
+        return self.review_repo.get_by_place(place_id, fields)
+
+    def get_reviews_by_user(self, user_id, fields=None):    #Task 8, Amaal
+        return self.review_repo.get_by_user(user_id, fields)
 
     def update_review(self, review_id, data):
         """Update review information (Task 7)."""
-        return self.review_repo.update(review_id, data)
+        data = {k: v for k, v in data.items() if k != "user_name"}
+        return self._updated("review", review_id, data, self.review_repo.update(review_id, data))
 
     def delete_review(self, review_id):
         """Delete review by ID (Task 7)."""
-        return self.review_repo.delete(review_id)
+        return self._deleted("review", review_id, self.review_repo.delete(review_id))
 
     # ==================== AMENITIES (Task 7) ====================
 
@@ -192,33 +293,56 @@ class HBnBFacade:
         Raises:
             ValueError: If validation fails
         """
-        amenity = Amenity(**amenity_data)
-        return self.amenity_repo.add(amenity)
+        amenity = self.amenity_repo.add(Amenity(**amenity_data))
+        events.publish("amenity", "created", amenity.id)
+        return amenity
 
-    def get_amenity(self, amenity_id):
+    def get_amenity(self, amenity_id, fields=None):
         """Get amenity by ID (Task 7)."""
-        return self.amenity_repo.get(amenity_id)
+        return self.amenity_repo.get(amenity_id, fields)
 
-    def get_all_amenities(self):
+    def get_many_amenities(self, ids, fields=None):
+        """Fetch amenities by id in one query; None where an id is missing."""
+        return self.amenity_repo.get_many(ids, fields)
+
+    def get_all_amenities(self, fields=None):
         """Get all amenities (Task 7)."""
-        return self.amenity_repo.get_all()
+        return self.amenity_repo.get_all(fields)
 
 
     def update_amenity(self, amenity_id, data):
         """Update amenity information (Task 7)."""
-        return self.amenity_repo.update(amenity_id, data)
+        return self._updated("amenity", amenity_id, data,
+                             self.amenity_repo.update(amenity_id, data))
+
     def delete_amenity(self, amenity_id):
         """Delete amenity by ID (Task 7)."""
-        return self.amenity_repo.delete(amenity_id)
+        return self._deleted("amenity", amenity_id, self.amenity_repo.delete(amenity_id))
         
+    # ==================== EXPORT ====================
+
+    EXPORT_MODELS = {"users": User, "places": Place, "reviews": Review, "amenities": Amenity}
+    EXPORT_HIDDEN = {"password"}
+
+    def export_rows(self, entity, batch_size=1000):
+        """
+        Column names and a stream of row-tuple batches covering a whole table.
+
+        Raises:
+            ValueError: If entity is not exportable
+        """
+        model = self.EXPORT_MODELS.get(entity)
+        if model is None:
+            raise ValueError(f"Unknown export entity: {entity}")
+        repo = {"users": self.user_repo, "places": self.place_repo,
+                "reviews": self.review_repo, "amenities": self.amenity_repo}[entity]
+        columns = [c.name for c in model.__table__.columns if c.name not in self.EXPORT_HIDDEN]
+        return columns, repo.iter_row_batches(columns, batch_size)
+
     # ==================== REVIEWS HELPERS (Task 3) Amaal ====================
 
     def get_review_by_user_and_place(self, user_id, place_id):
         """Check if a user has already reviewed a place."""
-        reviews = self.review_repo.get_all()
-        for review in reviews:
-            if review.user_id == user_id and review.place_id == place_id:
-                return review
-        return None
+        return self.review_repo.get_by_user_and_place(user_id, place_id)
 
 facade = HBnBFacade()
@@ -0,0 +1,237 @@
+#!/usr/bin/python3
+"""
+Write-behind queue for review submission.
+
+With ``REVIEW_WRITE_BEHIND`` on, POST /reviews/ validates the review,
+appends it to a local SQLite queue file (committed before the 202 goes
+out) and answers with a job id. A worker thread drains pending jobs in
+batches of ``REVIEW_QUEUE_BATCH``, saving each batch of reviews in one
+transaction, and stamps every job with the time its review became
+visible; GET /reviews/jobs/<job_id> reports it.
+
+Review ids are assigned at submission, so a job replayed after a crash
+between the review commit and the job update finds its review already
+stored and is marked done instead of being inserted twice.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.services.facade import facade
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_jobs (
+    id         TEXT PRIMARY KEY,
+    review_id  TEXT NOT NULL,
+    user_id    TEXT NOT NULL,
+    place_id   TEXT NOT NULL,
+    payload    TEXT NOT NULL,
+    status     TEXT NOT NULL DEFAULT 'pending',
+    error      TEXT,
+    queued_at  REAL NOT NULL,
+    visible_at REAL
+);
+CREATE INDEX IF NOT EXISTS ix_review_jobs_status ON review_jobs (status, queued_at);
+CREATE INDEX IF NOT EXISTS ix_review_jobs_place_user ON review_jobs (place_id, user_id);
+"""
+
+PAYLOAD_FIELDS = ("id", "text", "rating", "user_id", "place_id")
+
+
+def _iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat() if timestamp else None
+
+
+class JobStore:
+    """The queue file, behind one connection shared under a lock."""
+
+    def __init__(self, path):
+        self.path = path
+        self.reopen()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def reopen(self):
+        """Fresh lock and connection; a forked worker must not reuse its parent's."""
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+
+    def push(self, review):
+        job_id = str(uuid.uuid4())
+        payload = json.dumps({f: getattr(review, f) for f in PAYLOAD_FIELDS})
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO review_jobs (id, review_id, user_id, place_id, payload, queued_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, review.id, review.user_id, review.place_id, payload, time.time()),
+            )
+        return job_id
+
+    def pending(self, limit):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, payload FROM review_jobs WHERE status = 'pending' "
+                "ORDER BY queued_at LIMIT ?", (limit,)
+            ).fetchall()
+
+    def finish(self, results):
+        """Record (job_id, error) pairs; error None means the review is visible."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "UPDATE review_jobs SET status = ?, error = ?, visible_at = ? WHERE id = ?",
+                [("failed", error, None, job_id) if error else ("done", None, now, job_id)
+                 for job_id, error in results],
+            )
+            self._conn.execute("COMMIT")
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, review_id, user_id, status, error, queued_at, visible_at "
+                "FROM review_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("id", "review_id", "user_id", "status", "error", "queued_at", "visible_at")
+        return dict(zip(keys, row))
+
+    def has_pending(self, user_id, place_id):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM review_jobs WHERE place_id = ? AND user_id = ? "
+                "AND status = 'pending' LIMIT 1", (place_id, user_id)
+            ).fetchone() is not None
+
+    def counts(self):
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT status, count(*) FROM review_jobs GROUP BY status"
+            ).fetchall())
+
+    def close(self):
+        self._conn.close()
+
+
+class ReviewQueue:
+    """Flask extension owning the job store and its worker thread."""
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("REVIEW_WRITE_BEHIND", False)
+        app.config.setdefault("REVIEW_QUEUE_PATH", "review_queue.db")
+        app.config.setdefault("REVIEW_QUEUE_BATCH", 200)
+        app.config.setdefault("REVIEW_QUEUE_POLL", 0.05)
+        app.config.setdefault("REVIEW_QUEUE_WORKER", True)
+        app.extensions["review_queue"] = None
+        if not app.config["REVIEW_WRITE_BEHIND"]:
+            return
+
+        path = app.config["REVIEW_QUEUE_PATH"]
+        if not os.path.isabs(path):
+            os.makedirs(app.instance_path, exist_ok=True)
+            path = os.path.join(app.instance_path, path)
+        state = app.extensions["review_queue"] = {
+            "store": JobStore(path),
+            "wake": threading.Event(),
+        }
+        if app.config["REVIEW_QUEUE_WORKER"]:
+            threading.Thread(target=self._run, args=(app, state), name="review-queue",
+                             daemon=True).start()
+
+    @staticmethod
+    def _state():
+        return current_app.extensions.get("review_queue")
+
+    def enabled(self):
+        return self._state() is not None
+
+    def store(self):
+        return self._state()["store"]
+
+    # ==================== Submission ====================
+
+    def submit(self, review):
+        """Queue a built (validated, unsaved) review; returns its job status."""
+        state = self._state()
+        job_id = state["store"].push(review)
+        state["wake"].set()
+        return self.status(job_id)
+
+    def status(self, job_id):
+        job = self.store().get(job_id)
+        if job is not None:
+            job["queued_at"] = _iso(job["queued_at"])
+            job["visible_at"] = _iso(job["visible_at"])
+        return job
+
+    def is_pending(self, user_id, place_id):
+        return self.store().has_pending(user_id, place_id)
+
+    # ==================== Draining ====================
+
+    def drain(self):
+        """Save one batch of pending reviews; returns the number of jobs handled."""
+        store = self.store()
+        jobs = store.pending(current_app.config["REVIEW_QUEUE_BATCH"])
+        if not jobs:
+            return 0
+
+        results, built = [], []
+        for job_id, payload in jobs:
+            try:
+                built.append((job_id, facade.build_review(json.loads(payload))))
+            except ValueError as e:
+                results.append((job_id, str(e)))
+
+        reviews = [review for _, review in built]
+        try:
+            facade.add_reviews(reviews)
+            results.extend((job_id, None) for job_id, _ in built)
+        except SQLAlchemyError:
+            results.extend(self._save_one_by_one(built))
+        store.finish(results)
+        return len(jobs)
+
+    def _save_one_by_one(self, built):
+        """Isolate the rows that made a batch fail."""
+        for job_id, review in built:
+            try:
+                facade.add_reviews([review])
+                yield job_id, None
+            except SQLAlchemyError as e:
+                if facade.get_review(review.id) is not None:
+                    yield job_id, None  # saved before a crash; replayed
+                else:
+                    yield job_id, str(e.orig) if getattr(e, "orig", None) else str(e)
+
+    def _run(self, app, state):
+        poll = app.config["REVIEW_QUEUE_POLL"]
+        while True:
+            try:
+                with app.app_context():
+                    handled = self.drain()
+            except Exception:
+                logger.exception("Review queue drain failed")
+                handled = 0
+            if not handled:
+                state["wake"].wait(poll)
+                state["wake"].clear()
+
+
+review_queue = ReviewQueue()
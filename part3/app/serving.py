@@ -0,0 +1,218 @@
+#!/usr/bin/python3
+"""Pre-fork WSGI serving: preload in the parent, share pages with the workers
+
+The parent process builds the app once, warms it up (mappers, amenity
+bitmaps, the Swagger spec, first requests through every layer), moves
+everything it allocated into the GC's permanent generation with
+``gc.freeze()`` and only then forks. Children start with those pages
+shared copy-on-write; because the collector no longer walks the frozen
+objects, it no longer writes to their headers, so the pages stay shared
+instead of being copied in the first collection after the fork.
+
+Each child accepts from the one listening socket the parent opened and
+runs requests on a fixed pool of threads. See serve.py for the command.
+"""
+
+import gc
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.orm import configure_mappers
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+from app.persistence import all_engines
+from app.persistence.amenity_index import amenity_index
+from app.services.review_queue import review_queue
+
+# each worker has its own amenity bitmaps and only sees its own writes;
+# with several workers they are rebuilt at least this often (seconds)
+WORKER_AMENITY_INDEX_MAX_AGE = 10.0
+
+WARM_PATHS = (
+    "/swagger.json",
+    "/api/v1/amenities/",
+    "/api/v1/places/?fields=id,title,price",
+    "/api/v1/reviews/?fields=id,rating",
+)
+
+
+def preload(app, paths=WARM_PATHS):
+    """Pay every lazy first-use cost once, in the parent, before forking."""
+    configure_mappers()
+    with app.app_context():
+        amenity_index.bitmaps()
+    client = app.test_client()
+    for path in paths:
+        client.get(path)
+    # Pooled connections must not be shared with the children
+    for engine in all_engines(app):
+        engine.dispose()
+
+
+def configure_workers(app, workers):
+    """Settings that change when requests are split across several processes."""
+    if workers > 1 and not app.config.get("AMENITY_INDEX_MAX_AGE"):
+        app.config["AMENITY_INDEX_MAX_AGE"] = WORKER_AMENITY_INDEX_MAX_AGE
+
+
+def reset_after_fork(app):
+    """Drop what a child must not share with its parent: DB connections and locks."""
+    for engine in all_engines(app):
+        engine.dispose(close=False)
+    with app.app_context():
+        if review_queue.enabled():
+            review_queue.store().reopen()
+
+
+def quiet_handler(keep_alive=0, access_log=False):
+    """
+    Request handler for the pool.
+
+    Without keep-alive every response closes its connection (HTTP/1.0),
+    so an idle client never pins one of the worker's threads; with
+    ``keep_alive`` seconds connections are reused and closed after that
+    long without a request.
+    """
+    class Handler(WSGIRequestHandler):
+        protocol_version = "HTTP/1.1" if keep_alive else "HTTP/1.0"
+        timeout = keep_alive or None
+
+        def log_request(self, code="-", size="-"):
+            if access_log:
+                super().log_request(code, size)
+
+    return Handler
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    Werkzeug server that accepts on an inherited socket and handles on a
+    thread pool. It stops accepting while every thread is busy, leaving
+    new connections in the shared backlog for an idle sibling worker.
+    """
+
+    multithread = True
+    multiprocess = True
+
+    def __init__(self, app, sock, threads, handler=None):
+        self.pool = ThreadPoolExecutor(threads, thread_name_prefix="hbnb-request")
+        self.slots = threading.BoundedSemaphore(threads)
+        host, port = sock.getsockname()[:2]
+        super().__init__(host, port, app, handler=handler, fd=sock.fileno())
+        # Every worker wakes for a new connection; the ones that lose the
+        # race must get EAGAIN from accept() instead of blocking in it
+        self.socket.setblocking(False)
+
+    def process_request(self, request, client_address):
+        self.slots.acquire()
+        self.pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self.slots.release()
+
+
+class Arbiter:
+    """
+    Parent process: preloads the app, forks the workers and keeps
+    ``workers`` of them alive until SIGTERM/SIGINT.
+
+    Background threads started by the extensions (review write-behind
+    drain, replica sync) keep running in the parent only; workers read
+    the replica sync times from the replica files. With more than
+    one worker, AMENITY_INDEX_MAX_AGE defaults to
+    WORKER_AMENITY_INDEX_MAX_AGE so writes made in one worker reach the
+    amenity filters of the others.
+    """
+
+    def __init__(self, app, host="0.0.0.0", port=5001, workers=2, threads=8,
+                 keep_alive=0, access_log=False, freeze=True, backlog=2048):
+        self.app = app
+        self.host, self.port = host, port
+        self.workers, self.threads = workers, threads
+        self.handler = quiet_handler(keep_alive, access_log)
+        self.freeze = freeze
+        self.backlog = backlog
+        self.children = {}  # pid -> worker number
+        self.stopping = False
+        self.sock = None
+
+    def listen(self):
+        self.sock = socket.create_server((self.host, self.port), backlog=self.backlog)
+        self.port = self.sock.getsockname()[1]
+        return self.sock
+
+    def spawn(self, number):
+        pid = os.fork()
+        if pid:
+            self.children[pid] = number
+            return pid
+        code = 0
+        try:
+            self.serve_worker()
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+            code = 1
+        finally:
+            os._exit(code)
+
+    def serve_worker(self):
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        reset_after_fork(self.app)
+        server = PooledWSGIServer(self.app, self.sock, self.threads, self.handler)
+        signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(
+            target=server.shutdown, daemon=True).start())
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            server.pool.shutdown(wait=True)
+
+    def stop(self, signum=None, frame=None):
+        self.stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self):
+        configure_workers(self.app, self.workers)
+        preload(self.app)
+        if self.freeze:
+            gc.collect()
+            gc.freeze()
+        if self.sock is None:
+            self.listen()
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for number in range(self.workers):
+            self.spawn(number)
+        print(f"Serving on http://{self.host}:{self.port} with {self.workers} workers "
+              f"x {self.threads} threads (pid {os.getpid()})", file=sys.stderr, flush=True)
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            number = self.children.pop(pid, None)
+            if number is None or self.stopping:
+                continue
+            print(f"Worker {number} (pid {pid}) exited with status {status}, restarting",
+                  file=sys.stderr, flush=True)
+            time.sleep(0.5)
+            self.spawn(number)
+        self.sock.close()
+        return 0
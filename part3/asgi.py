@@ -0,0 +1,10 @@
+#!/usr/bin/python3
+"""HBnB Part 3 ASGI entry point - async read-only API
+
+    uvicorn asgi:app --host 0.0.0.0 --port 5002
+"""
+
+from app.asgi import create_asgi_app
+from config import DevelopmentConfig
+
+app = create_asgi_app(DevelopmentConfig)
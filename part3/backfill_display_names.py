@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+HBnB - Fill places.owner_name / reviews.user_name for rows created before
+the denormalized columns existed
+
+Adds the columns first if the database predates them (the app also does
+that on startup), on the primary and on every shard.
+
+Usage:
+    python backfill_display_names.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app
+from config import DevelopmentConfig
+from app.persistence import primary_engines
+from app.persistence.display_names import ensure_display_names
+
+
+def main():
+    app = create_app(DevelopmentConfig)
+    with app.app_context():
+        for engine in primary_engines(app):
+            ensure_display_names(engine)
+        print("Display names backfilled")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+HBnB - Amenity filter benchmark
+
+Builds AmenityBitmaps for a synthetic catalogue and times
+"places having all of these amenities" against the previous approach
+(scan every place and test its amenity set).
+
+Usage:
+    python benchmarks/amenity_filter.py --places 500000 --amenities 30
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.persistence.amenity_index import AmenityBitmaps  # noqa: E402
+
+
+def catalogue(places, amenities, seed=42):
+    """(place_id, amenity_id) pairs; amenity i is on roughly 1/(i+1.5) of places."""
+    rng = random.Random(seed)
+    amenity_ids = [f"amenity-{i}" for i in range(amenities)]
+    popularity = [1 / (i + 1.5) for i in range(amenities)]
+    by_place = {}
+    for _ in range(places):
+        by_place[str(uuid.UUID(int=rng.getrandbits(128)))] = {
+            a for a, p in zip(amenity_ids, popularity) if rng.random() < p
+        }
+    return amenity_ids, by_place
+
+
+def best_of(fn, repeat):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Amenity filter benchmark")
+    parser.add_argument("--places", type=int, default=500000)
+    parser.add_argument("--amenities", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    amenity_ids, by_place = catalogue(args.places, args.amenities)
+    pairs = [(p, a) for p, amenities in by_place.items() for a in amenities]
+
+    index = AmenityBitmaps()
+    start = time.perf_counter()
+    index.load(pairs)
+    build = time.perf_counter() - start
+
+    print("\n" + "=" * 72)
+    print(f"Amenity filter - {args.places} places, {len(pairs)} links, "
+          f"build {build * 1000:.0f} ms, {index.stats()['bytes'] / 1024:.0f} KiB")
+    print("=" * 72)
+    print(f"{'filter':<28}{'matches':>10}{'scan ms':>12}{'bitmap ms':>12}")
+    for combo in ([amenity_ids[0]], amenity_ids[:2], amenity_ids[:3], amenity_ids[1:4]):
+        wanted = set(combo)
+        scan, expected = best_of(
+            lambda: [p for p, amenities in by_place.items() if wanted <= amenities], args.repeat)
+        bitmap, matched = best_of(lambda: index.match_all(combo), args.repeat)
+        assert sorted(matched) == sorted(expected)
+        label = "+".join(a.split("-")[1] for a in combo)
+        print(f"{'amenity ' + label:<28}{len(matched):>10}{scan * 1000:>12.1f}{bitmap * 1000:>12.1f}")
+    print("=" * 72 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
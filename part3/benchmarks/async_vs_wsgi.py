@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+HBnB - Concurrent-connection throughput: async ASGI read API vs threaded WSGI
+
+Opens N keep-alive connections against each server and issues public GET
+requests (place detail and place list) for a fixed duration, reporting
+requests/s and p99 latency per concurrency level.
+
+By default both servers are spawned on a temporary seeded SQLite file:
+    - WSGI: the Flask app on Werkzeug's threaded server
+    - ASGI: asgi:app on uvicorn
+
+Usage:
+    python benchmarks/async_vs_wsgi.py --concurrency 1 8 32 64 --duration 5
+    python benchmarks/async_vs_wsgi.py --wsgi-url http://127.0.0.1:5001 \\
+        --asgi-url http://127.0.0.1:5002
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+PART3_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PART3_DIR)
+
+from load_test import HTTPClient, percentile  # noqa: E402
+
+
+def seed(db_path, places):
+    from app import create_app
+    from app.extensions import db
+    from app.models.place import Place
+    from app.models.user import User
+    from config import Config
+
+    class SeedConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
+
+    app = create_app(SeedConfig)
+    with app.app_context():
+        db.create_all()
+        owner = User(first_name="Bench", last_name="Owner", email="bench@hbnb.com")
+        owner.hash_password("bench-pass")
+        db.session.add(owner)
+        db.session.commit()
+        for i in range(places):
+            db.session.add(Place(title=f"Place {i}", description="Benchmark place",
+                                 price=50.0 + i, latitude=1.0, longitude=1.0,
+                                 owner_id=owner.id))
+        db.session.commit()
+
+
+def spawn(command, env, url):
+    proc = subprocess.Popen(command, cwd=PART3_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    client = HTTPClient(url, timeout=1)
+    for _ in range(100):
+        try:
+            client.request("GET", "/api/v1/amenities/")
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise SystemExit(f"Server did not start: {' '.join(command)}")
+
+
+def run_level(url, concurrency, duration, place_ids):
+    client = HTTPClient(url)
+    samples = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(seed_value):
+        rng = random.Random(seed_value)
+        local = []
+        while time.perf_counter() < deadline:
+            if rng.random() < 0.8:
+                path = f"/api/v1/places/{rng.choice(place_ids)}"
+            else:
+                path = "/api/v1/places/?fields=id,title,price"
+            start = time.perf_counter()
+            try:
+                client.request("GET", path)
+            except OSError:
+                continue
+            local.append(time.perf_counter() - start)
+        with lock:
+            samples.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    samples.sort()
+    return len(samples) / elapsed, percentile(samples, 99) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ASGI vs WSGI read throughput")
+    parser.add_argument("--wsgi-url")
+    parser.add_argument("--asgi-url")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--places", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    procs = []
+    wsgi_url, asgi_url = args.wsgi_url, args.asgi_url
+    if not (wsgi_url and asgi_url):
+        db_path = os.path.join(tempfile.mkdtemp(prefix="hbnb-async-"), "bench.db")
+        seed(db_path, args.places)
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}", METRICS_ENABLED="0")
+        wsgi_url, asgi_url = "http://127.0.0.1:5101", "http://127.0.0.1:5102"
+        procs.append(spawn([sys.executable, "-c",
+                            "from app import create_app; from config import DevelopmentConfig; "
+                            "create_app(DevelopmentConfig).run(port=5101, threaded=True)"],
+                           env, wsgi_url))
+        procs.append(spawn([sys.executable, "-m", "uvicorn", "asgi:app", "--port", "5102",
+                            "--log-level", "warning"], env, asgi_url))
+
+    try:
+        status, body = HTTPClient(wsgi_url).request("GET", "/api/v1/places/?fields=id")
+        place_ids = [p["id"] for p in json.loads(body)]
+        print("\n" + "=" * 64)
+        print(f"{'connections':>12}{'WSGI req/s':>13}{'p99 ms':>9}{'ASGI req/s':>13}{'p99 ms':>9}")
+        for level in args.concurrency:
+            wsgi_rps, wsgi_p99 = run_level(wsgi_url, level, args.duration, place_ids)
+            asgi_rps, asgi_p99 = run_level(asgi_url, level, args.duration, place_ids)
+            print(f"{level:>12}{wsgi_rps:>13.1f}{wsgi_p99:>9.1f}{asgi_rps:>13.1f}{asgi_p99:>9.1f}")
+        print("=" * 64 + "\n")
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+HBnB - GET /api/v1/export/places throughput and memory
+
+Seeds a temporary SQLite database with --rows places (bulk Core insert),
+then downloads the export in each format, plain and gzip, through the
+Flask test client, consuming the streamed body chunk by chunk. Reports
+rows/s, MB sent, and the peak Python heap growth while streaming
+(tracemalloc, measured on a separate pass since it slows the run down),
+which should stay flat as --rows grows.
+
+Usage:
+    python benchmarks/export_rows.py --rows 200000
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+
+PART3_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PART3_DIR)
+
+
+def make_app(tmp):
+    from app import create_app
+    from config import Config
+
+    class ExportConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp, 'hbnb.db')}"
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+        SQLALCHEMY_SLOW_QUERY_MS = float("inf")
+        JWT_SECRET_KEY = "export-benchmark-secret-key-0123456789abcdef"
+        METRICS_ENABLED = False
+
+    return create_app(ExportConfig)
+
+
+def seed(app, rows):
+    from flask_jwt_extended import create_access_token
+    from sqlalchemy import insert
+
+    from app.extensions import db
+    from app.models.place import Place
+    from app.models.user import User
+
+    with app.app_context():
+        db.create_all()
+        admin = User(first_name="Export", last_name="Admin", email="admin@export.hbnb",
+                     is_admin=True)
+        admin.password = "x" * 60  # never logs in
+        db.session.add(admin)
+        db.session.commit()
+        now = datetime.utcnow()
+        for start in range(0, rows, 10000):
+            db.session.execute(insert(Place.__table__), [
+                {"id": str(uuid.uuid4()), "title": f"Export place {i}",
+                 "description": "A place, exported", "price": 50.0 + i % 500,
+                 "latitude": 1.0, "longitude": 1.0, "owner_id": admin.id,
+                 "owner_name": "Export Admin", "created_at": now, "updated_at": now}
+                for i in range(start, min(start + 10000, rows))
+            ])
+        db.session.commit()
+        return create_access_token(identity=admin.id, additional_claims={"is_admin": True})
+
+
+def download(client, token, fmt, gzip):
+    headers = {"Authorization": f"Bearer {token}"}
+    if gzip:
+        headers["Accept-Encoding"] = "gzip"
+    start = time.perf_counter()
+    response = client.get(f"/api/v1/export/places?format={fmt}", headers=headers, buffered=False)
+    sent = sum(len(chunk) for chunk in response.response)
+    response.close()
+    return time.perf_counter() - start, sent
+
+
+def peak_heap(client, token, fmt, gzip):
+    tracemalloc.start()
+    download(client, token, fmt, gzip)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export endpoint throughput")
+    parser.add_argument("--rows", type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    tmp = tempfile.mkdtemp(prefix="hbnb-export-")
+    try:
+        app = make_app(tmp)
+        token = seed(app, args.rows)
+        client = app.test_client()
+        print("\n" + "=" * 56)
+        print(f"{args.rows} places")
+        print(f"{'format':>10}{'gzip':>6}{'rows/s':>12}{'MB':>9}{'peak heap MB':>15}")
+        for fmt in ("ndjson", "csv"):
+            for gzip in (False, True):
+                elapsed, sent = download(client, token, fmt, gzip)
+                peak = peak_heap(client, token, fmt, gzip)
+                print(f"{fmt:>10}{'yes' if gzip else 'no':>6}{args.rows / elapsed:>12,.0f}"
+                      f"{sent / 1e6:>9.1f}{peak / 1e6:>15.1f}")
+        print("=" * 56 + "\n")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+HBnB - Fragment cache benchmark for list responses
+
+Seeds places (with review statistics) and reviews, then times full list
+requests through the test client with the fragment cache off and warm,
+for every available JSON encoder. The warm runs still load every row
+from the database; only serialization is skipped.
+
+Usage:
+    python benchmarks/fragment_cache.py --places 20000 --reviews 50000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.encoders import ENCODERS
+from app.extensions import db
+from app.fragment_cache import current_fragment_cache
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.persistence.place_stats import rebuild_place_stats
+from config import Config
+
+PATHS = ("/api/v1/places/", "/api/v1/places/?fields=id,title,price", "/api/v1/reviews/")
+
+
+def seed_database(path, places, reviews):
+    class SeedConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{path}"
+        METRICS_ENABLED = False
+
+    rng = random.Random(5)
+    app = create_app(SeedConfig)
+    with app.app_context():
+        db.create_all()
+        users = [User(first_name="Bench", last_name=f"User {i}", email=f"frag{i}@hbnb.com",
+                      password="x" * 60) for i in range(200)]
+        db.session.add_all(users)
+        db.session.commit()
+        user_ids = [u.id for u in users]
+        now = datetime.utcnow()
+        place_rows = [{
+            "id": str(uuid.uuid4()), "title": f"Place {i}",
+            "description": "A comfortable place to stay. " * 8,
+            "price": 100.0 + i % 50, "latitude": 24.7, "longitude": 46.7,
+            "owner_id": user_ids[0], "owner_name": "Bench User 0",
+            "created_at": now, "updated_at": now,
+        } for i in range(places)]
+        db.session.execute(Place.__table__.insert(), place_rows)
+        pairs = set()
+        while len(pairs) < reviews:
+            pairs.add((rng.choice(place_rows)["id"], rng.choice(user_ids[1:])))
+        db.session.execute(Review.__table__.insert(), [{
+            "id": str(uuid.uuid4()), "text": "Lovely stay, would come back. " * 3,
+            "rating": rng.randint(1, 5), "place_id": p, "user_id": u,
+            "user_name": "Bench User", "created_at": now, "updated_at": now,
+        } for p, u in pairs])
+        rebuild_place_stats(db.session)
+        db.session.commit()
+
+
+def best_of(client, path, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        client.get(path).get_data()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(path, encoder, cache_bytes, repeat):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{path}"
+        METRICS_ENABLED = False
+        JSON_ENCODER = encoder
+        FRAGMENT_CACHE_BYTES = cache_bytes
+
+    app = create_app(BenchConfig)
+    client = app.test_client()
+    results = {}
+    for url in PATHS:
+        client.get(url).get_data()  # warm the cache (and SQLite's page cache)
+        results[url] = best_of(client, url, repeat)
+    with app.app_context():
+        stats = current_fragment_cache().stats()
+    return results, stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fragment cache benchmark")
+    parser.add_argument("--places", type=int, default=20000)
+    parser.add_argument("--reviews", type=int, default=50000)
+    parser.add_argument("--cache-mb", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    tmp = tempfile.mkdtemp(prefix="hbnb-fragments-")
+    try:
+        db_path = os.path.join(tmp, "bench.db")
+        seed_database(db_path, args.places, args.reviews)
+        results = {}
+        for encoder in ENCODERS:
+            results[encoder] = (bench(db_path, encoder, 0, args.repeat)[0],
+                                *bench(db_path, encoder, args.cache_mb * 1024 * 1024,
+                                       args.repeat))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print("\n" + "=" * 72)
+    print(f"Fragment cache - {args.places} places, {args.reviews} reviews "
+          f"(best of {args.repeat})")
+    print("=" * 72)
+    print(f"{'encoder':<8}{'request':<40}{'off ms':>8}{'warm ms':>9}{'change':>7}")
+    for encoder, (off, warm, stats) in results.items():
+        for url in PATHS:
+            print(f"{encoder:<8}{url:<40}{off[url] * 1000:>8.1f}{warm[url] * 1000:>9.1f}"
+                  f"{(warm[url] / off[url] - 1) * 100:>+6.0f}%")
+        print(f"{'':<8}cache: {stats['entries']} entries, {stats['bytes'] / 1e6:.1f} MB")
+    print("=" * 72 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+HBnB - Insert throughput with random (UUIDv4) vs time-ordered (UUIDv7) ids
+
+Appends ``--rows`` users to a fresh SQLite file once per generator, in
+batches of ``--batch`` rows per transaction, with SQLite's default page
+cache. Random ids land all over the primary-key B-tree, so once the
+index outgrows the cache most inserts read and split a cold page;
+UUIDv7 ids always land on its right edge. Reports rows/s for each tenth
+of the run (the gap widens as the table grows), the total time, and
+the file and index sizes after the run.
+
+Usage:
+    python benchmarks/id_inserts.py                        # 10M rows each
+    python benchmarks/id_inserts.py --rows 2000000 --storage binary
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+PART3_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PART3_DIR)
+
+GENERATORS = ("uuid4", "uuid7")
+
+
+def run(path, generator, rows, batch, storage):
+    """Insert ``rows`` users; returns ([rows/s per tenth], seconds, file MB, index MB)."""
+    from sqlalchemy import create_engine, insert
+
+    from app.extensions import db
+    from app.models.ids import GENERATORS as SOURCES
+    from app.models.types import use_binary_keys
+    from app.models.user import User
+
+    engine = create_engine(f"sqlite:///{path}")
+    use_binary_keys(engine, storage == "binary")
+    db.metadata.create_all(engine, tables=[User.__table__])
+    new_id = SOURCES[generator]
+    now = datetime.utcnow()
+    tenth = max(rows // 10, batch)
+    rates, done, mark = [], 0, 0
+    start = segment = time.perf_counter()
+    with engine.connect() as connection:
+        while done < rows:
+            count = min(batch, rows - done)
+            with connection.begin():
+                connection.execute(insert(User.__table__), [
+                    {"id": new_id(), "first_name": "Id", "last_name": "Bench",
+                     "email": f"u{i:09d}@ids.hbnb", "password": "x" * 60,
+                     "is_admin": False, "created_at": now, "updated_at": now}
+                    for i in range(done, done + count)])
+            done += count
+            if done % tenth == 0 or done == rows:
+                lap = time.perf_counter()
+                rates.append((done - mark) / (lap - segment))
+                segment, mark = lap, done
+                print(f"  {generator} {done:>11,} rows {rates[-1]:>9,.0f} rows/s",
+                      file=sys.stderr)
+        total = time.perf_counter() - start
+        index = connection.exec_driver_sql(
+            "SELECT sum(pgsize) FROM dbstat WHERE name LIKE 'sqlite_autoindex_users%'").scalar()
+    engine.dispose()
+    return rates, total, os.path.getsize(path) / 1e6, (index or 0) / 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="UUIDv4 vs UUIDv7 insert throughput")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--storage", choices=("text", "binary"), default="text")
+    args = parser.parse_args(argv)
+
+    tmp = tempfile.mkdtemp(prefix="hbnb-ids-")
+    try:
+        results = {}
+        for generator in GENERATORS:
+            results[generator] = run(os.path.join(tmp, generator + ".db"), generator,
+                                     args.rows, args.batch, args.storage)
+            os.remove(os.path.join(tmp, generator + ".db"))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print("\n" + "=" * 60)
+    print(f"{args.rows:,} users, {args.storage} keys, {args.batch:,} rows per transaction")
+    print(f"{'rows/s':>20}" + "".join(f"{g:>12}" for g in GENERATORS))
+    for i in range(len(results["uuid4"][0])):
+        print(f"{f'tenth {i + 1}':>20}"
+              + "".join(f"{results[g][0][i]:>12,.0f}" for g in GENERATORS))
+    for label, index, fmt in (("total s", 1, ".1f"), ("file MB", 2, ".1f"),
+                              ("index MB", 3, ".1f")):
+        print(f"{label:>20}" + "".join(f"{results[g][index]:>12{fmt}}" for g in GENERATORS))
+    print("=" * 60 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+HBnB - JSON encoder benchmark for large list responses
+
+Compares every available encoder (stdlib json, orjson when installed):
+    - encoding a list of place_to_dict-shaped rows with timestamps
+    - GET /api/v1/places/ end to end through the test client
+
+Usage:
+    python benchmarks/json_encoders.py --rows 20000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.encoders import ENCODERS
+from app.extensions import db
+from app.models.place import Place
+from app.models.user import User
+from config import Config
+
+
+def sample_rows(n):
+    now = datetime.utcnow()
+    return [{
+        "id": str(uuid.uuid4()),
+        "title": f"Place {i}",
+        "description": "A comfortable place to stay. " * 8,
+        "price": 100.0 + i % 50,
+        "latitude": 24.7136,
+        "longitude": 46.6753,
+        "owner_id": str(uuid.uuid4()),
+        "created_at": now,
+    } for i in range(n)]
+
+
+def bench_encode(rows, repeat):
+    results = {}
+    for name, dumps in ENCODERS.items():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            dumps(rows)
+            best = min(best, time.perf_counter() - start)
+        results[name] = best
+    return results
+
+
+def seed_database(path, n):
+    class SeedConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{path}"
+        METRICS_ENABLED = False
+
+    app = create_app(SeedConfig)
+    with app.app_context():
+        db.create_all()
+        owner = User(first_name="Bench", last_name="Owner", email="bench@hbnb.com")
+        owner.hash_password("bench-pass")
+        db.session.add(owner)
+        db.session.commit()
+        now = datetime.utcnow()
+        db.session.execute(Place.__table__.insert(), [{
+            "id": str(uuid.uuid4()), "title": f"Place {i}",
+            "description": "A comfortable place to stay. " * 8,
+            "price": 100.0 + i % 50, "latitude": 24.7, "longitude": 46.7,
+            "owner_id": owner.id, "created_at": now, "updated_at": now,
+        } for i in range(n)])
+        db.session.commit()
+
+
+def bench_endpoint(path, repeat):
+    results = {}
+    for name in ENCODERS:
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{path}"
+            METRICS_ENABLED = False
+            JSON_ENCODER = name
+
+        client = create_app(BenchConfig).test_client()
+        client.get("/api/v1/places/").get_data()
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            client.get("/api/v1/places/").get_data()
+            best = min(best, time.perf_counter() - start)
+        results[name] = best
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="JSON encoder benchmark")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    encode = bench_encode(sample_rows(args.rows), args.repeat)
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix="hbnb-json-"), "bench.db")
+    seed_database(db_path, args.rows)
+    endpoint = bench_endpoint(db_path, args.repeat)
+
+    print("\n" + "=" * 60)
+    print(f"JSON encoders - {args.rows} rows (best of {args.repeat})")
+    print("=" * 60)
+    print(f"{'encoder':<10}{'encode list ms':>18}{'GET /places/ ms':>20}")
+    for name in ENCODERS:
+        print(f"{name:<10}{encode[name] * 1000:>18.1f}{endpoint[name] * 1000:>20.1f}")
+    print("=" * 60 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+HBnB - Text vs binary UUID keys: database size and join speed
+
+Seeds a SQLite file with text keys, copies it to a binary-key file with
+app.persistence.key_storage.copy_database (what migrate_id_storage.py
+does), VACUUMs both and compares:
+
+    - file size, and table vs index pages (SQLite's dbstat table)
+    - raw SQL joins over the keys (no Python conversion involved)
+    - ORM point lookups and review lists, which pay the bytes <-> str
+      conversion on every key
+
+Usage:
+    python benchmarks/key_storage.py --places 50000 --reviews 200000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+PART3_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PART3_DIR)
+
+JOINS = {
+    "reviews per place": (
+        "SELECT p.id, count(*) FROM places p JOIN reviews r ON r.place_id = p.id "
+        "GROUP BY p.id"
+    ),
+    "place x amenity x owner": (
+        "SELECT count(*) FROM place_amenity pa "
+        "JOIN places p ON p.id = pa.place_id "
+        "JOIN amenities a ON a.id = pa.amenity_id "
+        "JOIN users u ON u.id = p.owner_id"
+    ),
+}
+
+
+def seed(engine, users, places, reviews, amenities):
+    from sqlalchemy import insert
+
+    from app.extensions import db
+    from app.models.amenity import Amenity
+    from app.models.place import Place, place_amenity
+    from app.models.review import Review
+    from app.models.user import User
+    from app.persistence.place_stats import rebuild_place_stats
+    from sqlalchemy.orm import Session
+
+    rng = random.Random(7)
+    now = datetime.utcnow()
+    db.metadata.create_all(engine)
+    user_ids = [str(uuid.uuid4()) for _ in range(users)]
+    place_ids = [str(uuid.uuid4()) for _ in range(places)]
+    amenity_ids = [str(uuid.uuid4()) for _ in range(amenities)]
+    with engine.begin() as connection:
+        connection.execute(insert(User.__table__), [
+            {"id": u, "first_name": "Key", "last_name": f"User {i}", "email": f"u{i}@keys.hbnb",
+             "password": "x" * 60, "is_admin": False, "created_at": now, "updated_at": now}
+            for i, u in enumerate(user_ids)])
+        connection.execute(insert(Amenity.__table__), [
+            {"id": a, "name": f"Amenity {i}", "created_at": now, "updated_at": now}
+            for i, a in enumerate(amenity_ids)])
+        owners = {}
+        for start in range(0, places, 10000):
+            rows = []
+            for i in range(start, min(start + 10000, places)):
+                owners[place_ids[i]] = rng.choice(user_ids)
+                rows.append({"id": place_ids[i], "title": f"Place {i}", "description": "Keyed",
+                             "price": 50.0 + i % 300, "latitude": 1.0, "longitude": 1.0,
+                             "owner_id": owners[place_ids[i]], "owner_name": "Key User",
+                             "created_at": now, "updated_at": now})
+            connection.execute(insert(Place.__table__), rows)
+        connection.execute(insert(place_amenity), [
+            {"place_id": p, "amenity_id": a}
+            for p in place_ids for a in rng.sample(amenity_ids, 3)])
+        pairs = set()
+        while len(pairs) < reviews:
+            place_id, user_id = rng.choice(place_ids), rng.choice(user_ids)
+            if owners[place_id] != user_id:
+                pairs.add((place_id, user_id))
+        pairs = list(pairs)
+        for start in range(0, reviews, 10000):
+            connection.execute(insert(Review.__table__), [
+                {"id": str(uuid.uuid4()), "text": "Fine", "rating": rng.randint(1, 5),
+                 "place_id": p, "user_id": u, "user_name": "Key User",
+                 "created_at": now, "updated_at": now}
+                for p, u in pairs[start:start + 10000]])
+    with Session(engine) as session:
+        rebuild_place_stats(session)
+        session.commit()
+    return place_ids
+
+
+def sizes(engine):
+    """(file MB, table MB, index MB); FTS shadow tables count as tables."""
+    with engine.connect() as connection:
+        pages = connection.exec_driver_sql(
+            "SELECT s.name, m.type, sum(s.pgsize) FROM dbstat s "
+            "LEFT JOIN sqlite_schema m ON m.name = s.name GROUP BY s.name").all()
+    tables = sum(size for _, kind, size in pages if kind != "index")
+    indexes = sum(size for _, kind, size in pages if kind == "index")
+    return os.path.getsize(engine.url.database) / 1e6, tables / 1e6, indexes / 1e6
+
+
+def best_of(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def timings(engine, place_ids, lookups):
+    from sqlalchemy.orm import Session, selectinload
+
+    from app.models.place import Place
+    from app.models.review import Review
+
+    rng = random.Random(11)
+    sample = rng.sample(place_ids, lookups)
+    results = {}
+    with engine.connect() as connection:
+        for name, sql in JOINS.items():
+            results[name] = best_of(lambda: connection.exec_driver_sql(sql).all())
+
+    def point_lookups():
+        with Session(engine) as session:
+            for place_id in sample:
+                session.get(Place, place_id)
+
+    def review_lists():
+        with Session(engine) as session:
+            for place_id in sample:
+                session.query(Review).filter_by(place_id=place_id).all()
+
+    def place_page():
+        with Session(engine) as session:
+            session.query(Place).options(selectinload(Place.amenities)).limit(1000).all()
+
+    results[f"{lookups} ORM gets"] = best_of(point_lookups, 3)
+    results[f"{lookups} review lists"] = best_of(review_lists, 3)
+    results["1000 places + amenities"] = best_of(place_page, 3)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Text vs binary UUID keys")
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--places", type=int, default=50000)
+    parser.add_argument("--reviews", type=int, default=200000)
+    parser.add_argument("--amenities", type=int, default=30)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    from sqlalchemy import create_engine
+
+    import app.persistence.sqlalchemy_repository  # noqa: F401 - model listeners
+    from app.models.types import use_binary_keys
+    from app.persistence.key_storage import copy_database
+
+    tmp = tempfile.mkdtemp(prefix="hbnb-keys-")
+    try:
+        engines = {}
+        for storage in ("text", "binary"):
+            engines[storage] = create_engine(f"sqlite:///{os.path.join(tmp, storage + '.db')}")
+            use_binary_keys(engines[storage], storage == "binary")
+        start = time.perf_counter()
+        place_ids = seed(engines["text"], args.users, args.places, args.reviews, args.amenities)
+        print(f"seeded in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+        start = time.perf_counter()
+        copy_database(engines["text"], engines["binary"])
+        print(f"copied in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+        for engine in engines.values():
+            with engine.connect() as connection:
+                connection.exec_driver_sql("VACUUM")
+                connection.exec_driver_sql("ANALYZE")
+
+        results = {s: (sizes(e), timings(e, place_ids, args.lookups)) for s, e in engines.items()}
+        print("\n" + "=" * 60)
+        print(f"{args.users} users, {args.places} places, {args.reviews} reviews, "
+              f"{3 * args.places} place_amenity rows")
+        print(f"{'':>26}{'text':>11}{'binary':>11}{'change':>10}")
+        for i, label in enumerate(("file MB", "tables MB", "indexes MB")):
+            text_value, binary_value = results["text"][0][i], results["binary"][0][i]
+            print(f"{label:>26}{text_value:>11.1f}{binary_value:>11.1f}"
+                  f"{(binary_value / text_value - 1) * 100:>+9.0f}%")
+        for name in results["text"][1]:
+            text_value, binary_value = results["text"][1][name], results["binary"][1][name]
+            print(f"{name + ' ms':>26}{text_value * 1000:>11.1f}{binary_value * 1000:>11.1f}"
+                  f"{(binary_value / text_value - 1) * 100:>+9.0f}%")
+        print("=" * 60 + "\n")
+        for engine in engines.values():
+            engine.dispose()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
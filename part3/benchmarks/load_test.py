@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+HBnB - HTTP load test harness
+
+Drives the real /api/v1 routes with a configurable read/write mix, logged in
+with a JWT from /api/v1/auth/login, and reports throughput plus p50/p95/p99
+latency per route and per status code.
+
+Two modes:
+    - against a running server (--url), using a thread pool of keep-alive
+      HTTP connections
+    - in-process (default), using one Flask test client per thread against a
+      freshly seeded temporary SQLite database
+
+Examples:
+    python benchmarks/load_test.py --requests 2000 --concurrency 8
+    python benchmarks/load_test.py --url http://127.0.0.1:5001 \\
+        --email admin@hbnb.com --password admin123 --write-ratio 0.2
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# ==================== Clients ====================
+
+class HTTPClient:
+    """Keep-alive HTTP client, one connection per thread."""
+
+    def __init__(self, base_url, timeout=30):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def request(self, method, path, body=None, token=None):
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        payload = json.dumps(body) if body is not None else None
+        conn = self._connection()
+        try:
+            conn.request(method, path, body=payload, headers=headers)
+            response = conn.getresponse()
+            return response.status, response.read()
+        except (http.client.HTTPException, OSError):
+            # Drop the broken connection so the next request reconnects
+            conn.close()
+            self._local.conn = None
+            raise
+
+
+class InProcessClient:
+    """Flask test client wrapper, one test client per thread."""
+
+    def __init__(self, app):
+        self.app = app
+        self._local = threading.local()
+
+    def request(self, method, path, body=None, token=None):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self.app.test_client()
+            self._local.client = client
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        # closing the response releases what a streamed body still holds
+        with client.open(path, method=method, json=body, headers=headers) as response:
+            return response.status_code, response.get_data()
+
+
+def build_in_process_app(place_count):
+    """Create an app on a temporary SQLite file seeded with an admin and places."""
+    from app import create_app
+    from app.extensions import db
+    from app.models.user import User
+    from app.models.place import Place
+    from config import Config
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix="hbnb-load-"), "load.db")
+
+    class LoadTestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+        JWT_SECRET_KEY = "load-test-secret-key-that-is-long-enough"
+
+    app = create_app(LoadTestConfig)
+    with app.app_context():
+        db.create_all()
+        admin = User(first_name="Load", last_name="Admin",
+                     email="load@hbnb.com", is_admin=True)
+        admin.hash_password("load-pass")
+        db.session.add(admin)
+        db.session.commit()
+        for i in range(place_count):
+            db.session.add(Place(
+                title=f"Load Place {i}",
+                description="Seeded by the load test harness",
+                price=50.0 + i,
+                latitude=24.7,
+                longitude=46.7,
+                owner_id=admin.id,
+            ))
+        db.session.commit()
+    return app, "load@hbnb.com", "load-pass"
+
+
+# ==================== Workload ====================
+
+def place_payload(rng):
+    return {
+        "title": f"Load test place {rng.randrange(1_000_000)}",
+        "description": "Created by the load test harness",
+        "price": round(rng.uniform(10, 500), 2),
+        "latitude": round(rng.uniform(-90, 90), 4),
+        "longitude": round(rng.uniform(-180, 180), 4),
+    }
+
+
+READ_OPERATIONS = [
+    ("GET /api/v1/places/", 3),
+    ("GET /api/v1/places/<place_id>", 4),
+    ("GET /api/v1/reviews/", 1),
+    ("GET /api/v1/amenities/", 1),
+    ("GET /api/v1/users/<user_id>", 1),
+]
+
+WRITE_OPERATIONS = [
+    ("POST /api/v1/places/", 1),
+    ("PUT /api/v1/places/<place_id>", 2),
+]
+
+
+def pick(rng, operations):
+    total = sum(weight for _, weight in operations)
+    roll = rng.uniform(0, total)
+    for route, weight in operations:
+        roll -= weight
+        if roll <= 0:
+            return route
+    return operations[-1][0]
+
+
+class Workload:
+    """Resolves route templates into concrete requests."""
+
+    def __init__(self, client, token, user_id, place_ids, write_ratio):
+        self.client = client
+        self.token = token
+        self.user_id = user_id
+        self.place_ids = place_ids
+        self.write_ratio = write_ratio
+
+    def next_request(self, rng):
+        if rng.random() < self.write_ratio:
+            route = pick(rng, WRITE_OPERATIONS)
+        else:
+            route = pick(rng, READ_OPERATIONS)
+        method, template = route.split(" ", 1)
+        path = (template
+                .replace("<place_id>", rng.choice(self.place_ids))
+                .replace("<user_id>", self.user_id))
+        body = place_payload(rng) if method in ("POST", "PUT") else None
+        return route, method, path, body
+
+    def run(self, count, seed):
+        rng = random.Random(seed)
+        samples = []
+        for _ in range(count):
+            route, method, path, body = self.next_request(rng)
+            start = time.perf_counter()
+            try:
+                status, _ = self.client.request(method, path, body, self.token)
+            except (http.client.HTTPException, OSError):
+                status = 0
+            samples.append((route, status, time.perf_counter() - start))
+        return samples
+
+
+def login(client, email, password):
+    status, body = client.request(
+        "POST", "/api/v1/auth/login", {"email": email, "password": password}
+    )
+    if status != 200:
+        raise SystemExit(f"Login failed ({status}): {body[:200]!r}")
+    token = json.loads(body)["access_token"]
+    status, body = client.request("GET", "/api/v1/users/")
+    users = json.loads(body) if status == 200 else []
+    user_id = next((u["id"] for u in users if u.get("email") == email), None)
+    return token, user_id
+
+
+def discover_place_ids(client, token):
+    status, body = client.request("GET", "/api/v1/places/")
+    place_ids = [p["id"] for p in json.loads(body)] if status == 200 else []
+    if not place_ids:
+        status, body = client.request(
+            "POST", "/api/v1/places/", place_payload(random.Random(0)), token
+        )
+        if status != 201:
+            raise SystemExit(f"Could not create a seed place ({status})")
+        place_ids = [json.loads(body)["id"]]
+    return place_ids
+
+
+# ==================== Reporting ====================
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(samples, elapsed):
+    """Group samples per route and per status code."""
+    groups = {"route": defaultdict(list), "status": defaultdict(list)}
+    for route, status, latency in samples:
+        groups["route"][route].append(latency)
+        groups["status"][str(status)].append(latency)
+
+    summary = {
+        "requests": len(samples),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+    }
+    for key, buckets in groups.items():
+        rows = {}
+        for label, latencies in sorted(buckets.items()):
+            latencies.sort()
+            rows[label] = {
+                "count": len(latencies),
+                "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+                "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+                "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            }
+        summary[f"per_{key}"] = rows
+    return summary
+
+
+def print_report(summary):
+    print("\n" + "=" * 78)
+    print(f"Requests: {summary['requests']}   Elapsed: {summary['elapsed_s']}s   "
+          f"Throughput: {summary['throughput_rps']} req/s")
+    for key, title in (("per_route", "Route"), ("per_status", "Status")):
+        print("-" * 78)
+        print(f"{title:<38}{'count':>8}{'rps':>9}{'p50 ms':>8}{'p95 ms':>8}{'p99 ms':>8}")
+        for label, row in summary[key].items():
+            print(f"{label:<38}{row['count']:>8}{row['rps']:>9}"
+                  f"{row['p50_ms']:>8}{row['p95_ms']:>8}{row['p99_ms']:>8}")
+    print("=" * 78 + "\n")
+
+
+# ==================== Entry point ====================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HBnB HTTP load test")
+    parser.add_argument("--url", help="Base URL of a running server (default: in-process)")
+    parser.add_argument("--email", default="admin@hbnb.com")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--requests", type=int, default=1000, help="Total requests")
+    parser.add_argument("--concurrency", type=int, default=8, help="Worker threads")
+    parser.add_argument("--write-ratio", type=float, default=0.1,
+                        help="Fraction of requests that are writes (0-1)")
+    parser.add_argument("--seed-places", type=int, default=50,
+                        help="Places seeded for in-process runs")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", dest="json_out", help="Also write the summary to this file")
+    args = parser.parse_args(argv)
+
+    if args.url:
+        client = HTTPClient(args.url)
+        email, password = args.email, args.password
+    else:
+        app, email, password = build_in_process_app(args.seed_places)
+        client = InProcessClient(app)
+
+    token, user_id = login(client, email, password)
+    place_ids = discover_place_ids(client, token)
+    workload = Workload(client, token, user_id or "unknown", place_ids, args.write_ratio)
+
+    per_worker = [args.requests // args.concurrency] * args.concurrency
+    for i in range(args.requests % args.concurrency):
+        per_worker[i] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [pool.submit(workload.run, count, args.seed + i)
+                   for i, count in enumerate(per_worker)]
+        samples = [sample for f in futures for sample in f.result()]
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(samples, elapsed)
+    print_report(summary)
+    if args.json_out:
+        with open(args.json_out, "w") as fh:
+            json.dump(summary, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+HBnB - Request instrumentation overhead
+
+Measures the per-request cost of the metrics hooks in two ways:
+    - the hooks alone, called inside a request context
+    - end to end through the test client, with METRICS_ENABLED on and off
+
+Usage:
+    python benchmarks/metrics_overhead.py --requests 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.extensions import db, metrics
+from config import TestingConfig
+
+
+def build_app(enabled):
+    class BenchConfig(TestingConfig):
+        METRICS_ENABLED = enabled
+
+    app = create_app(BenchConfig)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def time_hooks(app, n):
+    """Average cost of before/after/teardown hooks, in microseconds."""
+    with app.test_request_context("/api/v1/places/"):
+        app.url_map.bind("localhost").match("/api/v1/places/")
+        response = app.response_class("[]")
+        start = time.perf_counter()
+        for _ in range(n):
+            metrics._before_request()
+            metrics._after_request(response)
+            metrics._teardown_request(None)
+        return (time.perf_counter() - start) / n * 1e6
+
+
+def time_requests(app, n, path):
+    """Average end-to-end cost of a GET through the test client, in microseconds."""
+    client = app.test_client()
+    for _ in range(min(n, 200)):
+        client.get(path)
+    start = time.perf_counter()
+    for _ in range(n):
+        client.get(path)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Metrics instrumentation overhead")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--path", default="/api/v1/amenities/")
+    args = parser.parse_args(argv)
+
+    enabled = build_app(True)
+    disabled = build_app(False)
+
+    hooks_us = time_hooks(enabled, args.requests * 10)
+    off_us = time_requests(disabled, args.requests, args.path)
+    on_us = time_requests(enabled, args.requests, args.path)
+    metrics.reset()
+
+    print("\n" + "=" * 60)
+    print("Metrics instrumentation overhead")
+    print("=" * 60)
+    print(f"Hooks only:             {hooks_us:8.2f} us/request")
+    print(f"GET {args.path} (off):  {off_us:8.2f} us/request")
+    print(f"GET {args.path} (on):   {on_us:8.2f} us/request")
+    print(f"End-to-end overhead:    {on_us - off_us:8.2f} us/request "
+          f"({(on_us - off_us) / off_us * 100:.1f}%)")
+    print("=" * 60 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+HBnB - POST /reviews/ latency under a burst: synchronous vs write-behind
+
+Seeds a temporary SQLite database with --users reviewers and --places
+places, then fires one review per (user, place) pair from --concurrency
+threads through the Flask test client, all at once. Reports response
+latency percentiles for both modes and, for write-behind, how long the
+reviews took to become visible (job queued_at -> visible_at).
+
+Usage:
+    python benchmarks/review_burst.py --users 40 --places 25 --concurrency 16
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+PART3_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PART3_DIR)
+
+from load_test import percentile  # noqa: E402
+
+
+def make_app(tmp, write_behind):
+    from app import create_app
+    from config import Config
+
+    class BurstConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp, 'hbnb.db')}"
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+        SQLALCHEMY_SLOW_QUERY_MS = float("inf")
+        JWT_SECRET_KEY = "review-burst-benchmark-secret-key-0123456789"
+        METRICS_ENABLED = False
+        REVIEW_WRITE_BEHIND = write_behind
+        REVIEW_QUEUE_PATH = os.path.join(tmp, "queue.db")
+
+    return create_app(BurstConfig)
+
+
+def seed(app, users, places):
+    from flask_jwt_extended import create_access_token
+
+    from app.extensions import db
+    from app.models.place import Place
+    from app.models.user import User
+
+    with app.app_context():
+        db.create_all()
+        owner = User(first_name="Burst", last_name="Owner", email="owner@burst.hbnb")
+        owner.hash_password("burst-pass")
+        reviewers = [User(first_name="Burst", last_name=f"User{i}", email=f"u{i}@burst.hbnb")
+                     for i in range(users)]
+        for user in reviewers:
+            user.password = "x" * 60  # skip bcrypt; logins are not measured
+        db.session.add_all([owner, *reviewers])
+        db.session.commit()
+        place_list = [Place(title=f"Burst {i}", price=40.0 + i, latitude=1.0, longitude=1.0,
+                            owner_id=owner.id) for i in range(places)]
+        db.session.add_all(place_list)
+        db.session.commit()
+        tokens = [create_access_token(identity=u.id, additional_claims={"is_admin": False})
+                  for u in reviewers]
+        return tokens, [p.id for p in place_list]
+
+
+def burst(app, tokens, place_ids, concurrency):
+    requests = [(token, place_id) for token in tokens for place_id in place_ids]
+    latencies, locations = [], []
+    lock = threading.Lock()
+    start_gate = threading.Barrier(concurrency)
+
+    def worker(chunk):
+        client = app.test_client()
+        local, local_locations = [], []
+        start_gate.wait()
+        for token, place_id in chunk:
+            start = time.perf_counter()
+            response = client.post("/api/v1/reviews/",
+                                   json={"text": "Burst review", "rating": 4, "place_id": place_id},
+                                   headers={"Authorization": f"Bearer {token}"})
+            local.append(time.perf_counter() - start)
+            if response.status_code == 202:
+                local_locations.append((token, response.headers["Location"]))
+            elif response.status_code != 201:
+                raise SystemExit(f"Unexpected {response.status_code}: {response.get_data(True)}")
+        with lock:
+            latencies.extend(local)
+            locations.extend(local_locations)
+
+    threads = [threading.Thread(target=worker, args=(requests[i::concurrency],))
+               for i in range(concurrency)]
+    wall = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return sorted(latencies), locations, time.perf_counter() - wall
+
+
+def visibility(app, locations, timeout=120):
+    """Seconds from queueing to visibility per job, waiting for the worker."""
+    client = app.test_client()
+    deadline = time.time() + timeout
+    delays = []
+    for token, location in locations:
+        while True:
+            job = client.get(location, headers={"Authorization": f"Bearer {token}"}).get_json()
+            if job["status"] != "pending" or time.time() > deadline:
+                break
+            time.sleep(0.01)
+        if job["visible_at"]:
+            delays.append((datetime.fromisoformat(job["visible_at"])
+                           - datetime.fromisoformat(job["queued_at"])).total_seconds())
+    return sorted(delays)
+
+
+def run(mode, args):
+    tmp = tempfile.mkdtemp(prefix=f"hbnb-burst-{mode}-")
+    try:
+        app = make_app(tmp, mode == "write-behind")
+        tokens, place_ids = seed(app, args.users, args.places)
+        latencies, locations, wall = burst(app, tokens, place_ids, args.concurrency)
+        visible = visibility(app, locations) if locations else []
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return latencies, wall, visible
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Review POST latency under burst load")
+    parser.add_argument("--users", type=int, default=40)
+    parser.add_argument("--places", type=int, default=25)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    total = args.users * args.places
+    print("\n" + "=" * 78)
+    print(f"{total} reviews from {args.concurrency} threads")
+    print(f"{'mode':>14}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'req/s':>9}"
+          f"{'visible p50/p99 ms':>20}")
+    for mode in ("sync", "write-behind"):
+        latencies, wall, visible = run(mode, args)
+        ms = [percentile(latencies, p) * 1000 for p in (50, 95, 99, 100)]
+        seen = (f"{percentile(visible, 50) * 1000:.0f}/{percentile(visible, 99) * 1000:.0f}"
+                if visible else "-")
+        print(f"{mode:>14}" + "".join(f"{v:>9.1f}" for v in ms)
+              + f"{len(latencies) / wall:>9.0f}{seen:>20}")
+    print("=" * 78 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+HBnB - serve.py throughput and memory per worker count
+
+For each --workers value, starts serve.py on a temporary seeded SQLite
+file, drives it with --concurrency client threads issuing public GET
+requests for --duration seconds, then reads every worker's memory from
+/proc/<pid>/smaps_rollup (Linux only):
+
+    RSS      resident pages, counting shared ones in full
+    PSS      shared pages divided between the processes sharing them
+    shared   pages still shared with the parent or a sibling
+
+The PSS sum is what the workers really cost together. With --compare-freeze
+every worker count is also run with --no-freeze.
+
+Usage:
+    python benchmarks/serve_workers.py --workers 1 2 4 --threads 8 --duration 10
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+PART3_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PART3_DIR)
+
+from async_vs_wsgi import run_level, seed, spawn  # noqa: E402
+from load_test import HTTPClient  # noqa: E402
+
+
+def children(pid):
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(p) for p in f.read().split()]
+
+
+def memory(pid):
+    """RSS, PSS and shared kB of one process."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return values["Rss"], values["Pss"], values["Shared_Clean"] + values["Shared_Dirty"]
+
+
+def run(args, env, workers, freeze, port):
+    url = f"http://127.0.0.1:{port}"
+    command = [sys.executable, "serve.py", "--port", str(port), "--workers", str(workers),
+               "--threads", str(args.threads)]
+    if not freeze:
+        command.append("--no-freeze")
+    proc = spawn(command, env, url)
+    try:
+        status, body = HTTPClient(url).request("GET", "/api/v1/places/?fields=id")
+        place_ids = [p["id"] for p in json.loads(body)]
+        rps, p99 = run_level(url, args.concurrency, args.duration, place_ids)
+        worker_memory = [memory(pid) for pid in children(proc.pid)]
+        return rps, p99, memory(proc.pid), worker_memory
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="serve.py throughput and memory per worker")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--places", type=int, default=200)
+    parser.add_argument("--compare-freeze", action="store_true")
+    args = parser.parse_args(argv)
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix="hbnb-serve-"), "bench.db")
+    seed(db_path, args.places)
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}", METRICS_ENABLED="0")
+
+    print("\n" + "=" * 84)
+    print(f"{os.cpu_count()} CPUs, {args.threads} threads/worker, "
+          f"{args.concurrency} client threads, {args.duration:.0f} s per run")
+    print(f"{'workers':>8}{'freeze':>8}{'req/s':>9}{'p99 ms':>9}{'parent RSS':>12}"
+          f"{'worker RSS':>12}{'worker PSS':>12}{'shared':>9}{'PSS total':>11}")
+    port = 5201
+    for workers in args.workers:
+        for freeze in ((True, False) if args.compare_freeze else (True,)):
+            rps, p99, parent, worker_memory = run(args, env, workers, freeze, port)
+            port += 1
+            count = len(worker_memory) or 1
+            rss = sum(m[0] for m in worker_memory) / count
+            pss = sum(m[1] for m in worker_memory) / count
+            shared = sum(m[2] for m in worker_memory) / count
+            total = parent[1] + sum(m[1] for m in worker_memory)
+            print(f"{workers:>8}{'yes' if freeze else 'no':>8}{rps:>9.0f}{p99:>9.1f}"
+                  f"{parent[0] / 1024:>10.1f}MB{rss / 1024:>10.1f}MB{pss / 1024:>10.1f}MB"
+                  f"{shared / 1024:>7.1f}MB{total / 1024:>9.1f}MB")
+    print("=" * 84 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
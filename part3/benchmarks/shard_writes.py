@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+HBnB - Review write throughput at 1, 2, 4 and 8 shards
+
+For each shard count, seeds a fresh primary (users) and N shard files
+(places spread by crc32(place_id)), then runs --writers processes that
+each insert one review per transaction through the facade for
+--duration seconds. Reports committed reviews/s and how many writes
+failed on "database is locked".
+
+Usage:
+    python benchmarks/shard_writes.py --shards 1 2 4 8 --writers 8 --duration 5
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+PART3_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PART3_DIR)
+
+
+def make_config(tmp, shard_count):
+    from config import Config
+
+    class ShardBenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp, 'primary.db')}"
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+        DATABASE_SHARDS = [f"sqlite:///{os.path.join(tmp, f'shard{n}.db')}"
+                           for n in range(shard_count)]
+        METRICS_ENABLED = False
+        SQLALCHEMY_SLOW_QUERY_MS = float("inf")
+
+    return ShardBenchConfig
+
+
+def seed(tmp, shard_count, places):
+    from app import create_app
+    from app.extensions import db
+    from app.models.user import User
+    from app.persistence.sharding import shards
+    from app.services.facade import facade
+
+    app = create_app(make_config(tmp, shard_count))
+    with app.app_context():
+        db.create_all()
+        shards.create_all()
+        owner = User(first_name="Bench", last_name="Owner", email="owner@bench.hbnb")
+        owner.hash_password("bench-pass")
+        db.session.add(owner)
+        db.session.commit()
+        place_ids = [
+            facade.create_place({"title": f"Place {i}", "price": 50.0 + i,
+                                 "latitude": 1.0, "longitude": 1.0,
+                                 "owner_id": owner.id}).id
+            for i in range(places)
+        ]
+        return owner.id, place_ids
+
+
+def writer(args):
+    tmp, shard_count, user_id, place_ids, duration, seed_value = args
+    from sqlalchemy.exc import OperationalError
+
+    from app import create_app
+    from app.persistence.sharding import shards
+    from app.services.facade import facade
+
+    app = create_app(make_config(tmp, shard_count))
+    rng = random.Random(seed_value)
+    written = locked = 0
+    deadline = time.perf_counter() + duration
+    with app.app_context():
+        while time.perf_counter() < deadline:
+            try:
+                facade.create_review({"text": "Benchmark review", "rating": rng.randint(1, 5),
+                                      "user_id": user_id, "place_id": rng.choice(place_ids)})
+                written += 1
+            except OperationalError:
+                locked += 1
+                for session in shards.sessions():
+                    session.rollback()
+    return written, locked
+
+
+def run(shard_count, writers, duration, places):
+    tmp = tempfile.mkdtemp(prefix=f"hbnb-shards{shard_count}-")
+    try:
+        user_id, place_ids = seed(tmp, shard_count, places)
+        jobs = [(tmp, shard_count, user_id, place_ids, duration, i) for i in range(writers)]
+        start = time.perf_counter()
+        with multiprocessing.get_context("spawn").Pool(writers) as pool:
+            results = pool.map(writer, jobs)
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    written = sum(w for w, _ in results)
+    locked = sum(l for _, l in results)
+    # process start-up is included in elapsed; rate over the write window
+    return written / duration, locked, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Review writes per second by shard count")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--places", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    print("\n" + "=" * 52)
+    print(f"{'shards':>8}{'writers':>9}{'reviews/s':>12}{'locked':>9}{'wall s':>9}")
+    for count in args.shards:
+        rate, locked, elapsed = run(count, args.writers, args.duration, args.places)
+        print(f"{count:>8}{args.writers:>9}{rate:>12.1f}{locked:>9}{elapsed:>9.1f}")
+    print("=" * 52 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+HBnB - Payload validation cost, flask-restx jsonschema vs compiled
+
+For each POST model (Place, Review, User, Amenity) times one validation
+of a valid and of an invalid payload:
+    - before: Model.validate with the Api's registry, which is what
+      ``@api.expect(model, validate=True)`` runs on every request
+    - after:  the compiled validator from app/api/v1/validation.py
+
+and, end to end through the test client, a POST /api/v1/places/ that is
+rejected with 400 (validation is then most of the request).
+
+Usage:
+    python benchmarks/validation.py --number 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask_jwt_extended import create_access_token
+from flask_restx import Resource
+from werkzeug.exceptions import BadRequest
+
+from app import create_app, db
+from app.api.v1.amenities import amenity_model
+from app.api.v1.places import PlaceList, place_model
+from app.api.v1.places import api as places_ns
+from app.api.v1.reviews import review_model
+from app.api.v1.users import user_model
+from app.api.v1.validation import compile_model
+from config import TestingConfig
+
+CASES = {
+    "Place": (place_model, {"title": "Loft", "description": "Bright", "price": 120.0,
+                            "latitude": 24.7, "longitude": 46.7},
+              {"title": 5, "price": "cheap", "latitude": 24.7}),
+    "Review": (review_model, {"text": "Great stay", "rating": 5, "place_id": "p"},
+               {"text": "Great stay", "rating": 4.5}),
+    "User": (user_model, {"first_name": "Ada", "last_name": "L", "email": "ada@example.com",
+                          "password": "secret"},
+             {"first_name": "Ada", "email": 3}),
+    "Amenity": (amenity_model, {"name": "Pool", "description": "Heated"}, {"name": None}),
+}
+
+
+def per_call(fn, number):
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def restx_validate(model, data, api):
+    def run():
+        try:
+            model.validate(data, api.refresolver, api.format_checker)
+        except BadRequest:
+            pass
+    return run
+
+
+def compiled_validate(model, data):
+    validator = compile_model(model)
+    return lambda: validator.errors(data)
+
+
+def bench_endpoint(app, number):
+    with app.app_context():
+        db.create_all()
+        token = create_access_token(identity="bench", additional_claims={"is_admin": False})
+    client = app.test_client()
+    headers = {"Authorization": f"Bearer {token}"}
+    payload = {"title": 5, "price": "cheap", "latitude": 24.7}
+
+    def post():
+        assert client.post("/api/v1/places/", json=payload, headers=headers).status_code == 400
+
+    results = {}
+    compiled = PlaceList.validate_payload
+    try:
+        PlaceList.validate_payload = Resource.validate_payload
+        results["before"] = per_call(post, number)
+    finally:
+        PlaceList.validate_payload = compiled
+    results["after"] = per_call(post, number)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Payload validation benchmark")
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    class BenchConfig(TestingConfig):
+        METRICS_ENABLED = False
+
+    app = create_app(BenchConfig)
+    api = places_ns.apis[0]
+    rows = []
+    with app.test_request_context():
+        for name, (model, valid, invalid) in CASES.items():
+            for kind, data in (("valid", valid), ("invalid", invalid)):
+                rows.append((f"{name} {kind}",
+                             per_call(restx_validate(model, data, api), args.number),
+                             per_call(compiled_validate(model, data), args.number)))
+    endpoint = bench_endpoint(app, args.number // 4)
+
+    print("\n" + "=" * 60)
+    print(f"Payload validation - per call, best of 3 x {args.number}")
+    print("=" * 60)
+    print(f"{'payload':<20}{'jsonschema us':>15}{'compiled us':>13}{'speedup':>10}")
+    for label, before, after in rows:
+        print(f"{label:<20}{before * 1e6:>15.1f}{after * 1e6:>13.2f}{before / after:>9.0f}x")
+    print(f"{'POST /places/ 400':<20}{endpoint['before'] * 1e6:>15.1f}"
+          f"{endpoint['after'] * 1e6:>13.1f}{endpoint['before'] / endpoint['after']:>9.1f}x")
+    print("=" * 60 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -11,6 +11,37 @@ class Config:
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", SECRET_KEY)
     DEBUG = False
     TESTING = False
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"
+    SQLALCHEMY_SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "100"))
+    JSON_ENCODER = os.getenv("JSON_ENCODER", "auto")  # auto | orjson | json
+    # encoded list items reused while unchanged, see app/fragment_cache.py (0 = off)
+    FRAGMENT_CACHE_BYTES = int(os.getenv("FRAGMENT_CACHE_BYTES", str(32 * 1024 * 1024)))
+    # UUID keys as 36-char text or 16-byte blobs, see app/models/types.py
+    # (switch an existing database with migrate_id_storage.py)
+    ID_STORAGE = os.getenv("ID_STORAGE", "text")  # text | binary
+    # new ids: random or time-ordered, see app/models/ids.py
+    ID_GENERATOR = os.getenv("ID_GENERATOR", "uuid4")  # uuid4 | uuid7
+    # seconds before the amenity bitmaps are rebuilt, see app/persistence/amenity_index.py
+    # (0 = never; serve.py uses WORKER_AMENITY_INDEX_MAX_AGE with several workers)
+    AMENITY_INDEX_MAX_AGE = float(os.getenv("AMENITY_INDEX_MAX_AGE", "0"))
+    # Read replicas: comma-separated URIs, see app/persistence/replicas.py
+    SQLALCHEMY_REPLICAS = [u for u in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if u]
+    REPLICA_MAX_LAG = float(os.getenv("REPLICA_MAX_LAG", "5"))
+    REPLICA_ENDPOINT_MAX_LAG = {  # Flask endpoint -> seconds; 0 = primary only
+        "places_place_search": 60.0,
+        "reviews_review_search": 60.0,
+        "export_export": 60.0,
+    }
+    REPLICA_SYNC_INTERVAL = float(os.getenv("REPLICA_SYNC_INTERVAL", "0"))
+    # Place/review shards: comma-separated SQLite URIs, see app/persistence/sharding.py
+    DATABASE_SHARDS = [u for u in os.getenv("DATABASE_SHARD_URLS", "").split(",") if u]
+    # POST /reviews/ answers 202 and a worker saves in batches, see app/services/review_queue.py
+    REVIEW_WRITE_BEHIND = os.getenv("REVIEW_WRITE_BEHIND", "0") == "1"
+    REVIEW_QUEUE_PATH = os.getenv("REVIEW_QUEUE_PATH", "review_queue.db")
+    REVIEW_QUEUE_BATCH = int(os.getenv("REVIEW_QUEUE_BATCH", "200"))
+    # GET /export/<entity>: rows per cursor fetch, gzip level when accepted (0 = off)
+    EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "2000"))
+    EXPORT_GZIP_LEVEL = int(os.getenv("EXPORT_GZIP_LEVEL", "1"))
 
 
 class DevelopmentConfig(Config):
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+HBnB - Convert the SQLite database between text and binary UUID keys
+
+The database is copied table by table into a new file with the other
+key layout (app/persistence/key_storage.py). The original is kept next
+to it as <name>.<old layout>.bak. Stop the servers first, and start them
+again with ID_STORAGE set to the new layout.
+
+Usage:
+    python migrate_id_storage.py --to binary
+    python migrate_id_storage.py --to text
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+
+from app import create_app
+from config import DevelopmentConfig
+from app.extensions import db
+from app.models.types import use_binary_keys
+from app.persistence.key_storage import STORAGES, copy_database, detect_storage
+from app.persistence.sharding import shards
+
+
+def show_progress(table, rows):
+    print(f"\r{table:>14}: {rows:>9,} rows", end="", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Switch the UUID key storage of the database")
+    parser.add_argument("--to", choices=STORAGES, required=True)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    app = create_app(DevelopmentConfig)
+    with app.app_context():
+        if shards.enabled():
+            print("Sharded databases are not supported; unset DATABASE_SHARD_URLS",
+                  file=sys.stderr)
+            return 2
+        source = db.engine
+        path = source.url.database
+        if source.url.get_backend_name() != "sqlite" or path in (None, "", ":memory:"):
+            print("Only SQLite database files can be migrated", file=sys.stderr)
+            return 2
+
+        current = detect_storage(source)
+        if current is None:
+            print(f"{path} has no tables; set ID_STORAGE={args.to} and create them")
+            return 0
+        if current == args.to:
+            print(f"{path} already uses {args.to} keys")
+            return 0
+
+        # the app engine follows ID_STORAGE; read with the layout actually on disk
+        source = create_engine(source.url)
+        use_binary_keys(source, current == "binary")
+        tmp_path = f"{path}.migrating"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        target = create_engine(f"sqlite:///{tmp_path}")
+        use_binary_keys(target, args.to == "binary")
+        before = os.path.getsize(path)
+        try:
+            counts = copy_database(source, target, args.batch_size, show_progress)
+            print(file=sys.stderr)
+        except ValueError as e:
+            print(f"\n{e}; nothing changed", file=sys.stderr)
+            os.remove(tmp_path)
+            return 1
+        finally:
+            source.dispose()
+            target.dispose()
+        with target.connect() as connection:
+            connection.exec_driver_sql("VACUUM")
+        target.dispose()
+
+        backup = f"{path}.{current}.bak"
+        os.replace(path, backup)
+        os.replace(tmp_path, path)
+        print(f"Copied {sum(counts.values()):,} rows: {before / 1e6:.1f} MB -> "
+              f"{os.path.getsize(path) / 1e6:.1f} MB (original kept as {backup})")
+        print(f"Start the app with ID_STORAGE={args.to}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
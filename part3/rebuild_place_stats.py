@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+HBnB - Rebuild place_stats from the reviews table
+
+Usage:
+    python rebuild_place_stats.py           # recompute every row
+    python rebuild_place_stats.py --check   # only report places that drifted
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app
+from config import DevelopmentConfig
+from app.extensions import db
+from app.persistence.place_stats import find_drift, rebuild_place_stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild materialized place statistics")
+    parser.add_argument("--check", action="store_true",
+                        help="report drifted places without writing")
+    args = parser.parse_args(argv)
+
+    app = create_app(DevelopmentConfig)
+    with app.app_context():
+        db.create_all()
+        drifted = find_drift(db.session)
+        print(f"{len(drifted)} place(s) with stale or missing stats")
+        for place_id in drifted[:20]:
+            print(f"  - {place_id}")
+        if args.check:
+            return 1 if drifted else 0
+
+        rows = rebuild_place_stats(db.session)
+        db.session.commit()
+        print(f"Rebuilt stats for {rows} place(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+HBnB - Production entry point: pre-forked workers with threads
+
+The app is created and warmed up once in this process, which then
+freezes the GC and forks --workers children sharing one listening
+socket; see app/serving.py.
+
+Usage:
+    DATABASE_URL=sqlite:////srv/hbnb.db python serve.py --workers 4 --threads 8
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app
+from app.serving import Arbiter
+
+CONFIGS = {
+    "development": "config.DevelopmentConfig",
+    "production": "config.ProductionConfig",
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve HBnB with pre-forked workers")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5001)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="worker processes")
+    parser.add_argument("--threads", type=int, default=8,
+                        help="request threads per worker")
+    parser.add_argument("--keep-alive", type=float, default=0, metavar="SECONDS",
+                        help="reuse connections, closing them after SECONDS idle "
+                             "(default: one request per connection)")
+    parser.add_argument("--config", choices=CONFIGS, default="production")
+    parser.add_argument("--access-log", action="store_true")
+    parser.add_argument("--no-freeze", dest="freeze", action="store_false",
+                        help="skip gc.freeze() before forking (for comparison)")
+    args = parser.parse_args(argv)
+
+    app = create_app(CONFIGS[args.config])
+    if not app.config.get("SQLALCHEMY_DATABASE_URI"):
+        parser.error("set DATABASE_URL")
+    return Arbiter(app, host=args.host, port=args.port, workers=args.workers,
+                   threads=args.threads, keep_alive=args.keep_alive,
+                   access_log=args.access_log, freeze=args.freeze).run()
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,5 +1,8 @@
 PRAGMA foreign_keys = ON;
 
+DROP TABLE IF EXISTS places_fts;
+DROP TABLE IF EXISTS reviews_fts;
+DROP TABLE IF EXISTS place_stats;
 DROP TABLE IF EXISTS place_amenity;
 DROP TABLE IF EXISTS reviews;
 DROP TABLE IF EXISTS places;
@@ -33,6 +36,7 @@ CREATE TABLE places (
     latitude FLOAT NOT NULL CHECK (latitude >= -90 AND latitude <= 90),
     longitude FLOAT NOT NULL CHECK (longitude >= -180 AND longitude <= 180),
     owner_id TEXT NOT NULL,
+    owner_name VARCHAR(101),
     created_at DATETIME NOT NULL,
     updated_at DATETIME NOT NULL,
     FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE
@@ -44,6 +48,7 @@ CREATE TABLE reviews (
     rating INTEGER NOT NULL CHECK (rating >= 1 AND rating <= 5),
     user_id TEXT NOT NULL,
     place_id TEXT NOT NULL,
+    user_name VARCHAR(101),
     created_at DATETIME NOT NULL,
     updated_at DATETIME NOT NULL,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
@@ -57,3 +62,53 @@ CREATE TABLE place_amenity (
     FOREIGN KEY (place_id) REFERENCES places(id) ON DELETE CASCADE,
     FOREIGN KEY (amenity_id) REFERENCES amenities(id) ON DELETE CASCADE
 );
+
+-- Materialized review statistics, maintained by app/persistence/place_stats.py
+-- (rebuild with: python rebuild_place_stats.py)
+CREATE TABLE place_stats (
+    place_id TEXT PRIMARY KEY,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_avg FLOAT NOT NULL DEFAULT 0,
+    stars_1 INTEGER NOT NULL DEFAULT 0,
+    stars_2 INTEGER NOT NULL DEFAULT 0,
+    stars_3 INTEGER NOT NULL DEFAULT 0,
+    stars_4 INTEGER NOT NULL DEFAULT 0,
+    stars_5 INTEGER NOT NULL DEFAULT 0,
+    last_review_at DATETIME,
+    FOREIGN KEY (place_id) REFERENCES places(id) ON DELETE CASCADE
+);
+
+CREATE INDEX ix_place_stats_rating ON place_stats (rating_avg, place_id);
+CREATE INDEX ix_place_stats_reviews ON place_stats (review_count, place_id);
+CREATE INDEX ix_places_price ON places (price, id);
+CREATE INDEX ix_places_created_at ON places (created_at, id);
+CREATE INDEX ix_reviews_place_rating ON reviews (place_id, rating);
+CREATE UNIQUE INDEX ix_reviews_place_user ON reviews (place_id, user_id);
+
+-- Full-text search (SQLite FTS5), kept in sync by triggers.
+-- Mirrors app/persistence/full_text.py.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS places_fts USING fts5(title, description, content='places', content_rowid='rowid', tokenize='porter unicode61');
+CREATE TRIGGER IF NOT EXISTS places_fts_ai AFTER INSERT ON places BEGIN
+    INSERT INTO places_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS places_fts_ad AFTER DELETE ON places BEGIN
+    INSERT INTO places_fts(places_fts, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS places_fts_au AFTER UPDATE OF title, description ON places BEGIN
+    INSERT INTO places_fts(places_fts, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+    INSERT INTO places_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts USING fts5(text, content='reviews', content_rowid='rowid', tokenize='porter unicode61');
+CREATE TRIGGER IF NOT EXISTS reviews_fts_ai AFTER INSERT ON reviews BEGIN
+    INSERT INTO reviews_fts(rowid, text) VALUES (new.rowid, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS reviews_fts_ad AFTER DELETE ON reviews BEGIN
+    INSERT INTO reviews_fts(reviews_fts, rowid, text) VALUES ('delete', old.rowid, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS reviews_fts_au AFTER UPDATE OF text ON reviews BEGIN
+    INSERT INTO reviews_fts(reviews_fts, rowid, text) VALUES ('delete', old.rowid, old.text);
+    INSERT INTO reviews_fts(rowid, text) VALUES (new.rowid, new.text);
+END;
@@ -0,0 +1,39 @@
+"""Query budget assertions for endpoint tests"""
+
+from contextlib import contextmanager
+
+from flask import request_finished
+
+from app.extensions import query_profiler
+
+
+class QueryBudgetMixin:
+    """
+    unittest mixin that fails when a block runs more SQL statements than
+    declared, so N+1 regressions are caught automatically:
+
+        with self.assertMaxQueries(2):
+            with self.client.get("/api/v1/reviews/") as response:
+                response.get_data()
+
+    Streamed responses run their queries while the body is read, so read
+    and close them inside the block; the block fails if one is left open.
+    """
+
+    @contextmanager
+    def assertMaxQueries(self, budget):
+        open_streams = []
+
+        def track(sender, response, **extra):
+            if response.is_streamed:
+                open_streams.append(response)
+                response.call_on_close(lambda: open_streams.remove(response))
+
+        with request_finished.connected_to(track), query_profiler.count_queries() as stats:
+            yield stats
+        if open_streams:
+            self.fail(f"{len(open_streams)} streamed response(s) not closed inside "
+                      "assertMaxQueries; their queries were not counted")
+        if stats.count > budget:
+            listing = "\n".join(f"  {i}. {s}" for i, s in enumerate(stats.statements, 1))
+            self.fail(f"{stats.count} queries executed, budget is {budget}:\n{listing}")
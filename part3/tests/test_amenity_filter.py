@@ -0,0 +1,118 @@
+import unittest
+from app import create_app, db
+from app.extensions import query_profiler
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from app.persistence.amenity_index import AmenityBitmaps, bit_positions
+
+
+class TestAmenityBitmaps(unittest.TestCase):
+    def test_bit_positions(self):
+        self.assertEqual(bit_positions(0), [])
+        self.assertEqual(bit_positions(0b1010_0000_0001 | 1 << 70), [0, 9, 11, 70])
+
+    def test_load_add_discard_drop(self):
+        index = AmenityBitmaps()
+        index.load([("p1", "wifi"), ("p1", "pool"), ("p2", "wifi"), ("p3", "pool")])
+        self.assertEqual(index.match_all(["wifi"]), ["p1", "p2"])
+        self.assertEqual(index.match_all(["wifi", "pool"]), ["p1"])
+        self.assertEqual(index.match_all(["wifi", "missing"]), [])
+
+        index.add("p2", "pool")
+        self.assertEqual(index.match_all(["pool", "wifi"]), ["p1", "p2"])
+        index.discard("p1", "pool")
+        self.assertEqual(index.match_all(["pool", "wifi"]), ["p2"])
+        index.drop_place("p2")
+        self.assertEqual(index.match_all(["pool"]), ["p3"])
+
+
+class TestAmenityFilter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            owner = User(first_name="Filter", last_name="Owner", email="filterowner@example.com")
+            owner.hash_password("ownerpass")
+            wifi = Amenity(name="WiFi")
+            pool = Amenity(name="Pool")
+            parking = Amenity(name="Parking")
+            db.session.add_all([owner, wifi, pool, parking])
+            db.session.commit()
+
+            def place(title, amenities):
+                p = Place(title=title, price=100.0, latitude=1.0, longitude=1.0,
+                          owner_id=owner.id)
+                p.amenities.extend(amenities)
+                return p
+
+            db.session.add_all([
+                place("All three", [wifi, pool, parking]),
+                place("WiFi and pool", [wifi, pool]),
+                place("WiFi only", [wifi]),
+            ])
+            db.session.commit()
+            cls.wifi, cls.pool, cls.parking = wifi.id, pool.id, parking.id
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def titles(self, amenity_ids):
+        response = self.client.get(f"/api/v1/places/?fields=title&amenities={','.join(amenity_ids)}")
+        self.assertEqual(response.status_code, 200)
+        return sorted(p["title"] for p in response.get_json())
+
+    def test_intersection(self):
+        self.assertEqual(self.titles([self.wifi]), ["All three", "WiFi and pool", "WiFi only"])
+        self.assertEqual(self.titles([self.wifi, self.pool]), ["All three", "WiFi and pool"])
+        self.assertEqual(self.titles([self.wifi, self.pool, self.parking]), ["All three"])
+        self.assertEqual(self.titles(["unknown-amenity"]), [])
+
+    def test_pages_read_the_index(self):
+        self.titles([self.wifi])  # make sure the index is built
+        with query_profiler.count_queries() as stats:
+            response = self.client.get(
+                f"/api/v1/places/?fields=title&amenities={self.wifi},{self.pool}&page=1&per_page=1")
+        self.assertEqual(response.headers["X-Total-Count"], "2")
+        self.assertEqual(len(response.get_json()), 1)
+        self.assertEqual(stats.count, 1)
+        self.assertNotIn("place_amenity", stats.statements[0])
+
+        response = self.client.get(
+            f"/api/v1/places/?fields=title&amenities={self.wifi},{self.pool}&sort=-price")
+        self.assertEqual(response.headers["X-Total-Count"], "2")
+        self.assertEqual(sorted(p["title"] for p in response.get_json()),
+                         ["All three", "WiFi and pool"])
+
+    def test_commits_update_the_index(self):
+        self.titles([self.parking])  # make sure the index is built
+        with self.app.app_context():
+            place = Place.query.filter_by(title="WiFi only").one()
+            place.amenities.append(db.session.get(Amenity, self.parking))
+            db.session.commit()
+        self.assertIn("WiFi only", self.titles([self.parking]))
+
+        with self.app.app_context():
+            place = Place.query.filter_by(title="WiFi only").one()
+            place.amenities.remove(db.session.get(Amenity, self.parking))
+            db.session.flush()
+            db.session.rollback()
+        self.assertIn("WiFi only", self.titles([self.parking]))
+
+        with self.app.app_context():
+            place = Place.query.filter_by(title="WiFi only").one()
+            place.amenities.remove(db.session.get(Amenity, self.parking))
+            db.session.commit()
+        self.assertNotIn("WiFi only", self.titles([self.parking]))
+
+
+if __name__ == "__main__":
+    unittest.main()
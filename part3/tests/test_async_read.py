@@ -0,0 +1,128 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from app import create_app, db
+from app.asgi import create_asgi_app
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.persistence.async_repository import to_async_url
+from config import TestingConfig
+
+DB_PATH = os.path.join(tempfile.mkdtemp(prefix="hbnb-async-"), "async.db")
+
+
+class AsyncTestConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = f"sqlite:///{DB_PATH}"
+
+
+def call(app, path, query=b"", method="GET"):
+    """Run one request through the ASGI app, return (status, parsed body)."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "query_string": query}
+    asyncio.run(app(scope, receive, send))
+    status = messages[0]["status"]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return status, json.loads(body) if body else body
+
+
+class TestAsyncReadAPI(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.flask_app = create_app(AsyncTestConfig)
+
+        with cls.flask_app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            owner = User(first_name="Async", last_name="Owner", email="asyncowner@example.com")
+            owner.hash_password("ownerpass")
+            reviewer = User(first_name="Async", last_name="Reviewer", email="asyncreviewer@example.com")
+            reviewer.hash_password("reviewerpass")
+            db.session.add_all([owner, reviewer])
+            db.session.commit()
+
+            place = Place(title="Async Place", description="Served over ASGI", price=70.0,
+                          latitude=1.0, longitude=1.0, owner_id=owner.id)
+            db.session.add(place)
+            db.session.commit()
+            db.session.add(Review(text="Fast", rating=5, user_id=reviewer.id, place_id=place.id))
+            db.session.commit()
+            cls.place_id = place.id
+
+        cls.app = create_asgi_app(AsyncTestConfig)
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.flask_app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_list_places_matches_wsgi_payload(self):
+        status, data = call(self.app, "/api/v1/places/")
+        self.assertEqual(status, 200)
+        wsgi = self.flask_app.test_client().get("/api/v1/places/").get_json()
+        self.assertEqual(data, wsgi)
+
+    def test_get_place_with_fields(self):
+        status, data = call(self.app, f"/api/v1/places/{self.place_id}", b"fields=title,price")
+        self.assertEqual(status, 200)
+        self.assertEqual(data, {"title": "Async Place", "price": 70.0})
+
+    def test_missing_place_returns_404(self):
+        status, data = call(self.app, "/api/v1/places/nonexistent-id")
+        self.assertEqual(status, 404)
+        self.assertEqual(data, {"error": "Place not found"})
+
+    def test_reviews_include_user_name(self):
+        status, data = call(self.app, "/api/v1/reviews/")
+        self.assertEqual(status, 200)
+        self.assertEqual(data[0]["user_name"], "Async Reviewer")
+
+    def test_place_reviews(self):
+        status, data = call(self.app, f"/api/v1/reviews/places/{self.place_id}/reviews")
+        self.assertEqual(status, 200)
+        self.assertEqual(len(data), 1)
+
+    def test_unknown_field_returns_400(self):
+        status, _ = call(self.app, "/api/v1/users/", b"fields=password")
+        self.assertEqual(status, 400)
+
+    def test_search_matches_wsgi_payload(self):
+        for path, query in (("/api/v1/places/search", b"q=asgi"),
+                            ("/api/v1/reviews/search", b"q=fast&per_page=5")):
+            with self.subTest(path=path):
+                status, data = call(self.app, path, query)
+                self.assertEqual(status, 200)
+                self.assertEqual(data["total"], 1)
+                wsgi = self.flask_app.test_client().get(f"{path}?{query.decode()}").get_json()
+                self.assertEqual(data, wsgi)
+
+    def test_search_errors(self):
+        self.assertEqual(call(self.app, "/api/v1/places/search"),
+                         (400, {"error": "q is required"}))
+        status, _ = call(self.app, "/api/v1/reviews/search", b"q=fast&page=0")
+        self.assertEqual(status, 400)
+
+    def test_head_has_no_body(self):
+        for path in ("/api/v1/places/", f"/api/v1/places/{self.place_id}",
+                     "/api/v1/places/nonexistent-id"):
+            with self.subTest(path=path):
+                get_status, _ = call(self.app, path)
+                self.assertEqual(call(self.app, path, method="HEAD"), (get_status, b""))
+
+    def test_to_async_url(self):
+        self.assertEqual(str(to_async_url("sqlite:///x.db")), "sqlite+aiosqlite:///x.db")
+
+
+if __name__ == "__main__":
+    unittest.main()
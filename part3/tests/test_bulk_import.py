@@ -0,0 +1,142 @@
+import csv
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from app import create_app, db
+from app.models.place import Place
+from app.models.place_stats import PlaceStats
+from app.models.review import Review
+from app.models.user import User
+from app.services.bulk_import import Importer, range_errors, validate_chunk
+from config import TestingConfig
+
+
+class TestBulkImport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.mkdtemp(prefix="hbnb-import-")
+
+        class ImportConfig(TestingConfig):
+            BCRYPT_LOG_ROUNDS = 4
+
+        cls.app = create_app(ImportConfig)
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        shutil.rmtree(cls.tmp)
+
+    def _file(self, name, rows):
+        path = os.path.join(self.tmp, name)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            if name.endswith(".csv"):
+                writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+            else:
+                f.writelines(json.dumps(r) + "\n" for r in rows)
+        return path
+
+    def test_range_checks_match_model_messages(self):
+        rows = [{"title": "T", "price": p, "latitude": lat, "longitude": 0.0}
+                for p, lat in ((-1.0, 0.0), (2e6, 0.0), (10.0, 91.0), (10.0, None), (10.0, 45.0))]
+        errors = range_errors("places", rows)
+        for row, error in zip(rows[:3], errors[:3]):
+            with self.assertRaises(ValueError) as ctx:
+                Place(**row)
+            self.assertEqual(error, str(ctx.exception))
+        self.assertEqual(errors[3:], [None, None])
+
+    def test_validate_chunk_coerces_and_rejects(self):
+        valid, rejects = validate_chunk("reviews", [
+            (2, {"text": "Good", "rating": "5", "user_id": "u", "place_id": "p"}),
+            (3, {"text": "Bad", "rating": "9", "user_id": "u", "place_id": "p"}),
+            (4, {"text": "Odd", "rating": "four", "user_id": "u", "place_id": "p"}),
+            (5, {"text": "", "rating": "3", "user_id": "u", "place_id": "p"}),
+            (6, "not json"),
+        ])
+        self.assertEqual([v[1]["rating"] for v in valid], [5])
+        self.assertEqual(sorted((line, error) for line, _, error in rejects), [
+            (3, "rating must be an integer between 1 and 5"),
+            (4, "rating must be a number"),
+            (5, "text is required"),
+            (6, "row must be a JSON object"),
+        ])
+
+    def test_import_files_end_to_end(self):
+        users = self._file("users.csv", [
+            {"id": "imp-owner", "first_name": "Imp", "last_name": "Owner",
+             "email": "impowner@example.com", "password": "secret1", "is_admin": "false"},
+            {"id": "imp-guest", "first_name": "Imp", "last_name": "Guest",
+             "email": "impguest@example.com", "password": "secret2", "is_admin": ""},
+            {"id": "imp-dup", "first_name": "Imp", "last_name": "Dup",
+             "email": "impowner@example.com", "password": "secret3", "is_admin": ""},
+        ])
+        amenities = self._file("amenities.ndjson", [{"id": "imp-wifi", "name": "Imp WiFi"}])
+        places = self._file("places.csv", [
+            {"id": f"imp-place-{i}", "title": f"Imported {i}", "price": 50 + i,
+             "latitude": 10, "longitude": 20, "owner_id": "imp-owner",
+             "amenity_ids": "imp-wifi" if i == 0 else ""}
+            for i in range(5)
+        ] + [
+            {"id": "imp-bad-owner", "title": "Orphan", "price": 10, "latitude": 0,
+             "longitude": 0, "owner_id": "nobody", "amenity_ids": ""},
+            {"id": "imp-bad-lat", "title": "Pole", "price": 10, "latitude": 95,
+             "longitude": 0, "owner_id": "imp-owner", "amenity_ids": ""},
+        ])
+        reviews = self._file("reviews.ndjson", [
+            {"text": "Lovely", "rating": 4, "user_id": "imp-guest", "place_id": "imp-place-0"},
+            {"text": "Again", "rating": 2, "user_id": "imp-guest", "place_id": "imp-place-0"},
+            {"text": "Mine", "rating": 5, "user_id": "imp-owner", "place_id": "imp-place-1"},
+        ])
+        report = io.StringIO()
+        progress = []
+        with self.app.app_context():
+            results = Importer(workers=0, chunk_size=3, report=report,
+                               progress=lambda e, s: progress.append(e)).run({
+                "users": users, "amenities": amenities, "places": places, "reviews": reviews})
+            self.assertEqual({e: (s["imported"], s["rejected"]) for e, s in results.items()}, {
+                "users": (2, 1), "amenities": (1, 0), "places": (5, 2), "reviews": (1, 2)})
+            self.assertIn("places", progress)
+
+            owner = db.session.get(User, "imp-owner")
+            self.assertTrue(owner.verify_password("secret1"))
+            self.assertFalse(owner.is_admin)
+            place = db.session.get(Place, "imp-place-0")
+            self.assertEqual(place.owner_name, "Imp Owner")
+            self.assertEqual([a.id for a in place.amenities], ["imp-wifi"])
+            self.assertEqual(db.session.get(PlaceStats, "imp-place-0").review_count, 1)
+            self.assertEqual(db.session.get(PlaceStats, "imp-place-3").review_count, 0)
+            self.assertEqual(Review.query.filter_by(place_id="imp-place-0").one().user_name,
+                             "Imp Guest")
+
+        rejects = [json.loads(line) for line in report.getvalue().splitlines()]
+        self.assertEqual([(r["entity"], r["line"], r["error"]) for r in rejects], [
+            ("users", 4, "Email already registered"),
+            ("places", 7, "Owner not found"),
+            ("places", 8, "Latitude must be between -90 and 90"),
+            ("reviews", 2, "You have already reviewed this place"),
+            ("reviews", 3, "Cannot review your own place"),
+        ])
+        self.assertNotIn("password", rejects[0]["row"])
+
+    def test_process_pool_validation(self):
+        amenities = self._file("pool_amenities.csv",
+                               [{"name": f"Pool amenity {i}"} for i in range(25)]
+                               + [{"name": "x" * 60}])
+        with self.app.app_context():
+            stats = Importer(workers=2, chunk_size=4).import_file("amenities", amenities)
+        self.assertEqual((stats["read"], stats["imported"], stats["rejected"]), (26, 25, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
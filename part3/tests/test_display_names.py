@@ -0,0 +1,133 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.extensions import query_profiler
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.persistence.display_names import backfill_display_names, ensure_display_names
+from config import TestingConfig
+
+
+class TestDisplayNames(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            owner = User(first_name="Nora", last_name="Owner", email="nora@example.com")
+            owner.hash_password("ownerpass")
+            author = User(first_name="Amal", last_name="Author", email="amal@example.com")
+            author.hash_password("authorpass")
+            db.session.add_all([owner, author])
+            db.session.commit()
+
+            place = Place(title="Named Place", price=50.0, latitude=1.0, longitude=1.0,
+                          owner_id=owner.id)
+            db.session.add(place)
+            db.session.commit()
+            db.session.add(Review(text="Lovely", rating=5, user_id=author.id, place_id=place.id))
+            db.session.commit()
+
+            cls.owner_id, cls.author_id, cls.place_id = owner.id, author.id, place.id
+            cls.owner_token = create_access_token(identity=owner.id,
+                                                  additional_claims={"is_admin": False})
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_names_copied_on_insert(self):
+        with self.app.app_context():
+            self.assertEqual(db.session.get(Place, self.place_id).owner_name, "Nora Owner")
+            self.assertEqual(Review.query.one().user_name, "Amal Author")
+
+    def test_review_list_renders_names_without_join(self):
+        with self.app.app_context(), query_profiler.count_queries() as stats:
+            data = self.client.get("/api/v1/reviews/?fields=id,user_name").get_json()
+        self.assertEqual(data[0]["user_name"], "Amal Author")
+        self.assertEqual(stats.count, 1)
+        self.assertNotIn("JOIN", stats.statements[0])
+
+    def test_rename_updates_copies(self):
+        with self.app.app_context():
+            before = db.session.get(Place, self.place_id).updated_at
+
+        response = self.client.put(f"/api/v1/users/{self.owner_id}", json={"last_name": "Renamed"},
+                                   headers={"Authorization": f"Bearer {self.owner_token}"})
+        self.assertEqual(response.status_code, 200)
+
+        data = self.client.get(f"/api/v1/places/{self.place_id}?fields=owner_name").get_json()
+        self.assertEqual(data["owner_name"], "Nora Renamed")
+        with self.app.app_context():
+            self.assertGreater(db.session.get(Place, self.place_id).updated_at, before)
+
+    def test_client_cannot_set_owner_name(self):
+        self.client.put(f"/api/v1/places/{self.place_id}", json={"owner_name": "Someone Else"},
+                        headers={"Authorization": f"Bearer {self.owner_token}"})
+        data = self.client.get(f"/api/v1/places/{self.place_id}?fields=owner_name").get_json()
+        self.assertNotEqual(data["owner_name"], "Someone Else")
+
+    def test_backfill_fills_legacy_rows(self):
+        with self.app.app_context():
+            db.session.execute(Review.__table__.update().values(user_name=None))
+            db.session.commit()
+            backfill_display_names(db.session)
+            db.session.commit()
+            self.assertEqual(Review.query.one().user_name, "Amal Author")
+
+
+class TestLegacySchema(unittest.TestCase):
+    """A database file created before owner_name/user_name existed."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="hbnb-names-")
+        self.path = os.path.join(self.tmp, "legacy.db")
+
+        class LegacyConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{self.path}"
+
+        self.config = LegacyConfig
+        app = create_app(LegacyConfig)
+        with app.app_context():
+            db.create_all()
+            owner = User(first_name="Old", last_name="Owner", email="oldowner@example.com")
+            owner.hash_password("ownerpass")
+            db.session.add(owner)
+            db.session.commit()
+            db.session.add(Place(title="Legacy Place", price=50.0, latitude=1.0,
+                                 longitude=1.0, owner_id=owner.id))
+            db.session.commit()
+            db.session.remove()
+            db.engine.dispose()
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("ALTER TABLE places DROP COLUMN owner_name")
+            conn.execute("ALTER TABLE reviews DROP COLUMN user_name")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_startup_adds_columns_and_reads_fall_back(self):
+        app = create_app(self.config)
+        data = app.test_client().get("/api/v1/places/?fields=title,owner_name").get_json()
+        self.assertEqual(data, [{"title": "Legacy Place", "owner_name": "Old Owner"}])
+
+        with app.app_context():
+            self.assertEqual(ensure_display_names(db.engine), [])
+            self.assertEqual(Place.query.one().owner_name, "Old Owner")
+            db.session.remove()
+            db.engine.dispose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import json
+import unittest
+import uuid
+from datetime import datetime
+from app import create_app, db
+from app.encoders import ENCODERS, get_encoder, stdlib_dumps
+
+
+class TestEncoders(unittest.TestCase):
+    def test_encoders_handle_datetime_and_uuid(self):
+        value = {
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "created_at": datetime(2024, 1, 2, 3, 4, 5, 6),
+            "price": 10.5,
+        }
+        for name, dumps in ENCODERS.items():
+            with self.subTest(encoder=name):
+                self.assertEqual(json.loads(dumps(value)), {
+                    "id": "12345678-1234-5678-1234-567812345678",
+                    "created_at": "2024-01-02T03:04:05.000006",
+                    "price": 10.5,
+                })
+
+    def test_stdlib_fallback_is_always_available(self):
+        self.assertIs(get_encoder("json"), stdlib_dumps)
+
+    def test_unknown_encoder_raises(self):
+        with self.assertRaises(ValueError):
+            get_encoder("does-not-exist")
+
+
+class TestJsonRepresentation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_responses_use_configured_encoder(self):
+        response = self.client.get("/api/v1/places/nonexistent-id")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.content_type, "application/json")
+        self.assertEqual(response.get_data(), b'{"error":"Place not found"}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import threading
+import unittest
+
+from flask_jwt_extended import create_access_token
+
+from app import create_app, db
+from app.models.user import User
+from app.services.events import events
+from app.services.facade import facade
+
+
+class TestEntityEvents(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
+        @cls.app.route("/test-events/amenities", methods=["POST"])
+        def two_amenities():
+            facade.create_amenity({"name": "Event Sauna"})
+            facade.create_amenity({"name": "Event Gym"})
+            return {}, 201
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+            owner = User(first_name="Event", last_name="Owner", email="eventowner@example.com")
+            owner.hash_password("ownerpass")
+            db.session.add(owner)
+            db.session.commit()
+            cls.owner_id = owner.id
+            cls.token = create_access_token(identity=owner.id,
+                                            additional_claims={"is_admin": False})
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def setUp(self):
+        self.batches = []
+        events.reset()
+
+    def tearDown(self):
+        events.unsubscribe(self.batches.append)
+
+    def test_facade_writes_publish_after_commit(self):
+        events.subscribe(self.batches.append, entities=("place",))
+        with self.app.app_context():
+            place = facade.create_place({"title": "Evented", "price": 10.0, "latitude": 1.0,
+                                         "longitude": 1.0, "owner_id": self.owner_id})
+            facade.update_place(place.id, {"price": 12.0})
+            facade.update_place("missing", {"price": 12.0})
+            facade.delete_place(place.id)
+            facade.delete_place(place.id)
+        self.assertEqual([[(e.type, e.entity_id) for e in b] for b in self.batches],
+                         [[("place.created", place.id)], [("place.updated", place.id)],
+                          [("place.deleted", place.id)]])
+        self.assertEqual(self.batches[1][0].fields, ("price",))
+
+    def test_request_events_are_delivered_as_one_batch(self):
+        events.subscribe(self.batches.append)
+        self.assertEqual(self.client.post("/test-events/amenities").status_code, 201)
+        self.assertEqual([[e.type for e in b] for b in self.batches],
+                         [["amenity.created", "amenity.created"]])
+
+    def test_async_subscriber_and_failing_subscriber(self):
+        received = []
+        done = threading.Event()
+
+        async def index_places(batch):
+            received.extend(e.entity_id for e in batch)
+            done.set()
+
+        def broken(batch):
+            raise RuntimeError("subscriber bug")
+
+        events.subscribe(index_places, entities=("place",), name="index_places")
+        events.subscribe(broken, name="broken")
+        try:
+            response = self.client.post("/api/v1/places/",
+                                        json={"title": "Async", "price": 20.0,
+                                              "latitude": 1.0, "longitude": 1.0},
+                                        headers={"Authorization": f"Bearer {self.token}"})
+            self.assertEqual(response.status_code, 201)
+            self.assertTrue(events.join())
+            self.assertTrue(done.is_set())
+            self.assertEqual(received, [response.get_json()["id"]])
+        finally:
+            events.unsubscribe(index_places)
+            events.unsubscribe(broken)
+
+        body = self.client.get("/api/v1/metrics").get_data(as_text=True)
+        self.assertIn('hbnb_events_published_total{type="place.created"} 1', body)
+        self.assertIn('hbnb_event_subscriber_errors_total{subscriber="broken"} 1', body)
+        self.assertIn('hbnb_event_delivery_seconds_count{subscriber="index_places"} 1', body)
+
+    def test_unknown_entity_is_rejected(self):
+        with self.assertRaises(ValueError):
+            events.subscribe(self.batches.append, entities=("booking",))
+
+
+if __name__ == "__main__":
+    unittest.main()
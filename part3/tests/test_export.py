@@ -0,0 +1,84 @@
+import csv
+import gzip
+import io
+import json
+import unittest
+
+from flask_jwt_extended import create_access_token
+
+from app import create_app, db
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+
+
+class TestExportEndpoint(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.app.config["EXPORT_BATCH_SIZE"] = 3
+        cls.client = cls.app.test_client()
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+            admin = User(first_name="Export", last_name="Admin", email="exportadmin@example.com",
+                         is_admin=True)
+            admin.hash_password("adminpass")
+            guest = User(first_name="Export", last_name="Guest", email="exportguest@example.com")
+            guest.hash_password("guestpass")
+            db.session.add_all([admin, guest])
+            db.session.commit()
+            places = [Place(title=f"Export {i}", description="Comma, \"quoted\"", price=10.0 + i,
+                            latitude=1.0, longitude=1.0, owner_id=admin.id) for i in range(7)]
+            db.session.add_all(places)
+            db.session.commit()
+            db.session.add(Review(text="Good", rating=5, user_id=guest.id, place_id=places[0].id))
+            db.session.commit()
+            cls.place_ids = {p.id for p in places}
+            cls.admin_headers = {"Authorization": "Bearer " + create_access_token(
+                identity=admin.id, additional_claims={"is_admin": True})}
+            cls.guest_headers = {"Authorization": "Bearer " + create_access_token(
+                identity=guest.id, additional_claims={"is_admin": False})}
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_ndjson_streams_every_row(self):
+        response = self.client.get("/api/v1/export/places", headers=self.admin_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        self.assertIn('filename="places.ndjson"', response.headers["Content-Disposition"])
+        rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual({r["id"] for r in rows}, self.place_ids)
+        self.assertEqual(rows[0]["owner_name"], "Export Admin")
+
+    def test_csv_has_header_and_escapes_values(self):
+        response = self.client.get("/api/v1/export/places?format=csv", headers=self.admin_headers)
+        self.assertEqual(response.mimetype, "text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+        self.assertEqual(len(rows), 7)
+        self.assertEqual(rows[0]["description"], 'Comma, "quoted"')
+
+    def test_gzip_when_accepted_and_passwords_never_exported(self):
+        response = self.client.get("/api/v1/export/users",
+                                   headers={**self.admin_headers, "Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        lines = gzip.decompress(response.get_data()).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertNotIn("password", json.loads(lines[0]))
+
+    def test_admin_only_and_validation(self):
+        self.assertEqual(self.client.get("/api/v1/export/reviews",
+                                         headers=self.guest_headers).status_code, 403)
+        self.assertEqual(self.client.get("/api/v1/export/bookings",
+                                         headers=self.admin_headers).status_code, 404)
+        self.assertEqual(self.client.get("/api/v1/export/reviews?format=xml",
+                                         headers=self.admin_headers).status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from app import create_app, db
+from app.extensions import query_profiler
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+
+
+class TestSparseFieldsets(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            owner = User(first_name="Fields", last_name="Owner", email="fieldsowner@example.com")
+            owner.hash_password("ownerpass")
+            reviewer = User(first_name="Fields", last_name="Reviewer", email="fieldsreviewer@example.com")
+            reviewer.hash_password("reviewerpass")
+            db.session.add_all([owner, reviewer])
+            db.session.commit()
+
+            place = Place(title="Narrow Place", description="A very long description " * 20,
+                          price=80.0, latitude=10.0, longitude=20.0, owner_id=owner.id)
+            db.session.add(place)
+            db.session.commit()
+
+            review = Review(text="Great", rating=5, user_id=reviewer.id, place_id=place.id)
+            db.session.add(review)
+            db.session.commit()
+
+            cls.place_id = place.id
+            cls.review_id = review.id
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_places_list_returns_only_requested_fields(self):
+        response = self.client.get("/api/v1/places/?fields=title,price")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), [{"title": "Narrow Place", "price": 80.0}])
+
+    def test_narrow_places_list_does_not_select_description(self):
+        with query_profiler.count_queries() as stats:
+            self.client.get("/api/v1/places/?fields=id,title,price").get_data()
+        self.assertEqual(stats.count, 1)
+        self.assertNotIn("places.description", stats.statements[0])
+
+    def test_place_detail_with_fields(self):
+        response = self.client.get(f"/api/v1/places/{self.place_id}?fields=id,owner_id")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.get_json()), {"id", "owner_id"})
+
+    def test_reviews_without_user_name_skip_the_user_join(self):
+        with query_profiler.count_queries() as stats:
+            data = self.client.get("/api/v1/reviews/?fields=id,rating").get_json()
+        self.assertEqual(data, [{"id": self.review_id, "rating": 5}])
+        self.assertNotIn("users", stats.statements[0])
+
+    def test_place_reviews_select_only_requested_fields(self):
+        with query_profiler.count_queries() as stats:
+            response = self.client.get(f"/api/v1/reviews/places/{self.place_id}/reviews?fields=id,rating")
+        self.assertEqual(response.get_json(), [{"id": self.review_id, "rating": 5}])
+        self.assertEqual(stats.count, 2)
+        self.assertNotIn("reviews.text", stats.statements[1])
+        self.assertNotIn("places.description", stats.statements[0])
+
+    def test_users_and_amenities_accept_fields(self):
+        users = self.client.get("/api/v1/users/?fields=email").get_json()
+        self.assertTrue(all(set(u) == {"email"} for u in users))
+        self.assertEqual(self.client.get("/api/v1/amenities/?fields=name").status_code, 200)
+
+    def test_unknown_field_returns_400(self):
+        response = self.client.get("/api/v1/places/?fields=title,password")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {"error": "Unknown field(s): password"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from types import SimpleNamespace
+
+from flask_jwt_extended import create_access_token
+
+from app import create_app, db
+from app.fragment_cache import ENTRY_OVERHEAD, FragmentCache, current_fragment_cache, entity_key
+from app.models.place import Place
+from app.models.user import User
+from app.encoders import stdlib_dumps
+
+
+class TestFragmentCache(unittest.TestCase):
+    def rows(self, n):
+        return [SimpleNamespace(id=f"id-{i}", updated_at=1, name=f"row {i}") for i in range(n)]
+
+    def test_lru_stays_within_budget(self):
+        fragment = stdlib_dumps({"name": "row 0"})
+        cache = FragmentCache(3 * (len(fragment) + 33 + ENTRY_OVERHEAD) + 10)
+        encode = cache.encoder(stdlib_dumps, lambda r: {"name": r.name},
+                               entity_key("row", None))
+        rows = self.rows(4)
+        for row in rows[:3]:
+            encode(row)
+        encode(rows[0])              # hit, now most recent
+        encode(rows[3])              # evicts rows[1]
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 4, 1))
+        self.assertLessEqual(stats["bytes"], cache.max_bytes)
+        encode(rows[1])
+        self.assertEqual(cache.stats()["misses"], 5)
+
+    def test_changed_rows_are_encoded_again(self):
+        cache = FragmentCache(1 << 20)
+        encode = cache.encoder(stdlib_dumps, lambda r: {"name": r.name}, entity_key("row", None))
+        row = self.rows(1)[0]
+        self.assertEqual(encode(row), b'{"name":"row 0"}')
+        row.name, row.updated_at = "renamed", 2
+        self.assertEqual(encode(row), b'{"name":"renamed"}')
+
+    def test_disabled_cache_keeps_nothing(self):
+        cache = FragmentCache(0)
+        encode = cache.encoder(stdlib_dumps, lambda r: {"name": r.name}, entity_key("row", None))
+        encode(self.rows(1)[0])
+        self.assertEqual(cache.stats()["entries"], 0)
+
+
+class TestCachedLists(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+            owner = User(first_name="Cache", last_name="Owner", email="cacheowner@example.com")
+            owner.hash_password("ownerpass")
+            guest = User(first_name="Cache", last_name="Guest", email="cacheguest@example.com")
+            guest.hash_password("guestpass")
+            db.session.add_all([owner, guest])
+            db.session.commit()
+            place = Place(title="Cached loft", price=70.0, latitude=1.0, longitude=1.0,
+                          owner_id=owner.id)
+            db.session.add(place)
+            db.session.commit()
+            cls.place_id, cls.owner_id = place.id, owner.id
+            cls.owner = {"Authorization": "Bearer " + create_access_token(
+                identity=owner.id, additional_claims={"is_admin": False})}
+            cls.guest = {"Authorization": "Bearer " + create_access_token(
+                identity=guest.id, additional_claims={"is_admin": False})}
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def place(self):
+        response = self.client.get("/api/v1/places/")
+        self.assertEqual(response.status_code, 200)
+        return next(p for p in response.get_json() if p["id"] == self.place_id)
+
+    def cache_stats(self):
+        with self.app.app_context():
+            return current_fragment_cache().stats()
+
+    def test_unchanged_rows_come_from_cache(self):
+        first = self.client.get("/api/v1/users/?fields=id,last_name").get_data()
+        hits = self.cache_stats()["hits"]
+        self.assertEqual(self.client.get("/api/v1/users/?fields=id,last_name").get_data(), first)
+        self.assertGreater(self.cache_stats()["hits"], hits)
+        body = self.client.get("/api/v1/metrics").get_data(as_text=True)
+        self.assertIn("hbnb_fragment_cache_hits_total", body)
+
+    def test_writes_show_up(self):
+        self.place()
+        response = self.client.put(f"/api/v1/places/{self.place_id}",
+                                   json={"title": "Cached loft, renovated"}, headers=self.owner)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.place()["title"], "Cached loft, renovated")
+
+        # review statistics live in place_stats, not on the place row
+        response = self.client.post("/api/v1/reviews/", json={
+            "text": "Still fresh", "rating": 4, "place_id": self.place_id}, headers=self.guest)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.place()["review_count"], 1)
+
+        response = self.client.put(f"/api/v1/users/{self.owner_id}",
+                                   json={"last_name": "Renamed"}, headers=self.owner)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.place()["owner_name"], "Cache Renamed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import uuid
+
+from app import create_app, db
+from app.models import ids
+from app.models.amenity import Amenity
+from app.models.user import User
+from app.models.place import Place
+from config import TestingConfig
+
+
+class Uuid7Config(TestingConfig):
+    ID_GENERATOR = "uuid7"
+
+
+class TestIdGenerators(unittest.TestCase):
+    def tearDown(self):
+        ids.use_generator("uuid4")
+
+    def test_uuid7_ids_sort_in_creation_order(self):
+        generated = [ids.uuid7_id() for _ in range(5000)]
+        self.assertEqual(generated, sorted(generated))
+        self.assertEqual(len(set(generated)), len(generated))
+        parsed = uuid.UUID(generated[0])
+        self.assertEqual((parsed.version, str(parsed)), (7, generated[0]))
+        self.assertIsNotNone(ids.uuid7_time(generated[0]))
+        self.assertIsNone(ids.uuid7_time(ids.uuid4_id()))
+
+    def test_unknown_generator_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ids.use_generator("ulid")
+
+    def test_config_selects_generator(self):
+        app = create_app(Uuid7Config)
+        with app.app_context():
+            self.assertEqual(uuid.UUID(Amenity(name="Sauna").id).version, 7)
+        create_app(TestingConfig)
+        self.assertEqual(uuid.UUID(ids.new_id()).version, 4)
+
+
+class TestCursorPagination(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app(Uuid7Config)
+        cls.client = cls.app.test_client()
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+            owner = User(first_name="Cursor", last_name="Owner", email="cursor@example.com")
+            owner.hash_password("ownerpass")
+            db.session.add(owner)
+            db.session.commit()
+            places = [Place(title=f"Cursor {i}", price=10.0 + i, latitude=1.0, longitude=1.0,
+                            owner_id=owner.id) for i in range(5)]
+            db.session.add_all(places)
+            db.session.commit()
+            cls.place_ids = [p.id for p in places]
+
+    @classmethod
+    def tearDownClass(cls):
+        ids.use_generator("uuid4")
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_pages_follow_creation_order(self):
+        self.assertEqual(self.place_ids, sorted(self.place_ids))
+        seen, after = [], ""
+        while after is not None:
+            response = self.client.get(f"/api/v1/places/?fields=id&per_page=2&after={after}")
+            self.assertEqual(response.status_code, 200)
+            seen += [p["id"] for p in response.get_json()]
+            after = response.headers.get("X-Next-Cursor")
+        self.assertEqual(seen, self.place_ids)
+
+    def test_cursor_rejects_offset_paging(self):
+        for query in ("after=&sort=price", "after=&page=2"):
+            response = self.client.get(f"/api/v1/places/?{query}")
+            self.assertEqual(response.status_code, 400)
+        response = self.client.get("/api/v1/reviews/?after=&page=2")
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import uuid
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import create_engine, insert, select, text
+
+from app import create_app, db
+from app.models.amenity import Amenity
+from app.models.place import Place, place_amenity
+from app.models.review import Review
+from app.models.types import use_binary_keys
+from app.models.user import User
+from app.persistence.key_storage import copy_database, detect_storage
+from config import TestingConfig
+
+
+class BinaryKeyConfig(TestingConfig):
+    ID_STORAGE = "binary"
+
+
+class TestBinaryKeys(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app(BinaryKeyConfig)
+        cls.client = cls.app.test_client()
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+            owner = User(first_name="Blob", last_name="Owner", email="blobowner@example.com",
+                         is_admin=True)
+            owner.hash_password("ownerpass")
+            guest = User(first_name="Blob", last_name="Guest", email="blobguest@example.com")
+            guest.hash_password("guestpass")
+            wifi = Amenity(name="Blob WiFi")
+            db.session.add_all([owner, guest, wifi])
+            db.session.commit()
+            place = Place(title="Binary cabin", description="Keys as blobs", price=80.0,
+                          latitude=1.0, longitude=1.0, owner_id=owner.id)
+            place.amenities.append(wifi)
+            db.session.add(place)
+            db.session.commit()
+            db.session.add(Review(text="Compact and quick", rating=5, user_id=guest.id,
+                                  place_id=place.id))
+            db.session.commit()
+            cls.place_id, cls.wifi_id, cls.guest_id = place.id, wifi.id, guest.id
+            cls.admin_headers = {"Authorization": "Bearer " + create_access_token(
+                identity=owner.id, additional_claims={"is_admin": True})}
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_keys_are_stored_as_16_bytes(self):
+        self.assertEqual(str(uuid.UUID(self.place_id)), self.place_id)
+        with self.app.app_context():
+            rows = db.session.execute(text(
+                "SELECT typeof(id), length(id), typeof(owner_id) FROM places")).all()
+            self.assertEqual(rows, [("blob", 16, "blob")])
+            self.assertEqual(detect_storage(db.engine), "binary")
+
+    def test_api_sees_string_ids(self):
+        response = self.client.get(f"/api/v1/places/{self.place_id}")
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body["id"], self.place_id)
+        self.assertEqual(body["owner_name"], "Blob Owner")
+        self.assertEqual(self.client.get("/api/v1/places/not-a-uuid").status_code, 404)
+
+        listed = self.client.get(f"/api/v1/places/?amenities={self.wifi_id}&fields=id")
+        self.assertEqual([p["id"] for p in listed.get_json()], [self.place_id])
+        reviews = self.client.get(f"/api/v1/reviews/places/{self.place_id}/reviews")
+        self.assertEqual([r["user_id"] for r in reviews.get_json()], [self.guest_id])
+        found = self.client.get("/api/v1/reviews/search?q=compact").get_json()
+        self.assertEqual([r["place_id"] for r in found["results"]], [self.place_id])
+
+    def test_export_converts_keys(self):
+        response = self.client.get("/api/v1/export/reviews", headers=self.admin_headers)
+        row = json.loads(response.get_data(as_text=True).splitlines()[0])
+        self.assertEqual((row["place_id"], row["user_id"]), (self.place_id, self.guest_id))
+
+
+class TestCopyDatabase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="hbnb-keys-")
+        self.engines = []
+
+    def tearDown(self):
+        for engine in self.engines:
+            engine.dispose()
+        shutil.rmtree(self.tmp)
+
+    def _engine(self, name, binary):
+        engine = create_engine(f"sqlite:///{os.path.join(self.tmp, name)}")
+        use_binary_keys(engine, binary)
+        self.engines.append(engine)
+        return engine
+
+    def _seed(self, engine, user_id):
+        db.metadata.create_all(engine)
+        place_id, amenity_id = str(uuid.uuid4()), str(uuid.uuid4())
+        with engine.begin() as connection:
+            connection.execute(insert(User.__table__).values(
+                id=user_id, first_name="Copy", last_name="Owner", email="copy@example.com",
+                password="x" * 60, is_admin=False))
+            connection.execute(insert(Amenity.__table__).values(id=amenity_id, name="Copied"))
+            connection.execute(insert(Place.__table__).values(
+                id=place_id, title="Copied place", price=10.0, latitude=0.0, longitude=0.0,
+                owner_id=user_id))
+            connection.execute(insert(place_amenity).values(place_id=place_id,
+                                                            amenity_id=amenity_id))
+        return place_id, amenity_id
+
+    def test_text_to_binary_and_back(self):
+        source = self._engine("text.db", False)
+        pair = self._seed(source, str(uuid.uuid4()))
+        binary = self._engine("binary.db", True)
+        counts = copy_database(source, binary)
+        self.assertEqual((counts["users"], counts["places"], counts["place_amenity"]), (1, 1, 1))
+        self.assertEqual(detect_storage(binary), "binary")
+        with binary.connect() as connection:
+            self.assertEqual(connection.execute(select(place_amenity)).one(), pair)
+            self.assertEqual(connection.exec_driver_sql(
+                "SELECT count(*) FROM places_fts WHERE places_fts MATCH 'copied'").scalar(), 1)
+
+        back = self._engine("back.db", False)
+        copy_database(binary, back)
+        with back.connect() as connection:
+            self.assertEqual(connection.execute(select(place_amenity)).one(), pair)
+        self.assertEqual(detect_storage(back), "text")
+
+    def test_binary_target_rejects_non_uuid_keys(self):
+        source = self._engine("legacy.db", False)
+        self._seed(source, "legacy-user")
+        target = self._engine("strict.db", True)
+        with self.assertRaises(ValueError) as ctx:
+            copy_database(source, target)
+        self.assertIn("legacy-user", str(ctx.exception))
+        with target.connect() as connection:
+            self.assertEqual(connection.exec_driver_sql("SELECT count(*) FROM users").scalar(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from benchmarks import load_test
+
+
+class TestInProcessLoadTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="hbnb-load-report-")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_streamed_lists_beyond_the_pool_size(self):
+        # the SQLite file engine pools 5 + 10 overflow connections
+        report = os.path.join(self.tmp, "summary.json")
+        with contextlib.redirect_stdout(io.StringIO()):
+            load_test.main(["--requests", "60", "--concurrency", "4", "--seed-places", "3",
+                            "--write-ratio", "0", "--json", report])
+        with open(report) as fh:
+            summary = json.load(fh)
+        self.assertEqual(summary["requests"], 60)
+        self.assertEqual(list(summary["per_status"]), ["200"])
+        self.assertGreater(summary["per_route"]["GET /api/v1/places/"]["count"], 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from app import create_app, db
+from app.extensions import metrics
+
+
+class TestMetricsEndpoint(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def setUp(self):
+        metrics.reset()
+
+    def test_metrics_returns_prometheus_text(self):
+        response = self.client.get("/api/v1/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain"))
+        self.assertIn("# TYPE hbnb_http_requests_total counter", response.get_data(as_text=True))
+
+    def test_requests_are_counted_per_namespace_and_method(self):
+        self.client.get("/api/v1/places/")
+        self.client.get("/api/v1/places/nonexistent-id")
+        body = self.client.get("/api/v1/metrics").get_data(as_text=True)
+        self.assertIn('hbnb_http_requests_total{namespace="places",method="GET",status="200"} 1', body)
+        self.assertIn('hbnb_http_requests_total{namespace="places",method="GET",status="404"} 1', body)
+        self.assertIn(
+            'hbnb_http_request_duration_seconds_count{namespace="places",'
+            'resource="places_place_list",method="GET"} 1',
+            body,
+        )
+
+    def test_in_flight_gauge_returns_to_zero(self):
+        self.client.get("/api/v1/amenities/")
+        body = self.client.get("/api/v1/metrics").get_data(as_text=True)
+        self.assertIn('hbnb_http_requests_in_flight{namespace="amenities"} 0', body)
+
+
+if __name__ == "__main__":
+    unittest.main()
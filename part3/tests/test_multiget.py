@@ -0,0 +1,71 @@
+import unittest
+from app import create_app, db
+from app.extensions import query_profiler
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+
+
+class TestMultiGet(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            owner = User(first_name="Multi", last_name="Owner", email="multiowner@example.com")
+            owner.hash_password("ownerpass")
+            db.session.add(owner)
+            db.session.commit()
+
+            places = [Place(title=f"Place {i}", price=10.0 + i, latitude=1.0, longitude=1.0,
+                            owner_id=owner.id) for i in range(3)]
+            amenities = [Amenity(name=f"Amenity {i}") for i in range(2)]
+            db.session.add_all(places + amenities)
+            db.session.commit()
+
+            cls.owner_id = owner.id
+            cls.place_ids = [p.id for p in places]
+            cls.amenity_ids = [a.id for a in amenities]
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_results_follow_request_order_with_misses(self):
+        ids = [self.place_ids[2], "missing-id", self.place_ids[0]]
+        response = self.client.get(f"/api/v1/places/?ids={','.join(ids)}&fields=id,title")
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data["results"][0], {"id": self.place_ids[2], "title": "Place 2"})
+        self.assertIsNone(data["results"][1])
+        self.assertEqual(data["results"][2]["id"], self.place_ids[0])
+        self.assertEqual(data["missing"], ["missing-id"])
+
+    def test_single_query(self):
+        ids = ",".join(self.amenity_ids + [self.amenity_ids[0]])
+        with self.app.app_context(), query_profiler.count_queries() as stats:
+            data = self.client.get(f"/api/v1/amenities/?ids={ids}").get_json()
+        self.assertEqual(stats.count, 1)
+        self.assertEqual(len(data["results"]), 3)
+        self.assertEqual(data["results"][0], data["results"][2])
+
+    def test_other_resources(self):
+        data = self.client.get(f"/api/v1/users/?ids={self.owner_id}").get_json()
+        self.assertEqual(data["results"][0]["first_name"], "Multi")
+        data = self.client.get("/api/v1/reviews/?ids=nope").get_json()
+        self.assertEqual(data, {"results": [None], "missing": ["nope"]})
+
+    def test_invalid_ids(self):
+        self.assertEqual(self.client.get("/api/v1/places/?ids=").status_code, 400)
+        too_many = ",".join(str(i) for i in range(101))
+        self.assertEqual(self.client.get(f"/api/v1/places/?ids={too_many}").status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
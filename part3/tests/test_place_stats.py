@@ -0,0 +1,124 @@
+import unittest
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.extensions import query_profiler
+from app.models.user import User
+from app.models.place import Place
+from app.models.place_stats import PlaceStats
+from app.models.review import Review
+from app.persistence.place_stats import ensure_place_stats, find_drift, rebuild_place_stats
+
+
+class TestPlaceStats(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            owner = User(first_name="Stats", last_name="Owner", email="statsowner@example.com")
+            owner.hash_password("ownerpass")
+            reviewers = []
+            for i in range(3):
+                reviewer = User(first_name="Stats", last_name=f"Reviewer{i}",
+                                email=f"statsreviewer{i}@example.com")
+                reviewer.hash_password("reviewerpass")
+                reviewers.append(reviewer)
+            db.session.add_all([owner, *reviewers])
+            db.session.commit()
+
+            place = Place(title="Stats Place", price=100.0, latitude=1.0, longitude=1.0,
+                          owner_id=owner.id)
+            db.session.add(place)
+            db.session.commit()
+
+            cls.place_id = place.id
+            cls.tokens = [create_access_token(identity=r.id, additional_claims={"is_admin": False})
+                          for r in reviewers]
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def stats(self):
+        with self.app.app_context():
+            return db.session.get(PlaceStats, self.place_id).to_dict()
+
+    def post_review(self, token_index, rating):
+        response = self.client.post("/api/v1/reviews/", json={
+            "text": "Nice", "rating": rating, "place_id": self.place_id
+        }, headers={"Authorization": f"Bearer {self.tokens[token_index]}"})
+        self.assertEqual(response.status_code, 201)
+        return response.get_json()["id"]
+
+    def test_review_writes_update_stats(self):
+        self.assertEqual(self.stats()["review_count"], 0)
+
+        first = self.post_review(0, 5)
+        second = self.post_review(1, 2)
+        stats = self.stats()
+        self.assertEqual(stats["review_count"], 2)
+        self.assertEqual(stats["rating_avg"], 3.5)
+        self.assertEqual(stats["stars"], {"1": 0, "2": 1, "3": 0, "4": 0, "5": 1})
+        self.assertIsNotNone(stats["last_review_at"])
+
+        self.client.put(f"/api/v1/reviews/{second}", json={"rating": 4},
+                        headers={"Authorization": f"Bearer {self.tokens[1]}"})
+        stats = self.stats()
+        self.assertEqual(stats["rating_avg"], 4.5)
+        self.assertEqual(stats["stars"]["2"], 0)
+        self.assertEqual(stats["stars"]["4"], 1)
+
+        self.client.delete(f"/api/v1/reviews/{first}",
+                           headers={"Authorization": f"Bearer {self.tokens[0]}"})
+        stats = self.stats()
+        self.assertEqual(stats["review_count"], 1)
+        self.assertEqual(stats["rating_avg"], 4.0)
+
+        with self.app.app_context():
+            self.assertEqual(find_drift(db.session), [])
+
+    def test_rollback_discards_changes(self):
+        before = self.stats()
+        with self.app.app_context():
+            reviewer = User.query.filter_by(email="statsreviewer2@example.com").one()
+            db.session.add(Review(text="Temp", rating=1, user_id=reviewer.id,
+                                  place_id=self.place_id))
+            db.session.flush()
+            db.session.rollback()
+        self.assertEqual(self.stats(), before)
+
+    def test_rebuild_repairs_drift(self):
+        with self.app.app_context():
+            db.session.execute(PlaceStats.__table__.update().values(review_count=99))
+            db.session.commit()
+            self.assertEqual(find_drift(db.session), [self.place_id])
+
+            rebuild_place_stats(db.session)
+            db.session.commit()
+            self.assertEqual(find_drift(db.session), [])
+
+    def test_ensure_place_stats_creates_missing_table(self):
+        with self.app.app_context():
+            db.session.remove()
+            PlaceStats.__table__.drop(db.engine)
+            self.assertEqual(ensure_place_stats(db.engine), 1)
+            self.assertEqual(find_drift(db.session), [])
+            self.assertEqual(ensure_place_stats(db.engine), 0)
+
+    def test_place_response_does_not_read_reviews(self):
+        with self.app.app_context(), query_profiler.count_queries() as stats:
+            response = self.client.get(f"/api/v1/places/{self.place_id}")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("review_count", response.get_json())
+        self.assertIn("stars", response.get_json())
+        self.assertFalse([s for s in stats.statements if "FROM reviews" in s])
+
+
+if __name__ == "__main__":
+    unittest.main()
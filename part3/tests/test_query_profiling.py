@@ -0,0 +1,111 @@
+import logging
+import unittest
+from app import create_app, db
+from app.extensions import query_profiler
+from app.models.user import User
+from app.models.place import Place
+from app.profiling import normalize_statement
+from tests.query_budget import QueryBudgetMixin
+
+
+class TestQueryProfiling(QueryBudgetMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.app.config["SQLALCHEMY_PROFILE_HEADERS"] = True
+        cls.client = cls.app.test_client()
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            owner = User(first_name="Query", last_name="Owner", email="queries@example.com")
+            owner.hash_password("ownerpass")
+            db.session.add(owner)
+            db.session.commit()
+
+            for i in range(3):
+                db.session.add(Place(
+                    title=f"Place {i}", description="Profiling", price=10.0 + i,
+                    latitude=1.0, longitude=1.0, owner_id=owner.id
+                ))
+            db.session.commit()
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_debug_headers_report_queries(self):
+        response = self.client.get("/api/v1/users/")
+        self.assertEqual(response.status_code, 200)
+        self.assertGreaterEqual(int(response.headers["X-DB-Queries"]), 1)
+        self.assertIn('db;dur=', response.headers["Server-Timing"])
+
+    def test_places_list_within_budget(self):
+        with self.assertMaxQueries(2):
+            with self.client.get("/api/v1/places/") as response:
+                response.get_data()
+
+    def test_budget_exceeded_fails(self):
+        with self.assertRaises(AssertionError):
+            with self.assertMaxQueries(0):
+                with self.client.get("/api/v1/places/") as response:
+                    response.get_data()
+
+    def test_unclosed_streamed_response_fails_the_budget(self):
+        with self.assertRaisesRegex(AssertionError, "not closed"):
+            with self.assertMaxQueries(10):
+                response = self.client.get("/api/v1/places/")
+        # left to the garbage collector, the body would pop its contexts in another test
+        response.close()
+
+    def test_streamed_totals_are_logged_on_close(self):
+        with self.assertLogs("hbnb.sql", level=logging.DEBUG) as logs, \
+                query_profiler.count_queries() as stats:
+            with self.client.get("/api/v1/places/") as response:
+                self.assertTrue(response.is_streamed)
+                before_body = int(response.headers["X-DB-Queries"])
+                response.get_data()
+        line = next(line for line in logs.output if "Streamed GET /api/v1/places/" in line)
+        logged = int(line.split(": ")[-1].split()[0])
+        self.assertEqual(logged, stats.count)
+        self.assertLessEqual(before_body, logged)
+
+    def test_slow_queries_are_logged_without_parameters(self):
+        self.app.config["SQLALCHEMY_SLOW_QUERY_MS"] = 0
+        try:
+            with self.assertLogs("hbnb.sql", level=logging.WARNING) as logs:
+                self.client.get("/api/v1/places/nonexistent-id")
+        finally:
+            self.app.config["SQLALCHEMY_SLOW_QUERY_MS"] = 100.0
+        self.assertTrue(any("Slow query" in line for line in logs.output))
+        self.assertFalse(any("nonexistent-id" in line for line in logs.output))
+
+    def test_normalize_statement_collapses_in_lists(self):
+        self.assertEqual(
+            normalize_statement("SELECT *\n  FROM places WHERE id IN (?, ?, ?)"),
+            "SELECT * FROM places WHERE id IN (...)",
+        )
+
+    def test_count_queries_outside_requests(self):
+        with self.app.app_context():
+            with query_profiler.count_queries() as stats:
+                User.query.all()
+        self.assertEqual(stats.count, 1)
+        self.assertEqual(len(stats.slowest), 1)
+
+    def test_failed_statement_leaves_no_start_time(self):
+        with self.app.app_context(), db.engine.connect() as connection:
+            with self.assertRaises(Exception):
+                connection.exec_driver_sql("SELECT * FROM no_such_table")
+            self.assertFalse(connection.info.get("hbnb_query_start"))
+            with query_profiler.count_queries() as stats:
+                connection.exec_driver_sql("SELECT 1")
+            self.assertEqual(stats.count, 1)
+            self.assertFalse(connection.info.get("hbnb_query_start"))
+
+
+if __name__ == "__main__":
+    unittest.main()
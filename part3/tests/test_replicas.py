@@ -0,0 +1,128 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from sqlalchemy import select
+
+from app import create_app, db
+from app.models.user import User
+from app.persistence.replicas import replica_router
+from app.serving import reset_after_fork
+from config import TestingConfig
+
+
+class TestReadReplicas(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.mkdtemp(prefix="hbnb-replicas-")
+
+        class ReplicaConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(cls.tmp, 'primary.db')}"
+            SQLALCHEMY_REPLICAS = [f"sqlite:///{os.path.join(cls.tmp, f'replica{n}.db')}"
+                                   for n in range(2)]
+            REPLICA_ENDPOINT_MAX_LAG = {"users_user_list": 0}
+
+        cls.app = create_app(ReplicaConfig)
+        cls.client = cls.app.test_client()
+        with cls.app.app_context():
+            db.create_all()
+            replica_router.sync()
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+            for engine in replica_router.engines().values():
+                engine.dispose()
+        shutil.rmtree(cls.tmp)
+
+    def _age_replicas(self, seconds):
+        # a copy's sync time is its file's mtime
+        for path in self.app.extensions["replicas"]["files"].values():
+            then = time.time() - seconds
+            os.utime(path, (then, then))
+
+    def _add_user(self, email):
+        # outside a request: always the primary
+        with self.app.app_context():
+            user = User(first_name="Rep", last_name="Lica", email=email)
+            user.hash_password("password123")
+            db.session.add(user)
+            db.session.commit()
+            return user.id
+
+    def test_get_reads_replica_until_synced(self):
+        user_id = self._add_user("stale@example.com")
+        self.assertEqual(self.client.get(f"/api/v1/users/{user_id}").status_code, 404)
+        with self.app.app_context():
+            replica_router.sync()
+        self.assertEqual(self.client.get(f"/api/v1/users/{user_id}").status_code, 200)
+
+    def test_zero_lag_endpoint_reads_primary(self):
+        user_id = self._add_user("fresh@example.com")
+        data = self.client.get(f"/api/v1/users/?ids={user_id}").get_json()
+        self.assertEqual(data["missing"], [])
+
+    def test_lagging_replicas_are_skipped(self):
+        user_id = self._add_user("lagging@example.com")
+        self._age_replicas(3600)
+        self.assertEqual(self.client.get(f"/api/v1/users/{user_id}").status_code, 200)
+        with self.app.app_context():
+            replica_router.sync()
+
+    def test_forked_worker_sees_later_syncs(self):
+        self._age_replicas(3600)
+        ready_r, ready_w = os.pipe()
+        result_r, result_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                reset_after_fork(self.app)
+                user_id = os.read(ready_r, 64).decode()
+                response = self.app.test_client().get(f"/api/v1/users/{user_id}")
+                os.write(result_w, str(response.status_code).encode())
+                status = 0
+            finally:
+                os._exit(status)
+        os.close(result_w)
+        try:
+            # synced after the fork: only the replica files carry the time over
+            with self.app.app_context():
+                replica_router.sync()
+            user_id = self._add_user("forked@example.com")
+            os.write(ready_w, user_id.encode())
+        finally:
+            # unblocks the child even if the parent side failed
+            os.close(ready_w)
+            status = os.read(result_r, 16)
+            os.waitpid(pid, 0)
+            os.close(ready_r)
+            os.close(result_r)
+        self.assertEqual(status, b"404")
+        with self.app.app_context():
+            replica_router.sync()
+        self.assertEqual(self.client.get(f"/api/v1/users/{user_id}").status_code, 200)
+
+    def test_reads_after_a_flush_use_primary(self):
+        with self.app.test_request_context("/api/v1/users/some-id", method="GET"):
+            query = select(User)
+            primary = db.engine
+            self.assertIsNot(db.session.get_bind(User, clause=query), primary)
+            user = User(first_name="Read", last_name="Own", email="own@example.com")
+            user.hash_password("password123")
+            db.session.add(user)
+            db.session.flush()
+            self.assertIs(db.session.get_bind(User, clause=query), primary)
+            db.session.rollback()
+
+    def test_write_requests_use_primary(self):
+        with self.app.test_request_context("/api/v1/users/", method="POST"):
+            self.assertIs(db.session.get_bind(User, clause=select(User)), db.engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
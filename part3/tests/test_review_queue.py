@@ -0,0 +1,109 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from flask_jwt_extended import create_access_token
+
+from app import create_app, db
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.services.review_queue import review_queue
+from config import TestingConfig
+
+
+class TestReviewWriteBehind(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.mkdtemp(prefix="hbnb-queue-")
+
+        class QueueConfig(TestingConfig):
+            REVIEW_WRITE_BEHIND = True
+            REVIEW_QUEUE_PATH = os.path.join(cls.tmp, "queue.db")
+            REVIEW_QUEUE_WORKER = False  # drained by the tests
+            REVIEW_QUEUE_BATCH = 2
+
+        cls.app = create_app(QueueConfig)
+        cls.client = cls.app.test_client()
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+            owner = User(first_name="Queue", last_name="Owner", email="queueowner@example.com")
+            owner.hash_password("ownerpass")
+            users = [User(first_name="Queue", last_name=f"Writer{i}",
+                          email=f"queuewriter{i}@example.com") for i in range(3)]
+            for user in users:
+                user.hash_password("writerpass")
+            db.session.add_all([owner, *users])
+            db.session.commit()
+            place = Place(title="Queued Place", price=80.0, latitude=1.0, longitude=1.0,
+                          owner_id=owner.id)
+            db.session.add(place)
+            db.session.commit()
+            cls.place_id = place.id
+            cls.tokens = [create_access_token(identity=u.id, additional_claims={"is_admin": False})
+                          for u in users]
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            review_queue.store().close()
+            db.session.remove()
+            db.drop_all()
+        shutil.rmtree(cls.tmp)
+
+    def _post(self, token, text="Queued stay", rating=4):
+        return self.client.post("/api/v1/reviews/",
+                                json={"text": text, "rating": rating, "place_id": self.place_id},
+                                headers={"Authorization": f"Bearer {token}"})
+
+    def _job(self, token, location):
+        return self.client.get(location, headers={"Authorization": f"Bearer {token}"}).get_json()
+
+    def test_accepted_then_visible_after_drain(self):
+        responses = [self._post(token) for token in self.tokens[:2]]
+        self.assertEqual([r.status_code for r in responses], [202, 202])
+        job = responses[0].get_json()
+        self.assertEqual(job["status"], "pending")
+        location = responses[0].headers["Location"]
+        self.assertEqual(self.client.get(f"/api/v1/reviews/{job['review_id']}").status_code, 404)
+
+        # queued but not yet saved still counts as a duplicate
+        self.assertEqual(self._post(self.tokens[0]).status_code, 403)
+
+        with self.app.app_context():
+            self.assertEqual(review_queue.drain(), 2)
+            self.assertEqual(review_queue.drain(), 0)
+
+        job = self._job(self.tokens[0], location)
+        self.assertEqual(job["status"], "done")
+        self.assertIsNotNone(job["visible_at"])
+        self.assertEqual(self.client.get(f"/api/v1/reviews/{job['review_id']}").status_code, 200)
+        self.assertEqual(self._post(self.tokens[0]).status_code, 403)
+
+        other = self.client.get(location, headers={"Authorization": f"Bearer {self.tokens[2]}"})
+        self.assertEqual(other.status_code, 403)
+
+    def test_replayed_job_is_not_inserted_twice(self):
+        response = self._post(self.tokens[2], text="Replayed")
+        review_id = response.get_json()["review_id"]
+        with self.app.app_context():
+            # the review committed but the job was never marked done
+            db.session.add(Review(id=review_id, text="Replayed", rating=4,
+                                  user_id=response.get_json()["user_id"],
+                                  place_id=self.place_id))
+            db.session.commit()
+        with self.app.app_context():
+            review_queue.drain()
+            self.assertEqual(Review.query.filter_by(id=review_id).count(), 1)
+        self.assertEqual(self._job(self.tokens[2], response.headers["Location"])["status"], "done")
+
+    def test_unknown_job_returns_404(self):
+        response = self.client.get("/api/v1/reviews/jobs/nope",
+                                   headers={"Authorization": f"Bearer {self.tokens[0]}"})
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,8 @@ from app import create_app, db
 from app.models.user import User
 from app.models.place import Place
 from app.models.review import Review
+from app.models.ids import new_id
+from app.persistence.review_uniqueness import ensure_review_unique_index
 
 
 class TestReviewEndpoints(unittest.TestCase):
@@ -200,5 +202,51 @@ class TestReviewModel(unittest.TestCase):
             self.assertIsNotNone(review)
 
 
+class TestReviewUniqueIndex(unittest.TestCase):
+    """A reviews table created before ix_reviews_place_user."""
+
+    def setUp(self):
+        self.app = create_app("config.TestingConfig")
+        with self.app.app_context():
+            db.create_all()
+            db.session.execute(db.text("DROP INDEX ix_reviews_place_user"))
+            user = User(first_name="Twice", last_name="Reviewer", email="twice@example.com")
+            user.hash_password("twicepass")
+            db.session.add(user)
+            db.session.commit()
+            place = Place(title="Twice Reviewed", price=10.0, latitude=1.0, longitude=1.0,
+                          owner_id=user.id)
+            db.session.add(place)
+            db.session.commit()
+            self.user_id, self.place_id = user.id, place.id
+            self.review_ids = [new_id(), new_id()]
+            db.session.execute(Review.__table__.insert(), [
+                {"id": i, "text": "Again", "rating": 3, "user_id": user.id, "place_id": place.id}
+                for i in self.review_ids])
+            db.session.commit()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def index_sql(self):
+        return db.session.execute(db.text(
+            "SELECT sql FROM sqlite_master WHERE name = 'ix_reviews_place_user'")).scalar()
+
+    def test_duplicates_are_reported_before_the_index_is_created(self):
+        with self.app.app_context():
+            self.assertEqual(ensure_review_unique_index(db.engine),
+                             [(self.place_id, self.user_id, 2)])
+            self.assertIsNone(self.index_sql())
+
+            db.session.execute(Review.__table__.delete().where(
+                Review.__table__.c.id == self.review_ids[1]))
+            db.session.commit()
+            self.assertEqual(ensure_review_unique_index(db.engine), [])
+            self.assertIn("UNIQUE", self.index_sql())
+            self.assertEqual(ensure_review_unique_index(db.engine), [])
+
+
 if __name__ == "__main__":
     unittest.main()
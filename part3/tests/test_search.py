@@ -0,0 +1,121 @@
+import unittest
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from sqlalchemy import text
+from app.persistence.full_text import FTS_TABLES, ensure_search_index, match_expression
+
+
+class TestFullTextSearch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            owner = User(first_name="Search", last_name="Owner", email="searchowner@example.com")
+            owner.hash_password("ownerpass")
+            reviewer = User(first_name="Search", last_name="Reviewer", email="searchreviewer@example.com")
+            reviewer.hash_password("reviewerpass")
+            db.session.add_all([owner, reviewer])
+            db.session.commit()
+
+            villa = Place(title="Garden Villa", description="A quiet villa with a private pool",
+                          price=300.0, latitude=1.0, longitude=1.0, owner_id=owner.id)
+            flat = Place(title="City Flat", description="Small flat next to the metro station",
+                         price=60.0, latitude=1.0, longitude=1.0, owner_id=owner.id)
+            pool_house = Place(title="Pool House", description="Pool, pool and more pool",
+                               price=200.0, latitude=1.0, longitude=1.0, owner_id=owner.id)
+            db.session.add_all([villa, flat, pool_house])
+            db.session.commit()
+
+            db.session.add(Review(text="The swimming pool was spotless", rating=5,
+                                  user_id=reviewer.id, place_id=villa.id))
+            db.session.commit()
+
+            cls.villa_id = villa.id
+            cls.flat_id = flat.id
+            cls.owner_token = create_access_token(identity=owner.id,
+                                                  additional_claims={"is_admin": False})
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_place_search_is_ranked_with_snippets(self):
+        response = self.client.get("/api/v1/places/search?q=pool")
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data["total"], 2)
+        titles = [r["title"] for r in data["results"]]
+        self.assertEqual(titles[0], "Pool House")
+        self.assertIn("<mark>", data["results"][0]["snippet"])
+
+    def test_place_search_paginates(self):
+        data = self.client.get("/api/v1/places/search?q=pool&per_page=1&page=2").get_json()
+        self.assertEqual(data["total"], 2)
+        self.assertEqual(len(data["results"]), 1)
+        self.assertEqual(data["results"][0]["title"], "Garden Villa")
+
+    def test_review_search(self):
+        data = self.client.get("/api/v1/reviews/search?q=spotless").get_json()
+        self.assertEqual(data["total"], 1)
+        self.assertEqual(data["results"][0]["place_id"], self.villa_id)
+
+    def test_updates_are_reflected_by_triggers(self):
+        self.client.put(f"/api/v1/places/{self.flat_id}", json={"title": "Lighthouse Flat"},
+                        headers={"Authorization": f"Bearer {self.owner_token}"})
+        data = self.client.get("/api/v1/places/search?q=lighthouse").get_json()
+        self.assertEqual([r["id"] for r in data["results"]], [self.flat_id])
+
+    def test_missing_query_returns_400(self):
+        self.assertEqual(self.client.get("/api/v1/places/search").status_code, 400)
+
+    def test_fts_operators_in_input_are_quoted(self):
+        self.assertEqual(match_expression('pool" OR NEAR('), '"pool" "OR" "NEAR"*')
+        response = self.client.get('/api/v1/places/search?q=pool" OR NEAR(')
+        self.assertEqual(response.status_code, 200)
+
+
+class TestEnsureSearchIndex(unittest.TestCase):
+    """A database created before the FTS tables existed."""
+
+    def setUp(self):
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            db.create_all()
+            for fts, _ in FTS_TABLES.values():
+                for suffix in ("ai", "ad", "au"):
+                    db.session.execute(text(f"DROP TRIGGER {fts}_{suffix}"))
+                db.session.execute(text(f"DROP TABLE {fts}"))
+            owner = User(first_name="Old", last_name="Owner", email="oldowner@example.com")
+            owner.hash_password("ownerpass")
+            db.session.add(owner)
+            db.session.commit()
+            db.session.add(Place(title="Harbour Loft", description="Loft over the harbour",
+                                 price=90.0, latitude=1.0, longitude=1.0, owner_id=owner.id))
+            db.session.commit()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_existing_rows_are_indexed(self):
+        with self.app.app_context():
+            ensure_search_index(db.engine)
+            ensure_search_index(db.engine)
+        data = self.client.get("/api/v1/places/search?q=harbour").get_json()
+        self.assertEqual([r["title"] for r in data["results"]], ["Harbour Loft"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import http.client
+import os
+import shutil
+import signal
+import tempfile
+import threading
+import unittest
+
+from app import create_app, db
+from app.serving import (Arbiter, PooledWSGIServer, WORKER_AMENITY_INDEX_MAX_AGE,
+                         configure_workers, quiet_handler)
+from config import Config
+
+
+class TestServing(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.mkdtemp(prefix="hbnb-serve-")
+
+        class ServeConfig(Config):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(cls.tmp, 'hbnb.db')}"
+            SQLALCHEMY_TRACK_MODIFICATIONS = False
+            METRICS_ENABLED = False
+
+        cls.app = create_app(ServeConfig)
+        with cls.app.app_context():
+            db.create_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(cls.tmp)
+
+    @staticmethod
+    def _get(port, path):
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        conn.request("GET", path)
+        response = conn.getresponse()
+        body = response.read()
+        conn.close()
+        return response, body
+
+    def test_pooled_server_closes_connections_without_keep_alive(self):
+        arbiter = Arbiter(self.app, host="127.0.0.1", port=0)
+        sock = arbiter.listen()
+        server = PooledWSGIServer(self.app, sock, threads=2, handler=quiet_handler())
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            response, body = self._get(arbiter.port, "/api/v1/amenities/")
+            self.assertEqual(response.status, 200)
+            self.assertEqual(body.strip(), b"[]")
+            self.assertEqual(response.version, 10)
+        finally:
+            server.shutdown()
+            server.server_close()
+            server.pool.shutdown(wait=True)
+            sock.close()
+
+    def test_several_workers_rebuild_amenity_bitmaps(self):
+        app = self.app
+        self.assertEqual(app.config["AMENITY_INDEX_MAX_AGE"], 0)
+        configure_workers(app, 1)
+        self.assertEqual(app.config["AMENITY_INDEX_MAX_AGE"], 0)
+        try:
+            configure_workers(app, 2)
+            self.assertEqual(app.config["AMENITY_INDEX_MAX_AGE"], WORKER_AMENITY_INDEX_MAX_AGE)
+            app.config["AMENITY_INDEX_MAX_AGE"] = 3.0
+            configure_workers(app, 2)
+            self.assertEqual(app.config["AMENITY_INDEX_MAX_AGE"], 3.0)
+        finally:
+            app.config["AMENITY_INDEX_MAX_AGE"] = 0
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs fork()")
+    def test_forked_workers_serve_and_stop_on_sigterm(self):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                os.close(read_fd)
+                arbiter = Arbiter(self.app, host="127.0.0.1", port=0, workers=2, threads=2)
+                arbiter.listen()
+                os.write(write_fd, str(arbiter.port).encode())
+                code = arbiter.run()
+            finally:
+                os._exit(code)
+        os.close(write_fd)
+        port = int(os.read(read_fd, 16))
+        os.close(read_fd)
+        try:
+            statuses = {self._get(port, "/api/v1/places/")[0].status for _ in range(6)}
+            self.assertEqual(statuses, {200})
+        finally:
+            os.kill(pid, signal.SIGTERM)
+            _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from sqlalchemy.orm import object_session
+
+from app import create_app, db
+from app.models.amenity import Amenity
+from app.models.user import User
+from app.persistence.sharding import shard_index, shards
+from app.services.facade import facade
+from config import TestingConfig
+
+SHARDS = 3
+
+
+class TestShardedRepositories(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.mkdtemp(prefix="hbnb-shards-")
+
+        class ShardConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(cls.tmp, 'primary.db')}"
+            DATABASE_SHARDS = [f"sqlite:///{os.path.join(cls.tmp, f'shard{n}.db')}"
+                               for n in range(SHARDS)]
+
+        cls.app = create_app(ShardConfig)
+        cls.client = cls.app.test_client()
+        with cls.app.app_context():
+            db.create_all()
+            shards.create_all()
+
+            owner = User(first_name="Shard", last_name="Owner", email="shardowner@example.com")
+            owner.hash_password("ownerpass")
+            reviewer = User(first_name="Shard", last_name="Reviewer", email="shardrev@example.com")
+            reviewer.hash_password("reviewerpass")
+            pool = Amenity(name="Shard Pool")
+            db.session.add_all([owner, reviewer, pool])
+            db.session.commit()
+            cls.owner_id, cls.reviewer_id, cls.pool_id = owner.id, reviewer.id, pool.id
+
+            cls.place_ids = []
+            for i in range(12):
+                place = facade.create_place({
+                    "title": f"Sharded {i}", "description": "Sharded place",
+                    "price": 100.0 + i, "latitude": 1.0, "longitude": 1.0,
+                    "owner_id": owner.id,
+                })
+                cls.place_ids.append(place.id)
+            for i, place_id in enumerate(cls.place_ids[:4]):
+                facade.create_review({"text": "Fine", "rating": 1 + i,
+                                      "user_id": reviewer.id, "place_id": place_id})
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+            for engine in shards.engines():
+                engine.dispose()
+        shutil.rmtree(cls.tmp)
+
+    def _rows(self, shard, table):
+        path = os.path.join(self.tmp, f"shard{shard}.db")
+        with sqlite3.connect(path) as conn:
+            return [r[0] for r in conn.execute(f"SELECT id FROM {table}")]
+
+    def test_places_and_reviews_live_on_the_hashed_shard(self):
+        for place_id in self.place_ids:
+            self.assertIn(place_id, self._rows(shard_index(place_id, SHARDS), "places"))
+        with sqlite3.connect(os.path.join(self.tmp, "primary.db")) as conn:
+            self.assertEqual(conn.execute("SELECT count(*) FROM places").fetchone()[0], 0)
+        with self.app.app_context():
+            for review in facade.get_all_reviews():
+                self.assertIn(review.id, self._rows(shard_index(review.place_id, SHARDS),
+                                                    "reviews"))
+
+    def test_place_detail_resolves_owner_and_stats(self):
+        place_id = self.place_ids[3]
+        data = self.client.get(f"/api/v1/places/{place_id}").get_json()
+        self.assertEqual(data["owner_name"], "Shard Owner")
+        self.assertEqual(data["review_count"], 1)
+        self.assertEqual(data["rating_avg"], 4.0)
+
+        reviews = self.client.get(f"/api/v1/reviews/places/{place_id}/reviews?fields=rating")
+        self.assertEqual(reviews.get_json(), [{"rating": 4}])
+
+    def test_merged_sorted_pages(self):
+        response = self.client.get("/api/v1/places/?sort=-price&page=2&per_page=5&fields=id,title")
+        self.assertEqual(response.headers["X-Total-Count"], "12")
+        self.assertEqual([p["title"] for p in response.get_json()],
+                         [f"Sharded {i}" for i in range(6, 1, -1)])
+
+        data = self.client.get("/api/v1/places/?sort=-rating&per_page=2").get_json()
+        self.assertEqual([p["id"] for p in data], [self.place_ids[3], self.place_ids[2]])
+
+    def test_unsorted_pages_cover_every_place(self):
+        seen = []
+        for page in (1, 2, 3):
+            data = self.client.get(f"/api/v1/places/?page={page}&per_page=5&fields=id").get_json()
+            seen.extend(p["id"] for p in data)
+        self.assertEqual(sorted(seen), sorted(self.place_ids))
+
+    def test_multi_get_and_search_span_shards(self):
+        ids = [self.place_ids[0], "missing", self.place_ids[7]]
+        data = self.client.get(f"/api/v1/places/?ids={','.join(ids)}").get_json()
+        self.assertEqual(data["missing"], ["missing"])
+        self.assertEqual(data["results"][2]["id"], self.place_ids[7])
+
+        data = self.client.get("/api/v1/places/search?q=sharded&per_page=50").get_json()
+        self.assertEqual(data["total"], 12)
+
+    def test_amenity_filter_and_updates(self):
+        with self.app.app_context():
+            place = facade.get_place(self.place_ids[5])
+            # the amenity row is on the primary; the link goes to the place's shard
+            place.amenities.append(object_session(place).merge(facade.get_amenity(self.pool_id)))
+            facade.update_place(self.place_ids[5], {"title": "Sharded pool"})
+            matching = list(facade.iter_places_with_amenities([self.pool_id]))
+            self.assertEqual([p.title for p in matching], ["Sharded pool"])
+            facade.update_place(self.place_ids[5], {"title": "Sharded 5"})
+
+
+    def test_user_reviews_and_delete_span_shards(self):
+        with self.app.app_context():
+            guest = facade.create_user({"first_name": "Shard", "last_name": "Guest",
+                                        "email": "shardguest@example.com",
+                                        "password": "guestpass"})
+            own = facade.create_place({
+                "title": "Guest place", "description": "Sharded place", "price": 10.0,
+                "latitude": 1.0, "longitude": 1.0, "owner_id": guest.id,
+            })
+            facade.create_review({"text": "Mine", "rating": 5, "user_id": self.reviewer_id,
+                                  "place_id": own.id})
+            reviewed = self.place_ids[6:10]
+            for place_id in reviewed:
+                facade.create_review({"text": "Visited", "rating": 2,
+                                      "user_id": guest.id, "place_id": place_id})
+            guest_id, own_id = guest.id, own.id
+            self.assertEqual(sorted(r.place_id for r in facade.get_reviews_by_user(guest_id)),
+                             sorted(reviewed))
+
+            self.assertTrue(facade.delete_user(guest_id))
+            self.assertEqual(facade.get_reviews_by_user(guest_id), [])
+            self.assertIsNone(facade.get_place(own_id))
+        self.assertNotIn(own_id, self._rows(shard_index(own_id, SHARDS), "places"))
+        for place_id in reviewed:
+            data = self.client.get(f"/api/v1/places/{place_id}?fields=review_count").get_json()
+            self.assertEqual(data["review_count"], 0)
+    def _name_copies(self, user_id):
+        copies = []
+        for n in range(SHARDS):
+            with sqlite3.connect(os.path.join(self.tmp, f"shard{n}.db")) as conn:
+                copies += conn.execute("SELECT owner_name, updated_at FROM places WHERE owner_id = ?",
+                                       (user_id,)).fetchall()
+                copies += conn.execute("SELECT user_name, updated_at FROM reviews WHERE user_id = ?",
+                                       (user_id,)).fetchall()
+        return copies
+
+    def test_rename_reaches_every_shard(self):
+        with self.app.app_context():
+            host = facade.create_user({"first_name": "Old", "last_name": "Host",
+                                       "email": "shardhost@example.com",
+                                       "password": "hostpass"})
+            places = [facade.create_place({
+                "title": f"Host place {i}", "description": "Sharded place", "price": 10.0,
+                "latitude": 1.0, "longitude": 1.0, "owner_id": host.id,
+            }).id for i in range(6)]
+            for place_id in self.place_ids[:4]:
+                facade.create_review({"text": "Stayed", "rating": 4,
+                                      "user_id": host.id, "place_id": place_id})
+            host_id = host.id
+        try:
+            self.assertGreater(len({shard_index(p, SHARDS) for p in places}), 1)
+            before = self._name_copies(host_id)
+            self.assertEqual({name for name, _ in before}, {"Old Host"})
+            # rendered once, so a stale fragment would be served if updated_at stayed
+            self.client.get("/api/v1/places/")
+
+            with self.app.app_context():
+                facade.update_user(host_id, {"first_name": "New"})
+            after = self._name_copies(host_id)
+            self.assertEqual({name for name, _ in after}, {"New Host"})
+            for (_, old), (_, new) in zip(before, after):
+                self.assertGreater(new, old)
+            listed = self.client.get("/api/v1/places/").get_json()
+            self.assertEqual({p["owner_name"] for p in listed if p["id"] in places}, {"New Host"})
+        finally:
+            with self.app.app_context():
+                facade.delete_user(host_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
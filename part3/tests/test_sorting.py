@@ -0,0 +1,121 @@
+import unittest
+from datetime import datetime, timedelta
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from app.models.place_stats import PlaceStats
+from app.persistence.place_stats import rebuild_place_stats
+
+
+class TestPlaceSorting(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            owner = User(first_name="Sort", last_name="Owner", email="sortowner@example.com")
+            owner.hash_password("ownerpass")
+            reviewers = []
+            for i in range(3):
+                reviewer = User(first_name="Sort", last_name=f"Reviewer{i}",
+                                email=f"sortreviewer{i}@example.com")
+                reviewer.hash_password("reviewerpass")
+                reviewers.append(reviewer)
+            wifi = Amenity(name="WiFi")
+            db.session.add_all([owner, wifi, *reviewers])
+            db.session.commit()
+
+            start = datetime(2025, 1, 1)
+            places = {}
+            for i, (title, price) in enumerate([("Cheap", 40.0), ("Mid", 90.0),
+                                                ("Pricey", 300.0), ("Mid twin", 90.0)]):
+                places[title] = Place(title=title, price=price, latitude=1.0, longitude=1.0,
+                                      owner_id=owner.id, created_at=start + timedelta(days=i))
+            places["Cheap"].amenities.append(wifi)
+            places["Pricey"].amenities.append(wifi)
+            db.session.add_all(places.values())
+            db.session.commit()
+
+            # Pricey: 2 reviews avg 4.5, Mid: 3 reviews avg 3, Cheap: 1 review of 5
+            for place, ratings in (("Pricey", [4, 5]), ("Mid", [3, 3, 3]), ("Cheap", [5])):
+                for reviewer, rating in zip(reviewers, ratings):
+                    db.session.add(Review(text="ok", rating=rating, user_id=reviewer.id,
+                                          place_id=places[place].id))
+            db.session.commit()
+            cls.wifi = wifi.id
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def titles(self, query):
+        response = self.client.get(f"/api/v1/places/?fields=title&{query}")
+        self.assertEqual(response.status_code, 200)
+        return [p["title"] for p in response.get_json()], response.headers.get("X-Total-Count")
+
+    def test_sort_by_price(self):
+        titles = self.titles("sort=price")[0]
+        self.assertEqual(titles[0], "Cheap")
+        self.assertEqual(sorted(titles[1:3]), ["Mid", "Mid twin"])
+        self.assertEqual(titles[3], "Pricey")
+        self.assertEqual(self.titles("sort=-price")[0], titles[::-1])
+
+    def test_sort_by_rating_and_reviews(self):
+        self.assertEqual(self.titles("sort=-rating")[0][:3], ["Cheap", "Pricey", "Mid"])
+        self.assertEqual(self.titles("sort=-reviews")[0][:3], ["Mid", "Pricey", "Cheap"])
+        self.assertEqual(self.titles("sort=rating")[0][0], "Mid twin")
+
+    def test_places_without_stats_row_sort_as_zero(self):
+        with self.app.app_context():
+            twin = Place.query.filter_by(title="Mid twin").one()
+            db.session.execute(PlaceStats.__table__.delete().where(
+                PlaceStats.place_id == twin.id))
+            db.session.commit()
+        self.addCleanup(self.rebuild_stats)
+        titles, total = self.titles("sort=-rating")
+        self.assertEqual(titles, ["Cheap", "Pricey", "Mid", "Mid twin"])
+        self.assertEqual(total, "4")
+        self.assertEqual(self.titles("sort=reviews&per_page=1")[0], ["Mid twin"])
+
+    def rebuild_stats(self):
+        with self.app.app_context():
+            rebuild_place_stats(db.session)
+            db.session.commit()
+
+    def test_sort_by_created_at(self):
+        self.assertEqual(self.titles("sort=-created_at")[0],
+                         ["Mid twin", "Pricey", "Mid", "Cheap"])
+
+    def test_pagination_and_total(self):
+        titles, total = self.titles("sort=created_at&page=2&per_page=3")
+        self.assertEqual(titles, ["Mid twin"])
+        self.assertEqual(total, "4")
+
+    def test_sort_with_amenity_filter(self):
+        titles, total = self.titles(f"sort=-price&amenities={self.wifi}")
+        self.assertEqual(titles, ["Pricey", "Cheap"])
+        self.assertEqual(total, "2")
+
+    def test_unknown_sort_key_returns_400(self):
+        response = self.client.get("/api/v1/places/?sort=title")
+        self.assertEqual(response.status_code, 400)
+
+    def test_price_sort_uses_index(self):
+        with self.app.app_context():
+            plan = db.session.execute(db.text(
+                "EXPLAIN QUERY PLAN SELECT id FROM places ORDER BY price DESC, id DESC LIMIT 20"
+            )).all()
+        self.assertIn("ix_places_price", " ".join(row[-1] for row in plan))
+        self.assertNotIn("TEMP B-TREE", " ".join(row[-1] for row in plan))
+
+
+if __name__ == "__main__":
+    unittest.main()
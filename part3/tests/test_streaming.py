@@ -0,0 +1,157 @@
+import os
+import shutil
+import tempfile
+import unittest
+from sqlalchemy import text
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.ids import new_id
+from app.persistence.sqlalchemy_repository import PlaceRepository
+from tests.query_budget import QueryBudgetMixin
+from config import TestingConfig
+
+
+class TestStreamingLists(QueryBudgetMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app("config.TestingConfig")
+        cls.client = cls.app.test_client()
+
+        with cls.app.app_context():
+            db.drop_all()
+            db.create_all()
+
+            owner = User(first_name="Stream", last_name="Owner", email="streamowner@example.com")
+            owner.hash_password("ownerpass")
+            db.session.add(owner)
+            reviewers = []
+            for i in range(3):
+                reviewer = User(first_name=f"Reviewer{i}", last_name="User",
+                                email=f"streamreviewer{i}@example.com")
+                reviewer.hash_password("reviewerpass")
+                reviewers.append(reviewer)
+            db.session.add_all(reviewers)
+            db.session.commit()
+
+            for i in range(5):
+                place = Place(title=f"Stream Place {i}", description="Streamed",
+                              price=20.0 + i, latitude=1.0, longitude=2.0,
+                              owner_id=owner.id)
+                db.session.add(place)
+                db.session.flush()
+                for reviewer in reviewers:
+                    db.session.add(Review(text="Nice", rating=4,
+                                          user_id=reviewer.id, place_id=place.id))
+            db.session.commit()
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_places_list_is_streamed(self):
+        response = self.client.get("/api/v1/places/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        data = response.get_json()
+        self.assertEqual(len(data), 5)
+        self.assertEqual({p["title"] for p in data}, {f"Stream Place {i}" for i in range(5)})
+
+    def test_reviews_list_is_streamed_with_user_names(self):
+        response = self.client.get("/api/v1/reviews/")
+        self.assertTrue(response.is_streamed)
+        data = response.get_json()
+        self.assertEqual(len(data), 15)
+        self.assertTrue(all(r["user_name"].startswith("Reviewer") for r in data))
+
+    def test_reviews_list_loads_users_in_the_same_query(self):
+        with self.assertMaxQueries(1):
+            with self.client.get("/api/v1/reviews/") as response:
+                response.get_data()
+
+    def test_iter_all_yields_every_row_in_batches(self):
+        with self.app.app_context():
+            rows = list(PlaceRepository().iter_all(batch_size=2))
+        self.assertEqual(len(rows), 5)
+
+
+
+class TestStreamingErrors(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app("config.TestingConfig")
+        self.app.config["PROPAGATE_EXCEPTIONS"] = False
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_query_error_is_a_500(self):
+        with self.app.app_context():
+            db.session.execute(text("DROP TABLE place_stats"))
+            db.session.commit()
+        response = self.client.get("/api/v1/places/")
+        self.assertEqual(response.status_code, 500)
+
+    def test_rows_are_read_after_the_request_context_ends(self):
+        with self.app.app_context():
+            owner = User(first_name="Late", last_name="Reader", email="latereader@example.com")
+            owner.hash_password("ownerpass")
+            db.session.add(owner)
+            db.session.commit()
+            # raw rows: no owner_name copy, so serializing lazy loads the owner
+            db.session.execute(Place.__table__.insert(), [
+                {"id": new_id(), "title": f"Raw {i}", "description": "", "price": 1.0,
+                 "latitude": 1.0, "longitude": 1.0, "owner_id": owner.id}
+                for i in range(501)])  # one more than the iter_all batch
+            db.session.commit()
+
+        data = self.client.get("/api/v1/places/?fields=title,owner_name").get_json()
+        self.assertEqual(len(data), 501)
+        self.assertEqual({p["owner_name"] for p in data}, {"Late Reader"})
+        data = self.client.get("/api/v1/places/?fields=owner_name&page=1&per_page=2").get_json()
+        self.assertEqual(data, [{"owner_name": "Late Reader"}] * 2)
+
+    def test_empty_list(self):
+        response = self.client.get("/api/v1/amenities/")
+        self.assertEqual((response.status_code, response.get_data()), (200, b"[]"))
+
+
+class TestStreamingConnections(unittest.TestCase):
+    """Streamed lists on a pooled file database."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="hbnb-stream-")
+
+        class PooledConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(self.tmp, 'pool.db')}"
+            SQLALCHEMY_ENGINE_OPTIONS = {"pool_size": 2, "max_overflow": 0, "pool_timeout": 1}
+
+        self.app = create_app(PooledConfig)
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp)
+
+    def test_unclosed_responses_return_their_connections(self):
+        # read every body but close none of the responses
+        for _ in range(10):
+            response = self.client.get("/api/v1/places/")
+            self.assertEqual((response.status_code, response.get_data()), (200, b"[]"))
+        with self.app.app_context():
+            self.assertEqual(db.engine.pool.checkedout(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
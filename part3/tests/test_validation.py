@@ -0,0 +1,80 @@
+import unittest
+
+from flask_jwt_extended import create_access_token
+from jsonschema.validators import validator_for
+
+from app import create_app, db
+from app.api.v1.amenities import amenity_model
+from app.api.v1.auth import login_model
+from app.api.v1.places import place_model
+from app.api.v1.reviews import review_model
+from app.api.v1.users import user_model
+from app.api.v1.validation import compile_model
+from app.services.bulk_import import validate_chunk
+
+PAYLOADS = [
+    {},
+    [],
+    "text",
+    None,
+    {"title": 5, "price": "cheap", "latitude": True, "longitude": None},
+    {"title": "Ok", "price": 10, "latitude": 1.5, "longitude": -2},
+    {"text": "Fine", "rating": 4.0, "place_id": "p"},
+    {"text": "Fine", "rating": 4.5, "place_id": 7},
+    {"first_name": "A", "last_name": ["B"], "email": "a@b.c", "password": {"x": 1}},
+    {"name": "Pool", "description": 3, "extra": "ignored"},
+    {"email": "a@b.c"},
+]
+
+
+def jsonschema_errors(model, data):
+    """What flask-restx reports for ``data`` (Model.validate without the abort)."""
+    schema = model.__schema__
+    validator = validator_for(schema)(schema)
+    return dict(model.format_error(e) for e in validator.iter_errors(data))
+
+
+class TestCompiledValidators(unittest.TestCase):
+    def test_same_errors_as_jsonschema(self):
+        for model in (place_model, review_model, user_model, amenity_model, login_model):
+            validator = compile_model(model)
+            self.assertIsNotNone(validator, model.name)
+            self.assertIs(compile_model(model), validator)
+            for data in PAYLOADS:
+                with self.subTest(model=model.name, data=data):
+                    self.assertEqual(validator.errors(data), jsonschema_errors(model, data))
+
+    def test_api_rejects_with_validation_body(self):
+        app = create_app("config.TestingConfig")
+        with app.app_context():
+            db.create_all()
+            token = create_access_token(identity="validator", additional_claims={"is_admin": True})
+        response = app.test_client().post(
+            "/api/v1/places/", json={"title": 5, "latitude": 1.0, "longitude": 1.0},
+            headers={"Authorization": f"Bearer {token}"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {
+            "message": "Input payload validation failed",
+            "errors": {"price": "'price' is a required property",
+                       "title": "5 is not of type 'string'"},
+        })
+        response = app.test_client().post("/api/v1/auth/login", json={"email": "x@y.z"})
+        self.assertEqual(response.get_json()["errors"],
+                         {"password": "'password' is a required property"})
+        with app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_bulk_rows_get_api_messages(self):
+        _, rejects = validate_chunk("places", [
+            (2, {"title": 5, "price": 10, "latitude": 0, "longitude": 0, "owner_id": "o"}),
+            (3, {"price": 10, "latitude": 0, "longitude": 0, "owner_id": "o"}),
+        ])
+        self.assertEqual(sorted((line, error) for line, _, error in rejects), [
+            (2, "5 is not of type 'string'"),
+            (3, "'title' is a required property"),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
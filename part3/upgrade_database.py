@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+HBnB - Bring a database created by an earlier version up to date
+
+Upgrades the primary database and, when DATABASE_SHARD_URLS is set,
+every shard; read replicas pick the changes up on their next sync. Every
+step checks what is already there, so the script can be run again at any
+time. It exits with 1 when duplicate reviews keep the one-review-per-
+user-and-place index from being created.
+
+Usage:
+    python upgrade_database.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app
+from config import DevelopmentConfig
+from app.persistence import primary_engines
+from app.persistence.display_names import ensure_display_names
+from app.persistence.full_text import ensure_search_index
+from app.persistence.place_stats import ensure_place_stats
+from app.persistence.review_uniqueness import ensure_review_unique_index
+
+
+def main():
+    status = 0
+    app = create_app(DevelopmentConfig)
+    with app.app_context():
+        for engine in primary_engines(app):
+            print(f"Upgrading {engine.url.render_as_string(hide_password=True)}")
+            ensure_search_index(engine)
+            print("  search index: created and rebuilt")
+            rows = ensure_place_stats(engine)
+            print(f"  place_stats: {rows} place(s) recomputed")
+            for column in ensure_display_names(engine):
+                print(f"  added column {column}")
+            print("  display names: backfilled")
+            duplicates = ensure_review_unique_index(engine)
+            if duplicates:
+                status = 1
+                print(f"  {len(duplicates)} user/place pair(s) with several reviews; "
+                      "keep one review each, then run this script again:")
+                for place_id, user_id, count in duplicates[:20]:
+                    print(f"    - place {place_id}, user {user_id}: {count} reviews")
+            else:
+                print("  unique index on reviews (place_id, user_id): present")
+    return status
+
+
+if __name__ == "__main__":
+    exit(main())
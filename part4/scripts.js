@@ -97,7 +97,7 @@ async function fetchPlaces(token) {
             headers['Authorization'] = `Bearer ${token}`;
         }
 
-        const response = await fetch(`${API_URL}/places/`, {
+        const response = await fetch(`${API_URL}/places/?fields=id,title,price`, {
             method: 'GET',
             headers: headers
         });